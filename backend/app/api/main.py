@@ -1,7 +1,16 @@
 from fastapi import APIRouter
-from .routes import home
+from .routes import fraud, home, metrics, transactions, users
+from .routes.auth import activate_account, bulk_register, otp, register
 
 api_router = APIRouter()
 
 
-api_router.include_router(home.router, prefix="/home", tags=["home"])
\ No newline at end of file
+api_router.include_router(home.router, prefix="/home", tags=["home"])
+api_router.include_router(register.register_router)
+api_router.include_router(activate_account.activate_router)
+api_router.include_router(otp.otp_router)
+api_router.include_router(bulk_register.bulk_register_router)
+api_router.include_router(metrics.router, tags=["metrics"])
+api_router.include_router(users.users_router)
+api_router.include_router(fraud.fraud_router)
+api_router.include_router(transactions.transactions_router)
\ No newline at end of file
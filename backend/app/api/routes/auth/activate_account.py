@@ -3,10 +3,11 @@ from fastapi.params import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import status
 
-from backend.app.auth.utils import create_activation_token
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.core.rate_limit import auth_rate_limit
 from backend.app.core.services.activate_email import send_activation_email
+from backend.app.database.connection_guard import external_io
 from backend.app.database.session import get_session
 from backend.app.schema.otp_question import AccountStatusSchema
 from backend.app.schema.user import UserReadSchema, EmailRequestSchema
@@ -15,12 +16,14 @@ from backend.app.api.services.auth_service import AuthService
 logger = get_logger()
 auth_service = AuthService()
 
-activate_router = APIRouter(prefix="/auth", tags=["activate_account"])
+activate_router = APIRouter(
+    prefix="/auth", tags=["activate_account"], dependencies=[Depends(auth_rate_limit)]
+)
 
 @activate_router.post("/activate/{token}", response_model=UserReadSchema, status_code=status.HTTP_200_OK)
 async def activate_user(token: str, session: AsyncSession = Depends(get_session)):
     try:
-        user = await auth_service.activate_user_account(session, token)
+        user = await auth_service.activate_user_account(token, session)
         return {"message": "User activated successfully", "email": user.email}
 
     except ValueError as e:
@@ -37,7 +40,18 @@ async def activate_user(token: str, session: AsyncSession = Depends(get_session)
                     "email_required": True,
                 }
             )
-        elif error_msg == "Invalid activation token":
+        elif error_msg == "Activation token has already been used.":
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail={
+                    "status": "error",
+                    "message": "Activation token has already been used or was replaced by a newer one.",
+                    "action": "Please use the latest activation email or request a new one.",
+                    "action_url": f"{settings.API_BASE_URL}/auth/resend_activation_link",
+                    "email_required": True,
+                }
+            )
+        elif error_msg == "Invalid activation token.":
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -91,8 +105,10 @@ async def resend_activation_link(email_data: EmailRequestSchema, session: AsyncS
                 },
             )
 
-        activation_token = create_activation_token(user.id)
-        await send_activation_email(user.email, activation_token)
+        # Issuing a new token revokes any earlier activation links for this user
+        async with external_io(session, "activation_email"):
+            activation_token = await auth_service.issue_activation_token(user)
+            await send_activation_email(user.email, activation_token)
 
         return {
             "message": "New activation link has been sent. Please check you email inbox.",
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.params import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import status
+
+from backend.app.api.services.bulk_registration import bulk_registration_service, iter_ndjson_lines
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.security import require_backoffice_key
+from backend.app.database.session import get_session
+
+logger = get_logger()
+
+bulk_register_router = APIRouter(prefix="/auth", tags=["bulk_register"])
+
+
+@bulk_register_router.post(
+    "/register/bulk", status_code=status.HTTP_200_OK, dependencies=[Depends(require_backoffice_key)]
+)
+async def bulk_register(request: Request, session: AsyncSession = Depends(get_session)):
+    """
+    Register users from an NDJSON body (one UserCreateSchema object per line).
+    The body is streamed, so the upload is never held in memory as a whole.
+    """
+    if not settings.BULK_REGISTRATION_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    try:
+        report = await bulk_registration_service.register_rows(
+            iter_ndjson_lines(request.stream()), session
+        )
+        return report.as_dict()
+
+    except HTTPException as http_exception:
+        raise http_exception
+
+    except Exception as e:
+        logger.error(f"Bulk registration failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Bulk registration failed.",
+                "action": "Chunks committed before the failure are kept; retry the remaining rows.",
+            },
+        )
@@ -0,0 +1,44 @@
+import jwt
+from fastapi import APIRouter, HTTPException
+from fastapi import status
+
+from backend.app.auth.utils import decode_delivery_token
+from backend.app.core.emails.delivery import get_email_delivery_status
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+otp_router = APIRouter(prefix="/auth", tags=["otp"])
+
+
+@otp_router.get("/otp/delivery/{delivery_token}", status_code=status.HTTP_200_OK)
+async def otp_delivery_status(delivery_token: str):
+    """
+    Poll the delivery state of a login OTP email. Only the signed token returned
+    when the OTP was issued is accepted, until the OTP itself expires.
+    """
+    try:
+        delivery_id = decode_delivery_token(delivery_token)
+    except jwt.InvalidTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "status": "error",
+                "message": "OTP delivery not found.",
+                "action": "Request a new OTP.",
+            },
+        )
+
+    try:
+        return await get_email_delivery_status(delivery_id)
+
+    except Exception as e:
+        logger.error(f"Failed to look up OTP delivery {delivery_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "error",
+                "message": "OTP delivery status is unavailable.",
+                "action": "Please try again later.",
+            },
+        )
@@ -0,0 +1,173 @@
+import time
+import uuid
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, status
+from fastapi.params import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.api.services.auth_service import auth_service
+from backend.app.core.logging import get_logger
+from backend.app.core.security import require_backoffice_key
+from backend.app.database.session import get_session
+from backend.app.fraud.engine import FRAUD_MODEL_NAME, fraud_engine
+from backend.app.fraud.entity_graph import ClusterInfo, entity_graph
+from backend.app.fraud.feature_store import online_feature_store
+from backend.app.fraud.registry import model_registry
+from backend.app.schema.fraud import (
+    EntityClusterSchema,
+    EntityGraphUserSchema,
+    FraudScoreRequestSchema,
+    FraudScoreResponseSchema,
+    LinkedUserSchema,
+    TransactionLinkSchema,
+)
+
+logger = get_logger()
+
+fraud_router = APIRouter(
+    prefix="/fraud", tags=["fraud"], dependencies=[Depends(require_backoffice_key)]
+)
+
+
+@fraud_router.post("/score", response_model=FraudScoreResponseSchema, status_code=status.HTTP_200_OK)
+async def score_transaction(transaction: FraudScoreRequestSchema, background_tasks: BackgroundTasks):
+    """
+    Risk score and approve/review/decline decision for one transaction. Velocity
+    comes from the shared online aggregates, read in one Redis round trip, and
+    the rest from the sender's in-process history; if Redis is unavailable the
+    in-process velocity is used instead. Scoring itself runs inline: it takes
+    microseconds and a threadpool hop would cost more. Recorded transactions
+    are added to the shared aggregates after the response has been sent.
+    """
+    at = transaction.created_at.timestamp() if transaction.created_at else time.time()
+    result = fraud_engine.score(
+        transaction.sender_id,
+        float(transaction.amount),
+        receiver_id=transaction.receiver_id,
+        occurred_at=transaction.created_at,
+        record=transaction.record,
+        shared_features=await _read_shared_features(transaction.sender_id, at),
+    )
+    if transaction.record:
+        background_tasks.add_task(
+            _record_shared_features, transaction.sender_id, float(transaction.amount), at
+        )
+    return result
+
+
+async def _read_shared_features(sender_id: uuid.UUID, at: float) -> dict[str, float] | None:
+    try:
+        return await online_feature_store.features(sender_id, now=at)
+    except Exception as e:
+        logger.warning(f"Could not read online features for {sender_id}, using local velocity: {e}")
+        return None
+
+
+async def _record_shared_features(sender_id: uuid.UUID, amount: float, at: float) -> None:
+    try:
+        await online_feature_store.record(sender_id, amount, at)
+    except Exception as e:
+        logger.warning(f"Could not record online features for {sender_id}: {e}")
+
+
+@fraud_router.get("/features/{account_id}", status_code=status.HTTP_200_OK)
+async def account_features(account_id: uuid.UUID):
+    """Shared 1m/1h/24h transaction count and amount for one account"""
+    try:
+        return await online_feature_store.features(account_id)
+    except Exception as e:
+        logger.error(f"Online feature store read failed for {account_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "error",
+                "message": "Feature store unavailable",
+                "action": "Please try again later",
+            },
+        )
+
+
+@fraud_router.get("/status", status_code=status.HTTP_200_OK)
+async def engine_status():
+    return fraud_engine.status()
+
+
+@fraud_router.get("/model", status_code=status.HTTP_200_OK)
+async def model_status():
+    """Model version this worker serves, its map time and resident memory"""
+    return {
+        "serving": fraud_engine.model.version,
+        **model_registry.status(FRAUD_MODEL_NAME),
+    }
+
+
+def _cluster_schema(cluster: ClusterInfo | None) -> EntityClusterSchema | None:
+    if cluster is None:
+        return None
+    return EntityClusterSchema(
+        user_id=cluster.user_id, cluster_id=cluster.cluster_id, cluster_size=cluster.size
+    )
+
+
+@fraud_router.get(
+    "/graph/users/{user_id}", response_model=EntityGraphUserSchema, status_code=status.HTTP_200_OK
+)
+async def user_cluster(
+    user_id: uuid.UUID,
+    limit: int = Query(default=20, ge=1, le=200),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    The user's linked-account cluster and the users it shares attributes with.
+    A user this worker has not seen yet (registered on another worker since the
+    last snapshot) is read from the database and added first.
+    """
+    cluster = entity_graph.cluster(user_id)
+    if cluster is None:
+        # The default lookup returns active and inactive users alike
+        user = await auth_service.get_user_by_id(user_id, session)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "status": "error",
+                    "message": "User not found",
+                    "action": "Check the user id",
+                },
+            )
+        auth_service.link_user(user)
+        cluster = entity_graph.cluster(user_id)
+        if cluster is None:
+            # link_user logs and swallows graph errors so registration never fails on them
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "status": "error",
+                    "message": "Entity graph unavailable",
+                    "action": "Please try again later",
+                },
+            )
+
+    return EntityGraphUserSchema(
+        **_cluster_schema(cluster).model_dump(),
+        linked_users=[
+            LinkedUserSchema(user_id=linked_id, shared=shared)
+            for linked_id, shared in entity_graph.linked_users(user_id, limit).items()
+        ],
+    )
+
+
+@fraud_router.get("/graph/link", response_model=TransactionLinkSchema, status_code=status.HTTP_200_OK)
+async def transaction_link(sender_id: uuid.UUID, receiver_id: uuid.UUID):
+    """Clusters of both parties of a transaction; money moving inside one cluster is a ring signal"""
+    sender, receiver = entity_graph.cluster(sender_id), entity_graph.cluster(receiver_id)
+    return TransactionLinkSchema(
+        sender=_cluster_schema(sender),
+        receiver=_cluster_schema(receiver),
+        same_cluster=sender is not None and receiver is not None and sender.cluster_id == receiver.cluster_id,
+    )
+
+
+@fraud_router.get("/graph/status", status_code=status.HTTP_200_OK)
+async def graph_status():
+    return entity_graph.summary()
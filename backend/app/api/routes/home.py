@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from backend.app.database.session import get_db, check_database_connection
+from backend.app.database.session import get_db, check_database_connection, database_health_check
 from backend.app.core.logging import get_logger
+from backend.app.database.warmup import readiness
 
 logger = get_logger()
 router = APIRouter()
@@ -35,4 +36,19 @@ async def health_check():
         "status": "healthy" if db_healthy else "unhealthy",
         "database": "connected" if db_healthy else "disconnected",
         "service": "Bank Fraud Detection API"
-    }
\ No newline at end of file
+    }
+
+@router.get("/db-health")
+async def db_health():
+    """Database health with connection pool telemetry"""
+    return await database_health_check()
+
+@router.get("/ready")
+async def ready():
+    """Readiness probe: 503 until the connection pools are warmed up"""
+    if not readiness.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"status": "not_ready", **readiness.details},
+        )
+    return {"status": "ready", **readiness.details}
\ No newline at end of file
@@ -0,0 +1,57 @@
+import uuid
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.params import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import status
+
+from backend.app.api.services.bulk_registration import iter_ndjson_lines
+from backend.app.api.services.listing_service import MAX_PAGE_SIZE
+from backend.app.api.services.transaction_service import transaction_service
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.security import require_backoffice_key
+from backend.app.database.session import get_session
+from backend.app.schema.transaction import TransactionReadSchema
+
+logger = get_logger()
+
+transactions_router = APIRouter(
+    prefix="/transactions", tags=["transactions"], dependencies=[Depends(require_backoffice_key)]
+)
+
+
+@transactions_router.post("/ingest", status_code=status.HTTP_200_OK)
+async def ingest_transactions(request: Request, session: AsyncSession = Depends(get_session)):
+    """
+    Ingest transactions from an NDJSON body (one TransactionCreateSchema object
+    per line). The body is streamed and COPYed in batches of
+    TRANSACTION_INGEST_BATCH_SIZE, each committed on its own.
+    """
+    try:
+        report = await transaction_service.ingest(iter_ndjson_lines(request.stream()), session)
+        return {**report.summary(), "errors": report.errors}
+
+    except Exception as e:
+        logger.error(f"Transaction ingestion failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Transaction ingestion failed.",
+                "action": "Batches committed before the failure are kept; retry the remaining rows.",
+            },
+        )
+
+
+@transactions_router.get(
+    "/recent/{user_id}", response_model=list[TransactionReadSchema], status_code=status.HTTP_200_OK
+)
+async def recent_transactions(
+    user_id: uuid.UUID,
+    days: int = Query(default=settings.TRANSACTION_RECENT_DAYS, ge=1, le=366),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_session),
+):
+    """A user's sent and received transactions from the last `days`, newest first"""
+    return await transaction_service.get_recent_transactions(user_id, session, days=days, limit=limit)
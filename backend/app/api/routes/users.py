@@ -0,0 +1,107 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from fastapi.params import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import status
+
+from backend.app.api.services.export_service import MEDIA_TYPES, ExportFormat, export_service
+from backend.app.api.services.listing_service import MAX_PAGE_SIZE, listing_service
+from backend.app.core.logging import get_logger
+from backend.app.core.pagination import InvalidCursorError
+from backend.app.core.security import require_backoffice_key
+from backend.app.database.session import get_session
+from backend.app.schema.otp_question import AccountStatusSchema, RoleChoicesSchema
+from backend.app.schema.pagination import TransactionPageSchema, UserPageSchema
+
+logger = get_logger()
+
+users_router = APIRouter(
+    prefix="/users", tags=["users"], dependencies=[Depends(require_backoffice_key)]
+)
+
+
+def _invalid_cursor(error: InvalidCursorError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "status": "error",
+            "message": f"Invalid cursor: {error}",
+            "action": "Restart from the first page without a cursor",
+        },
+    )
+
+
+@users_router.get("", response_model=UserPageSchema, status_code=status.HTTP_200_OK)
+async def list_users(
+    account_status: Optional[AccountStatusSchema] = None,
+    role: Optional[RoleChoicesSchema] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_session),
+):
+    """Users newest first; pass next_cursor back as cursor for the following page"""
+    try:
+        users, next_cursor = await listing_service.list_users(
+            session,
+            account_status=account_status,
+            role=role,
+            created_after=created_after,
+            created_before=created_before,
+            cursor=cursor,
+            limit=limit,
+        )
+        return {"items": users, "next_cursor": next_cursor}
+
+    except InvalidCursorError as e:
+        raise _invalid_cursor(e)
+
+
+@users_router.get("/export", status_code=status.HTTP_200_OK)
+async def export_users(
+    format: ExportFormat = "csv",
+    account_status: Optional[AccountStatusSchema] = None,
+    role: Optional[RoleChoicesSchema] = None,
+):
+    """
+    Stream every matching user as CSV or NDJSON, oldest first, without
+    buffering the export in memory. e.g. ?account_status=locked for locked accounts
+    """
+    filename = f"users-{account_status.value if account_status else 'all'}.{format}"
+    return StreamingResponse(
+        export_service.export_users(format, account_status, role),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@users_router.get(
+    "/{user_id}/transactions", response_model=TransactionPageSchema, status_code=status.HTTP_200_OK
+)
+async def list_user_transactions(
+    user_id: uuid.UUID,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_session),
+):
+    """A user's sent and received transactions, newest first"""
+    try:
+        transactions, next_cursor = await listing_service.list_user_transactions(
+            user_id,
+            session,
+            created_after=created_after,
+            created_before=created_before,
+            cursor=cursor,
+            limit=limit,
+        )
+        return {"items": transactions, "next_cursor": next_cursor}
+
+    except InvalidCursorError as e:
+        raise _invalid_cursor(e)
@@ -1,55 +1,215 @@
-import asyncio
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
+from typing import Sequence
 
 import jwt
 from fastapi import status
 from fastapi import HTTPException
 from pydantic import EmailStr
+from sqlalchemy import case, func, insert, literal, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
 
-from backend.app.auth.utils import verify_password, generate_otp, generate_username, hash_password, \
-    create_activation_token
+from backend.app.auth.hashing import PasswordHashingExecutor, password_hasher
+from backend.app.auth.utils import generate_otp, generate_username, create_activation_token, create_delivery_token
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.core.otp_store import OTPStore, OTPVerificationResult, otp_store
 from backend.app.core.services.activate_email import send_activation_email
 from backend.app.core.services.otp_login import send_login_otp_email
+from backend.app.core.token_registry import ActivationTokenRegistry, activation_token_registry
+from backend.app.core.user_cache import LOOKUP_FIELDS, UNCACHED_FIELDS, UserCache, user_cache
+from backend.app.database.connection_guard import external_io
+from backend.app.database.replicas import REPLICA_READ, SERVED_BY_REPLICA_KEY
+from backend.app.fraud.entity_graph import EntityGraphService, entity_graph, user_attributes
 from backend.app.models import User
 from backend.app.schema.otp_question import AccountStatusSchema
 from backend.app.schema.user import UserCreateSchema
 
 logger = get_logger()
 
+# Unique constraints on the user table (see the add_user_table migration) and the
+# conflict each one means for the client.
+USER_UNIQUE_CONSTRAINTS = {
+    "ix_user_email": "Email already registered",
+    "user_id_no_key": "User ID No. already registered",
+    "user_username_key": "Username already taken",
+}
+USERNAME_GENERATION_ATTEMPTS = 3
+
+# session.info key holding the pending user changes of an open unit of work
+UNIT_OF_WORK_KEY = "auth_unit_of_work"
+
+
+def _unique_violation_constraint(error: IntegrityError) -> str | None:
+    """Return the name of the unique constraint behind an IntegrityError, if any."""
+    orig = error.orig
+    # asyncpg errors are wrapped by the SQLAlchemy adapter, psycopg exposes diag
+    driver_error = getattr(orig, "__cause__", None) or orig
+    constraint = getattr(driver_error, "constraint_name", None)
+    if constraint is None and getattr(orig, "diag", None) is not None:
+        constraint = orig.diag.constraint_name
+    return constraint
+
 
 class AuthService:
 
-    def __init__(self,db):
-              self.db = db
+    def __init__(
+            self,
+            hasher: PasswordHashingExecutor = password_hasher,
+            cache: UserCache = user_cache,
+            otp_store: OTPStore = otp_store,
+            token_registry: ActivationTokenRegistry = activation_token_registry,
+            graph: EntityGraphService = entity_graph,
+    ):
+        self.hasher = hasher
+        self.user_cache = cache
+        self.otp_store = otp_store
+        self.token_registry = token_registry
+        self.entity_graph = graph
+
+    async def _get_user_by(
+            self,
+            field: str,
+            value,
+            session: AsyncSession,
+            include_inactive: bool = False,
+    ) -> User | None:
+        cached = await self.user_cache.get(field, value)
+        if cached is not None:
+            user = await self._attach_cached_user(cached, session)
+        else:
+            # Write flows read the primary; everything else may use a replica
+            replica = UNIT_OF_WORK_KEY not in session.info
+            result = await session.execute(self._lookup_statement(field, value, replica))
+            user = result.scalars().first()
+            if user:
+                await self.user_cache.set(
+                    user.model_dump(mode="json"),
+                    from_replica=bool(session.info.get(SERVED_BY_REPLICA_KEY)) if replica else False,
+                )
+
+        # The cached row is shared by both lookup modes, so the inactive filter is applied here
+        if user and include_inactive and user.is_active:
+            return None
+        return user
+
+    @staticmethod
+    def _lookup_statement(field: str, value, replica: bool = True):
+        # Served by a read replica unless replica=False or this session has already written
+        stmt = select(User).where(getattr(User, field) == value)
+        return stmt.execution_options(**REPLICA_READ) if replica else stmt
+
+    def warmup_statements(self) -> list:
+        """The user lookups every auth flow starts with, with values that match no row"""
+        return [
+            self._lookup_statement("email", "warmup@invalid.local"),
+            self._lookup_statement("id_no", -1),
+            self._lookup_statement("id", uuid.UUID(int=0)),
+        ]
+
+    @staticmethod
+    async def _attach_cached_user(data: dict, session: AsyncSession) -> User:
+        # Rebuild the row as a clean detached instance so merge() can attach it
+        # to the session without a SELECT and later writes are tracked normally.
+        # Uncached fields are expired, so they can never be mistaken for stored values.
+        user = User.model_validate({**data, **{field: "" for field in UNCACHED_FIELDS}})
+        make_transient_to_detached(user)
+        user = await session.merge(user, load=False)
+        session.expire(user, list(UNCACHED_FIELDS))
+        return user
+
+    async def invalidate_cached_user(self, user: User) -> None:
+        await self.user_cache.invalidate({field: getattr(user, field) for field in LOOKUP_FIELDS})
+
+    @asynccontextmanager
+    async def unit_of_work(self, session: AsyncSession):
+        """
+        Collect the user state changes of one flow and write them on exit as a
+        single UPDATE ... RETURNING per user, followed by one commit.
+
+        HTTPExceptions are business rejections (bad OTP, locked account) whose
+        recorded state must still be persisted, so they flush before re-raising.
+        Any other error rolls the pending changes back. Nested calls join the
+        outermost unit of work.
+        """
+        if UNIT_OF_WORK_KEY in session.info:
+            yield
+            return
+
+        session.info[UNIT_OF_WORK_KEY] = {}
+        try:
+            yield
+        except HTTPException:
+            await self._flush_unit_of_work(session)
+            raise
+        except Exception:
+            session.info.pop(UNIT_OF_WORK_KEY, None)
+            await session.rollback()
+            raise
+        else:
+            await self._flush_unit_of_work(session)
+        finally:
+            session.info.pop(UNIT_OF_WORK_KEY, None)
+
+    async def _flush_unit_of_work(self, session: AsyncSession) -> None:
+        pending = session.info.pop(UNIT_OF_WORK_KEY, None)
+        if not pending:
+            return
+
+        for user, changes in pending.values():
+            if changes:
+                await self._write_user_changes(user, session, changes)
+        await session.commit()
+
+        for user, _ in pending.values():
+            await self.invalidate_cached_user(user)
+
+    async def _save_user_changes(self, user: User, session: AsyncSession, **changes) -> None:
+        # The in-memory row is updated as already-persisted state, so the ORM never
+        # schedules its own UPDATE and no refresh SELECT is needed afterwards.
+        for field, value in changes.items():
+            set_committed_value(user, field, value)
+
+        pending = session.info.get(UNIT_OF_WORK_KEY)
+        if pending is not None:
+            _, recorded = pending.setdefault(user.id, (user, {}))
+            recorded.update(changes)
+            return
+
+        await self._write_user_changes(user, session, changes)
+        await session.commit()
+        await self.invalidate_cached_user(user)
+
+    @staticmethod
+    def _user_changes_statement(user_id: uuid.UUID, changes: dict):
+        return (
+            update(User)
+            .where(User.id == user_id)
+            .values(**changes)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+
+    @classmethod
+    async def _write_user_changes(cls, user: User, session: AsyncSession, changes: dict) -> None:
+        await session.execute(cls._user_changes_statement(user.id, changes))
 
     async def get_user_by_email(self,email: EmailStr, session: AsyncSession, include_inactive:bool = False) -> User | None:
-        stmt = select(User).where(User.email == email)
-        if include_inactive:
-            stmt = stmt.where(User.is_active == False)
-        result = await session.execute(stmt)
-        return result.scalars().first()
+        return await self._get_user_by("email", email, session, include_inactive)
 
     # For looking up Bank account / external ID (id_number) || Fraud check, transaction validation, external references
     async def get_user_by_id_no(self,id_no: int, session: AsyncSession, include_inactive:bool = False) -> User | None:
-        stmt = select(User).where(User.id_no == id_no)
-        if include_inactive:
-            stmt = stmt.where(User.is_active == False)
-        result = await session.execute(stmt)
-        return result.scalars().first()
+        return await self._get_user_by("id_no", id_no, session, include_inactive)
 
 # For looking up DB primary key (id) || JWT token lookup, profile view, internal operations
     async def get_user_by_id(self,id: uuid.UUID, session: AsyncSession, include_inactive:bool = False) -> User | None:
-        stmt = select(User).where(User.id == id)
-        if include_inactive:
-            stmt = stmt.where(User.is_active == False)
-        result = await session.execute(stmt)
-        return result.scalars().first()
+        return await self._get_user_by("id", id, session, include_inactive)
 
     # Simple helper methods / functions for checking if user email , id number and id exists or not
     async def check_user_email_exists(self, email: EmailStr, session: AsyncSession) -> bool:
@@ -64,8 +224,10 @@ class AuthService:
         id = await self.get_user_by_id(id, session, include_inactive=False)
         return bool(id)
 
-    async def verify_user_password(self,plain_password: str, hashed_password: str) -> bool:
-        return verify_password(plain_password, hashed_password)
+    async def verify_user_password(self, user: User, plain_password: str, session: AsyncSession) -> bool:
+        # The hash is not cached, so it is always read fresh from the primary
+        await session.refresh(user, attribute_names=["hashed_password"])
+        return await self.hasher.verify(plain_password, user.hashed_password)
 
     async def reset_user_state(
             self,
@@ -76,20 +238,16 @@ class AuthService:
             log_action: bool = True,
     ) -> None:
         previous_status = user.account_status
-
-        user.failed_login_attempts = 0
-        user.last_failed_login = None
+        changes = {"failed_login_attempts": 0, "last_failed_login": None}
 
         if clear_otp:
-            user.otp = ""
-            user.otp_expiry_time = None
+            async with external_io(session, "otp_discard"):
+                await self.otp_store.discard(user.id)
 
         if user.account_status == AccountStatusSchema.LOCKED:
-            user.account_status = AccountStatusSchema.ACTIVE
+            changes["account_status"] = AccountStatusSchema.ACTIVE
 
-        await session.commit()
-
-        await session.refresh(user)
+        await self._save_user_changes(user, session, **changes)
 
         if log_action and previous_status != user.account_status:
             logger.info(
@@ -123,74 +281,92 @@ class AuthService:
         user: User,
         session: AsyncSession,
     ) -> tuple[bool, str]:
+        """
+        Issue a login OTP and queue its email. Returns (success, delivery_token);
+        the token is signed for this user and expires with the OTP, and can be
+        polled at /auth/otp/delivery/{token}. Delivery retries happen in the
+        Celery task, so this returns as soon as the email is queued.
+        """
         try:
             otp = generate_otp()
-            user.otp = otp
-
-            user.otp_expiry_time = datetime.now(timezone.utc) + timedelta(
-                minutes=settings.OTP_EXPIRATION_MINUTES
-            )
 
-            await session.commit()
-            await session.refresh(user)
-        #
-            for attempt in range(3):
-                try:
-                    await send_login_otp_email(user.email, otp)
-                    logger.info(f"OTP sent to {user.email} successfully")
-                    return True, otp
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send OTP email (attempt {attempt + 1}): {e}"
-                    )
-                    if attempt == 2:
-                        user.otp = ""
-                        user.otp_expiry_time = None
-                        await session.commit()
-                        await session.refresh(user)
-                        return False, ""
-
-                    await asyncio.sleep(2**attempt)
-            return False, ""
+            # Nothing below touches Postgres, so the user lookup's connection is released first
+            async with external_io(session, "otp_delivery"):
+                # OTPs live in the OTP store with a native TTL, not on the user row
+                await self.otp_store.save(
+                    user.id, otp, ttl_seconds=settings.OTP_EXPIRATION_MINUTES * 60
+                )
 
+                delivery_id = await send_login_otp_email(user.email, otp)
+            logger.info(f"OTP email for {user.email} queued as {delivery_id}")
+            return True, create_delivery_token(user.id, delivery_id)
 
         # If anything fails:
         # Log the error.
         except Exception as e:
-            logger.error(f"Failed to generate and save OTP: {e}")
+            logger.error(f"Failed to generate and queue OTP: {e}")
 
-
-            # Clear the OTP and expiry time. Commit changes again to keep data clean. Return failure
-            user.otp = ""
-            user.otp_expiry_time = None
-            await session.commit()
-            await session.refresh(user)
+            # Clear the OTP so it can't be used. Return failure
+            await self.otp_store.discard(user.id)
             return False, ""
 
+    def link_user(self, user: User, link_attributes: Sequence[str] = ()) -> None:
+        """Add a new user to the fraud entity graph; never fails the registration"""
+        try:
+            self.entity_graph.add_user(
+                user.id,
+                [*user_attributes(user.email, user.first_name, user.last_name, user.id_no), *link_attributes],
+            )
+        except Exception as e:
+            logger.error(f"Could not add user {user.id} to the entity graph: {e}")
+
     async def create_user(
             self,
             user_data: UserCreateSchema,
             session: AsyncSession,
+            link_attributes: Sequence[str] = (),
     ) -> User:
         user_data_dict = user_data.model_dump(
             exclude={"confirm_password", "username", "is_active", "account_status"}
         )
 
         password = user_data_dict.pop("password")
+        hashed_password = await self.hasher.hash(password)
+
+        # A single INSERT ... RETURNING; the unique constraints do the duplicate
+        # checks, so concurrent signups cannot race past a separate SELECT.
+        for attempt in range(USERNAME_GENERATION_ATTEMPTS):
+            user_row = User(
+                username=generate_username(user_data.first_name,user_data.last_name),
+                hashed_password=hashed_password,
+                is_active=False,
+                account_status=AccountStatusSchema.PENDING,
+                **user_data_dict,
+            )
+            stmt = insert(User).values(**user_row.model_dump()).returning(User)
+            try:
+                result = await session.execute(stmt)
+                new_user = result.scalars().one()
+                await session.commit()
+                break
+            except IntegrityError as e:
+                await session.rollback()
+                constraint = _unique_violation_constraint(e)
+
+                # Usernames are generated, so a clash is retried rather than reported
+                if constraint == "user_username_key" and attempt < USERNAME_GENERATION_ATTEMPTS - 1:
+                    continue
+
+                if constraint in USER_UNIQUE_CONSTRAINTS:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail=USER_UNIQUE_CONSTRAINTS[constraint],
+                    )
+                raise
 
-        new_user = User(
-            username=generate_username(user_data.first_name,user_data.last_name),
-            hashed_password=hash_password(password),
-            is_active=False,
-            account_status=AccountStatusSchema.PENDING,
-            **user_data_dict,
-        )
-
-        session.add(new_user)
-        await session.commit()
-        await session.refresh(new_user)
+        self.link_user(new_user, link_attributes)
 
-        activation_token = create_activation_token(new_user.id)
+        activation_token = await self.issue_activation_token(new_user)
         try:
             await send_activation_email(new_user.email, activation_token)
             logger.info(f"Activation email sent to {new_user.email}")
@@ -201,6 +377,18 @@ class AuthService:
 
         return new_user
 
+    async def issue_activation_token(self, user: User) -> str:
+        """Create a single-use activation token; older tokens for the user are revoked"""
+        jti = uuid.uuid4().hex
+        await self.token_registry.issue(user.id, jti)
+        return create_activation_token(user.id, jti)
+
+    async def issue_activation_tokens(self, user_ids: list[uuid.UUID]) -> list[str]:
+        """issue_activation_token for many users with one registry round trip"""
+        jtis = [uuid.uuid4().hex for _ in user_ids]
+        await self.token_registry.issue_many(list(zip(user_ids, jtis)))
+        return [create_activation_token(user_id, jti) for user_id, jti in zip(user_ids, jtis)]
+
     async def activate_user_account(
             self,
             token: str,
@@ -208,37 +396,34 @@ class AuthService:
     ) -> User:
         try:
             payload = jwt.decode(
-                token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+                token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
             )
 
             if payload.get("type") != "activation":
                 raise ValueError("Invalid token type")
 
-            user_id = uuid.UUID(payload["id"])
+            jti = payload.get("jti")
+            if not jti:
+                raise ValueError("Invalid activation token.")
 
-            user = await self.get_user_by_id(user_id, session, include_inactive=True)
-
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "status": "error",
-                        "message": "User not found",
-                    },
-                )
-            if user.is_active:
-                raise ValueError("User already active")
-            await self.reset_user_state(user, session, clear_otp=True, log_action=True)
+            # Replays and revoked tokens are rejected before any database work
+            if self.token_registry.is_known_spent(jti) or not await self.token_registry.consume(jti):
+                raise ValueError("Activation token has already been used.")
 
-            user.is_active = True
-            user.account_status = AccountStatusSchema.ACTIVE
+            user_id = uuid.UUID(payload["id"])
 
-            await session.commit()
-            await session.refresh(user)
+            try:
+                user = await self._activate_user(user_id, session)
+            except (ValueError, HTTPException):
+                raise
+            except Exception:
+                # Not the token's fault, so let the user retry with it
+                await self.token_registry.release(jti)
+                raise
 
+            self.token_registry.remember_spent(jti)
             return user
 
-
         except jwt.ExpiredSignatureError:
 
             raise ValueError("Activation token has expired. Please request a new activation email.")
@@ -251,6 +436,31 @@ class AuthService:
             logger.error(f"Failed to activate user account: {e}")
             raise e
 
+    async def _activate_user(self, user_id: uuid.UUID, session: AsyncSession) -> User:
+        async with self.unit_of_work(session):
+            user = await self.get_user_by_id(user_id, session, include_inactive=True)
+
+            if not user:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail={
+                        "status": "error",
+                        "message": "User not found",
+                    },
+                )
+            if user.is_active:
+                raise ValueError("User already active")
+            await self.reset_user_state(user, session, clear_otp=True, log_action=True)
+
+            await self._save_user_changes(
+                user,
+                session,
+                is_active=True,
+                account_status=AccountStatusSchema.ACTIVE,
+            )
+
+        return user
+
     async def verify_login_otp(
             self,
             email: str,
@@ -258,41 +468,47 @@ class AuthService:
             session: AsyncSession,
     ) -> User:
         try:
-            user = await self.get_user_by_email(email, session)
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail={"status": "error", "message": "Invalid credentials"},
-                )
-
-            await self.validate_user_status(user)
-            await self.check_user_lockout(user, session)
+            async with self.unit_of_work(session):
+                user = await self.get_user_by_email(email, session)
+                if not user:
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail={"status": "error", "message": "Invalid credentials"},
+                    )
 
-            # OTP check
-            if user.otp != otp:
-                await self.increment_failed_login_attempts(user, session)
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "status": "error",
-                        "message": "Invalid OTP",
-                        "action": "Please check your OTP and try again",
-                    },
-                )
+                await self.validate_user_status(user)
+                await self.check_user_lockout(user, session)
+
+                # OTP check; a match is consumed atomically so it can't be replayed
+                async with external_io(session, "otp_verify"):
+                    result = await self.otp_store.verify_and_consume(user.id, otp)
+
+                if result in (OTPVerificationResult.INVALID, OTPVerificationResult.EXHAUSTED):
+                    await self.increment_failed_login_attempts(user, session)
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail={
+                            "status": "error",
+                            "message": "Invalid OTP",
+                            "action": "Please request a new OTP"
+                            if result == OTPVerificationResult.EXHAUSTED
+                            else "Please check your OTP and try again",
+                        },
+                    )
 
-            # Expiry check
-            if not user.otp_expiry_time or user.otp_expiry_time < datetime.now(timezone.utc):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "status": "error",
-                        "message": "OTP has expired",
-                        "action": "Please request a new OTP",
-                    },
-                )
+                # Expiry check; the store drops OTPs once their TTL passes
+                if result == OTPVerificationResult.EXPIRED:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail={
+                            "status": "error",
+                            "message": "OTP has expired",
+                            "action": "Please request a new OTP",
+                        },
+                    )
 
-            await self.reset_user_state(user, session, clear_otp=False)
-            return user
+                await self.reset_user_state(user, session, clear_otp=False)
+                return user
 
         except HTTPException:
             raise
@@ -337,6 +553,33 @@ class AuthService:
             },
         )
 
+    @staticmethod
+    def _failed_login_statement(user_id: uuid.UUID):
+        # Increment, timestamp and lock decision happen in one atomic statement, so
+        # parallel failures can neither lose increments nor miss the lock transition.
+        failed_login_attempts = User.failed_login_attempts + 1
+        locked_status = literal(
+            AccountStatusSchema.LOCKED, type_=User.__table__.c.account_status.type
+        )
+        return (
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                failed_login_attempts=failed_login_attempts,
+                last_failed_login=func.now(),
+                account_status=case(
+                    (failed_login_attempts >= settings.LOGIN_ATTEMPTS, locked_status),
+                    else_=User.account_status,
+                ),
+            )
+            .returning(
+                User.failed_login_attempts,
+                User.last_failed_login,
+                User.account_status,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     async def increment_failed_login_attempts(
             self,
             user: User,
@@ -344,13 +587,28 @@ class AuthService:
     ) -> None:
         """Increase failed attempts and lock account if limit is reached."""
 
-        # Increase failed attempts and update last failed time
-        user.failed_login_attempts += 1
-        user.last_failed_login = datetime.now(timezone.utc)
+        # Changes already recorded for this user in a unit of work (e.g. a lockout
+        # reset) must land before the increment, or the final flush would overwrite it.
+        pending = session.info.get(UNIT_OF_WORK_KEY)
+        if pending is not None:
+            _, recorded = pending.pop(user.id, (user, {}))
+            if recorded:
+                await self._write_user_changes(user, session, recorded)
+
+        result = await session.execute(self._failed_login_statement(user.id))
+        row = result.one()
+
+        previous_status = user.account_status
+        set_committed_value(user, "failed_login_attempts", row.failed_login_attempts)
+        set_committed_value(user, "last_failed_login", row.last_failed_login)
+        set_committed_value(user, "account_status", row.account_status)
 
         # Lock account if too many attempts
-        if user.failed_login_attempts >= settings.LOGIN_ATTEMPTS:
-            user.account_status = AccountStatusSchema.LOCKED
+        if (
+            row.account_status == AccountStatusSchema.LOCKED
+            and previous_status != AccountStatusSchema.LOCKED
+        ):
+            logger.warning(f"User {user.email} locked due to failed logins")
 
             # # Try sending lockout email
             # try:
@@ -358,11 +616,14 @@ class AuthService:
             #     logger.info(f"Lockout email sent to {user.email}")
             # except Exception as e:
             #     logger.error(f"Email sending failed for {user.email}: {e}")
-            #
-            # logger.warning(f"User {user.email} locked due to failed logins")
 
-        # Save changes
+        # Save changes; inside a unit of work the commit and cache invalidation
+        # happen when it is flushed.
+        if pending is not None:
+            pending[user.id] = (user, {})
+            return
+
         await session.commit()
-        await session.refresh(user)
+        await self.invalidate_cached_user(user)
 
 auth_service = AuthService()
@@ -0,0 +1,307 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.api.services.auth_service import USERNAME_GENERATION_ATTEMPTS, AuthService, auth_service
+from backend.app.auth.utils import generate_username, hash_password
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.services.activate_email import send_activation_emails
+from backend.app.database.copy import copy_rows
+from backend.app.models import User
+from backend.app.schema.otp_question import AccountStatusSchema
+from backend.app.schema.user import UserCreateSchema
+
+logger = get_logger()
+
+STAGING_TABLE = "user_import_staging"
+USER_COLUMNS = [column.name for column in User.__table__.columns]
+_COLUMN_LIST = ", ".join(f'"{column}"' for column in USER_COLUMNS)
+
+CREATE_STAGING_SQL = text(
+    f'CREATE TEMP TABLE {STAGING_TABLE} (LIKE "user" INCLUDING DEFAULTS) ON COMMIT DROP'
+)
+INSERT_FROM_STAGING_SQL = text(
+    f'INSERT INTO "user" ({_COLUMN_LIST}) SELECT {_COLUMN_LIST} FROM {STAGING_TABLE} '
+    f"ON CONFLICT DO NOTHING RETURNING id"
+)
+# Staged rows that were not inserted, with the unique values they clash on
+CONFLICTS_SQL = text(
+    f"""
+    SELECT s.id,
+           EXISTS (SELECT 1 FROM "user" u WHERE u.email = s.email) AS email,
+           EXISTS (SELECT 1 FROM "user" u WHERE u.id_no = s.id_no) AS id_no,
+           EXISTS (SELECT 1 FROM "user" u WHERE u.username = s.username) AS username
+    FROM {STAGING_TABLE} s
+    WHERE NOT EXISTS (SELECT 1 FROM "user" u WHERE u.id = s.id)
+    """
+)
+CONFLICT_MESSAGES = {
+    "email": "Email already registered",
+    "id_no": "User ID No. already registered",
+    "username": "Username already taken",
+}
+
+
+def _hash_passwords(passwords: list[str]) -> list[str]:
+    # Runs in a worker process; module level so it can be pickled
+    return [hash_password(password) for password in passwords]
+
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, HTTPException):
+        detail = error.detail
+        return detail.get("message", str(detail)) if isinstance(detail, dict) else str(detail)
+    return str(error)
+
+
+async def iter_ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into NDJSON lines without buffering the whole body"""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line.decode("utf-8")
+    if pending.strip():
+        yield pending.decode("utf-8")
+
+
+@dataclass
+class BulkRegistrationReport:
+    created: int = 0
+    invalid: int = 0
+    conflicts: int = 0
+    emails_queued: int = 0
+    rows: list[dict] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    _started_at: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def total(self) -> int:
+        return self.created + self.invalid + self.conflicts
+
+    def add(self, row: int, status: str, **details) -> None:
+        if status == "created":
+            self.created += 1
+        elif status == "invalid":
+            self.invalid += 1
+        else:
+            self.conflicts += 1
+        self.rows.append({"row": row, "status": status, **details})
+
+    def finish(self) -> None:
+        self.elapsed_seconds = time.perf_counter() - self._started_at
+        self.rows.sort(key=lambda result: result["row"])
+
+    def summary(self) -> dict:
+        return {
+            "total": self.total,
+            "created": self.created,
+            "invalid": self.invalid,
+            "conflicts": self.conflicts,
+            "emails_queued": self.emails_queued,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.total / self.elapsed_seconds, 1)
+            if self.elapsed_seconds
+            else None,
+        }
+
+    def as_dict(self) -> dict:
+        return {**self.summary(), "rows": self.rows}
+
+
+class BulkRegistrationService:
+    """
+    Registers users in streamed chunks: validate with UserCreateSchema, hash the
+    passwords across CPU cores, COPY the chunk into a temp staging table, insert
+    it into "user" with ON CONFLICT DO NOTHING and report the rows that clashed.
+    Rows that clash only on their generated username are retried with a new one.
+    Each chunk commits on its own, so a large run makes steady progress.
+
+    Every run shares one process pool of hash_workers processes, created on
+    first use, so concurrent uploads queue for the same cores instead of each
+    starting a pool of its own.
+    """
+
+    def __init__(
+        self,
+        auth: AuthService = auth_service,
+        chunk_size: int = settings.BULK_REGISTRATION_CHUNK_SIZE,
+        hash_workers: int = settings.BULK_REGISTRATION_HASH_WORKERS,
+        email_batch_size: int = settings.BULK_EMAIL_BATCH_SIZE,
+    ):
+        self.auth = auth
+        self.chunk_size = chunk_size
+        self.hash_workers = hash_workers or os.cpu_count() or 1
+        self.email_batch_size = email_batch_size
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn keeps the event loop and open connections out of the workers
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.hash_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            logger.info("Bulk registration hashing pool shut down")
+
+    async def register_rows(
+        self,
+        rows: AsyncIterator[dict | str],
+        session: AsyncSession,
+    ) -> BulkRegistrationReport:
+        """rows yields parsed dicts or raw NDJSON lines, in input order"""
+        report = BulkRegistrationReport()
+        pool = self._get_pool()
+
+        chunk: list[tuple[int, dict | str]] = []
+        row_number = 0
+        async for row in rows:
+            row_number += 1
+            chunk.append((row_number, row))
+            if len(chunk) >= self.chunk_size:
+                await self._register_chunk(chunk, session, pool, report)
+                chunk = []
+        if chunk:
+            await self._register_chunk(chunk, session, pool, report)
+
+        report.finish()
+        logger.info(f"Bulk registration finished: {report.summary()}")
+        return report
+
+    async def _hash_all(self, passwords: list[str], pool: ProcessPoolExecutor) -> list[str]:
+        loop = asyncio.get_running_loop()
+        slice_size = -(-len(passwords) // self.hash_workers)
+        slices = [
+            passwords[start:start + slice_size]
+            for start in range(0, len(passwords), slice_size)
+        ]
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _hash_passwords, part) for part in slices)
+        )
+        return [hashed for part in results for hashed in part]
+
+    async def _register_chunk(
+        self,
+        chunk: list[tuple[int, dict | str]],
+        session: AsyncSession,
+        pool: ProcessPoolExecutor,
+        report: BulkRegistrationReport,
+    ) -> None:
+        valid: list[tuple[int, UserCreateSchema]] = []
+        for row_number, raw in chunk:
+            try:
+                data = json.loads(raw) if isinstance(raw, str) else raw
+                valid.append((row_number, UserCreateSchema.model_validate(data)))
+            except (ValueError, HTTPException) as e:
+                report.add(row_number, "invalid", error=_error_message(e))
+
+        if not valid:
+            return
+
+        hashed_passwords = await self._hash_all([data.password for _, data in valid], pool)
+
+        staged: list[tuple[int, User]] = []
+        for (row_number, data), hashed_password in zip(valid, hashed_passwords):
+            user_data = data.model_dump(
+                exclude={"confirm_password", "password", "username", "is_active", "account_status"}
+            )
+            staged.append((
+                row_number,
+                User(
+                    username=generate_username(data.first_name, data.last_name),
+                    hashed_password=hashed_password,
+                    is_active=False,
+                    account_status=AccountStatusSchema.PENDING,
+                    **user_data,
+                ),
+            ))
+
+        created: list[tuple[int, User]] = []
+        for attempt in range(USERNAME_GENERATION_ATTEMPTS):
+            inserted, conflicts = await self._insert_staged([user for _, user in staged], session)
+
+            retry: list[tuple[int, User]] = []
+            for row_number, user in staged:
+                fields = conflicts.get(user.id) or []
+                if user.id in inserted:
+                    created.append((row_number, user))
+                    self.auth.link_user(user)
+                    report.add(row_number, "created", id=str(user.id), email=user.email)
+                elif fields == ["username"] and attempt < USERNAME_GENERATION_ATTEMPTS - 1:
+                    # Usernames are generated, so a clash is retried rather than reported
+                    user.username = generate_username(user.first_name, user.last_name)
+                    retry.append((row_number, user))
+                else:
+                    report.add(
+                        row_number,
+                        "conflict",
+                        email=user.email,
+                        error="; ".join(CONFLICT_MESSAGES[name] for name in fields)
+                        or "Duplicate user",
+                    )
+            if not retry:
+                break
+            staged = retry
+
+        await self._queue_activation_emails([user for _, user in created], report)
+
+    @staticmethod
+    async def _insert_staged(users: list[User], session: AsyncSession) -> tuple[set, dict]:
+        """Insert users through the staging table in one transaction; returns inserted ids and conflicts"""
+        try:
+            await session.execute(CREATE_STAGING_SQL)
+            await copy_rows(
+                session,
+                STAGING_TABLE,
+                USER_COLUMNS,
+                ([getattr(user, column) for column in USER_COLUMNS] for user in users),
+            )
+            result = await session.execute(INSERT_FROM_STAGING_SQL)
+            inserted = {row.id for row in result}
+
+            conflicts: dict = {}
+            if len(inserted) < len(users):
+                result = await session.execute(CONFLICTS_SQL)
+                conflicts = {
+                    row.id: [name for name in CONFLICT_MESSAGES if getattr(row, name)]
+                    for row in result
+                }
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        return inserted, conflicts
+
+    async def _queue_activation_emails(self, users: list[User], report: BulkRegistrationReport) -> None:
+        for start in range(0, len(users), self.email_batch_size):
+            batch = users[start:start + self.email_batch_size]
+            try:
+                tokens = await self.auth.issue_activation_tokens([user.id for user in batch])
+                await send_activation_emails(
+                    [(user.email, token) for user, token in zip(batch, tokens)]
+                )
+                report.emails_queued += len(batch)
+            except Exception as e:
+                # Users stay registered; they can use resend_activation_email
+                logger.error(f"Failed to queue activation emails for {len(batch)} users: {e}")
+
+
+bulk_registration_service = BulkRegistrationService()
@@ -0,0 +1,131 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import and_, literal, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+
+from backend.app.core.pagination import decode_cursor, encode_cursor
+from backend.app.database.replicas import REPLICA_READ
+from backend.app.models import Transaction, User
+from backend.app.schema.otp_question import AccountStatusSchema, RoleChoicesSchema
+
+MAX_PAGE_SIZE = 200
+
+
+def _before(model, created_at: datetime, row_id: uuid.UUID):
+    """
+    Rows strictly after the cursor in (created_at DESC, id DESC) order. The plain
+    created_at bound is redundant with the row comparison but lets indexes
+    without id (and partition pruning) use it.
+    """
+    return and_(
+        model.created_at <= created_at,
+        tuple_(model.created_at, model.id) < tuple_(literal(created_at), literal(row_id)),
+    )
+
+
+class ListingService:
+    """
+    Keyset (seek) pagination, newest first. Each page continues from the last
+    row's (created_at, id) instead of an OFFSET, so page 10,000 costs the same
+    index descent as page 1. Ordering is served by ix_user_created_at_id and the
+    (account_status|role, created_at, id) indexes for users, and by the covering
+    sender/receiver indexes for transactions.
+    """
+
+    @staticmethod
+    def _page(rows: list, limit: int, filters: dict) -> tuple[list, str | None]:
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(last.created_at, last.id, filters)
+
+    async def list_users(
+        self,
+        session: AsyncSession,
+        *,
+        account_status: AccountStatusSchema | None = None,
+        role: RoleChoicesSchema | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> tuple[list[User], str | None]:
+        limit = min(limit, MAX_PAGE_SIZE)
+        filters = {
+            "account_status": account_status,
+            "role": role,
+            "created_after": created_after,
+            "created_before": created_before,
+        }
+
+        stmt = select(User)
+        if account_status is not None:
+            stmt = stmt.where(User.account_status == account_status)
+        if role is not None:
+            stmt = stmt.where(User.role == role)
+        if created_after is not None:
+            stmt = stmt.where(User.created_at >= created_after)
+        if created_before is not None:
+            stmt = stmt.where(User.created_at < created_before)
+        if cursor:
+            stmt = stmt.where(_before(User, *decode_cursor(cursor, filters)))
+
+        # One extra row tells whether another page exists
+        stmt = (
+            stmt.order_by(User.created_at.desc(), User.id.desc())
+            .limit(limit + 1)
+            .execution_options(**REPLICA_READ)
+        )
+        result = await session.execute(stmt)
+        return self._page(list(result.scalars().all()), limit, filters)
+
+    async def list_user_transactions(
+        self,
+        user_id: uuid.UUID,
+        session: AsyncSession,
+        *,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Transaction], str | None]:
+        limit = min(limit, MAX_PAGE_SIZE)
+        filters = {
+            "user_id": user_id,
+            "created_after": created_after,
+            "created_before": created_before,
+        }
+        position = decode_cursor(cursor, filters) if cursor else None
+
+        def side(column):
+            # Each side walks its own (party, created_at DESC) index in order and stops after limit + 1 rows
+            stmt = select(Transaction).where(column == user_id)
+            if created_after is not None:
+                stmt = stmt.where(Transaction.created_at >= created_after)
+            if created_before is not None:
+                stmt = stmt.where(Transaction.created_at < created_before)
+            if position is not None:
+                stmt = stmt.where(_before(Transaction, *position))
+            return stmt.order_by(Transaction.created_at.desc(), Transaction.id.desc()).limit(limit + 1)
+
+        # OR-ing sender and receiver would lose the index order; two ordered halves merge cheaply
+        both_sides = union_all(side(Transaction.sender_id), side(Transaction.receiver_id)).subquery()
+        page = aliased(Transaction, both_sides)
+        stmt = (
+            select(page)
+            .order_by(page.created_at.desc(), page.id.desc())
+            .limit(2 * (limit + 1))
+            .execution_options(**REPLICA_READ)
+        )
+        result = await session.execute(stmt)
+
+        # A transfer to oneself appears on both sides
+        rows = list({row.id: row for row in result.scalars().all()}.values())
+        return self._page(rows, limit, filters)
+
+
+listing_service = ListingService()
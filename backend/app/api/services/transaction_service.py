@@ -0,0 +1,211 @@
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+
+import asyncpg
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.api.services.listing_service import listing_service
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.database.copy import copy_rows
+from backend.app.fraud.feature_store import WINDOWS
+from backend.app.fraud.tasks import record_transaction_features
+from backend.app.models import Transaction
+from backend.app.schema.transaction import TransactionCreateSchema
+
+logger = get_logger()
+
+TRANSACTION_COLUMNS = [column.name for column in Transaction.__table__.columns]
+# Errors kept in a report; a bad upload can otherwise produce one per row
+MAX_REPORTED_ERRORS = 100
+# Older rows fall outside every online feature window and are not recorded there
+FEATURE_HORIZON = timedelta(seconds=max(window_seconds for window_seconds, _ in WINDOWS.values()))
+_SENDER, _AMOUNT, _CREATED_AT = (TRANSACTION_COLUMNS.index(name) for name in ("sender_id", "amount", "created_at"))
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Naive timestamps are stored as UTC by the timestamptz column
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def partition_horizon(now: datetime | None = None) -> datetime:
+    """
+    End of the last monthly partition ensure_transaction_partitions keeps
+    created. Later rows would land in transaction_default, and a month with
+    rows there can no longer be created as a partition.
+    """
+    now = now or datetime.now(timezone.utc)
+    months = now.year * 12 + now.month - 1 + settings.TRANSACTION_PARTITION_MONTHS_AHEAD + 1
+    return datetime(months // 12, months % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class TransactionIngestReport:
+    ingested: int = 0
+    invalid: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+    errors_omitted: int = 0
+    elapsed_seconds: float = 0.0
+    _started_at: float = field(default_factory=time.perf_counter, repr=False)
+
+    def add_error(self, row: int, error: str) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": error})
+        else:
+            self.errors_omitted += 1
+
+    def finish(self) -> None:
+        self.elapsed_seconds = time.perf_counter() - self._started_at
+
+    def summary(self) -> dict:
+        total = self.ingested + self.invalid + self.failed
+        return {
+            "total": total,
+            "ingested": self.ingested,
+            "invalid": self.invalid,
+            "failed": self.failed,
+            "errors_omitted": self.errors_omitted,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(total / self.elapsed_seconds, 1)
+            if self.elapsed_seconds
+            else None,
+        }
+
+
+class TransactionService:
+    """
+    Bulk ingestion and time-bounded reads of the partitioned transaction table.
+
+    Ingestion validates rows with TransactionCreateSchema and streams each batch
+    into "transaction" with COPY; Postgres routes every row to its monthly
+    partition. Batches commit independently. A batch Postgres rejects (for
+    example a sender that does not exist) is split in half and retried until
+    the offending rows are isolated, so only they fail and are reported by row
+    number; the run carries on either way.
+    """
+
+    def __init__(self, batch_size: int = settings.TRANSACTION_INGEST_BATCH_SIZE):
+        self.batch_size = batch_size
+
+    @staticmethod
+    def _row(data: TransactionCreateSchema) -> list:
+        values = data.model_dump()
+        values["id"] = values["id"] or uuid.uuid4()
+        values["created_at"] = _as_utc(values["created_at"] or datetime.now(timezone.utc))
+        return [values[column] for column in TRANSACTION_COLUMNS]
+
+    async def ingest(
+        self,
+        rows: AsyncIterator[dict | str | TransactionCreateSchema],
+        session: AsyncSession,
+    ) -> TransactionIngestReport:
+        """rows yields parsed dicts, raw NDJSON lines or schemas, in input order"""
+        report = TransactionIngestReport()
+        horizon = partition_horizon()
+        batch: list[tuple[int, list]] = []
+        row_number = 0
+
+        async for raw in rows:
+            row_number += 1
+            try:
+                if isinstance(raw, TransactionCreateSchema):
+                    data = raw
+                elif isinstance(raw, str):
+                    data = TransactionCreateSchema.model_validate_json(raw)
+                else:
+                    data = TransactionCreateSchema.model_validate(raw)
+            except ValidationError as e:
+                report.invalid += 1
+                report.add_error(row_number, str(e))
+                continue
+
+            if data.created_at is not None and _as_utc(data.created_at) >= horizon:
+                report.invalid += 1
+                report.add_error(row_number, f"created_at must be before {horizon.isoformat()}")
+                continue
+
+            batch.append((row_number, self._row(data)))
+            if len(batch) >= self.batch_size:
+                await self._copy_batch(batch, session, report)
+                batch = []
+
+        if batch:
+            await self._copy_batch(batch, session, report)
+
+        report.finish()
+        logger.info(f"Transaction ingestion finished: {report.summary()}")
+        return report
+
+    async def _copy_batch(
+        self, batch: list[tuple[int, list]], session: AsyncSession, report: TransactionIngestReport
+    ) -> None:
+        try:
+            await copy_rows(
+                session, Transaction.__tablename__, TRANSACTION_COLUMNS, (row for _, row in batch)
+            )
+            await session.commit()
+        except asyncpg.PostgresError as e:
+            # Postgres rejected the data: bisect so the good rows still go in
+            await session.rollback()
+            if len(batch) > 1:
+                middle = len(batch) // 2
+                await self._copy_batch(batch[:middle], session, report)
+                await self._copy_batch(batch[middle:], session, report)
+                return
+            row_number = batch[0][0]
+            report.failed += 1
+            report.add_error(row_number, str(e))
+            logger.warning(f"Transaction row {row_number} rejected: {e}")
+        except Exception as e:
+            await session.rollback()
+            report.failed += len(batch)
+            report.add_error(batch[0][0], f"Rows {batch[0][0]}-{batch[-1][0]} not ingested: {e}")
+            logger.error(f"Transaction batch of {len(batch)} rows rejected: {e}")
+        else:
+            report.ingested += len(batch)
+            await self._record_features(batch)
+
+    @staticmethod
+    async def _record_features(batch: list[tuple[int, list]]) -> None:
+        """Feed committed, recent transactions to the shared online aggregates the scorer reads"""
+        cutoff = datetime.now(timezone.utc) - FEATURE_HORIZON
+        events = [
+            [str(row[_SENDER]), float(row[_AMOUNT]), row[_CREATED_AT].isoformat()]
+            for _, row in batch
+            if row[_SENDER] is not None and row[_CREATED_AT] >= cutoff
+        ]
+        if not events:
+            return
+        try:
+            await asyncio.to_thread(record_transaction_features.apply_async, args=[events])
+        except Exception as e:
+            # The rows are committed; the aggregates only miss these events
+            logger.warning(f"Could not queue online features for {len(events)} transactions: {e}")
+
+    async def get_recent_transactions(
+        self,
+        user_id: uuid.UUID,
+        session: AsyncSession,
+        days: int = settings.TRANSACTION_RECENT_DAYS,
+        limit: int = 50,
+    ) -> list[Transaction]:
+        """
+        A user's sent and received transactions from the last `days`, newest first.
+        The created_at bound is a plain parameter, so the planner prunes every
+        partition older than the window and only the hot months are scanned; each
+        side then walks its (party, created_at DESC) index in order.
+        """
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        transactions, _ = await listing_service.list_user_transactions(
+            user_id, session, created_after=since, limit=limit
+        )
+        return transactions
+
+
+transaction_service = TransactionService()
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from fastapi import HTTPException, status
+from prometheus_client import Counter, Gauge, Histogram
+
+from backend.app.auth.utils import hash_password, verify_password
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.database.connection_guard import warn_if_connection_held
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+
+HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hashing jobs waiting for or running on the hashing pool",
+)
+HASH_LATENCY = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password on the hashing pool",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hashing jobs rejected because the hashing queue was full",
+    ["operation"],
+)
+
+
+class PasswordHashingExecutor:
+    """
+    Runs bcrypt on a dedicated, bounded thread pool so the event loop never blocks.
+
+    bcrypt releases the GIL while hashing, so a thread pool gives real parallelism
+    without the pickling and fork costs of a process pool.
+    """
+
+    def __init__(self, max_workers: int, queue_limit: int):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash",
+            )
+        return self._executor
+
+    async def hash(self, password: str) -> str:
+        return await self._submit("hash", hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._submit("verify", verify_password, password, hashed)
+
+    async def _submit(self, operation: str, func: Callable[..., T], *args) -> T:
+        # Anything beyond the running workers waits in the executor queue, so shed
+        # load before that queue grows past the configured limit.
+        if self._in_flight >= self.max_workers + self.queue_limit:
+            HASH_REJECTED.labels(operation=operation).inc()
+            logger.warning(
+                f"Password hashing queue full ({self._in_flight} in flight), rejecting {operation}"
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "status": "error",
+                    "message": "Service is busy",
+                    "action": "Please try again in a few seconds",
+                },
+                headers={"Retry-After": "1"},
+            )
+
+        warn_if_connection_held(f"password_{operation}")
+        self._in_flight += 1
+        HASH_QUEUE_DEPTH.set(self._in_flight)
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+            HASH_QUEUE_DEPTH.set(self._in_flight)
+            HASH_LATENCY.labels(operation=operation).observe(
+                time.perf_counter() - start_time
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info("Password hashing pool shut down")
+
+
+password_hasher = PasswordHashingExecutor(
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+)
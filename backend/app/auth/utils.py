@@ -1,8 +1,7 @@
 import random
 import string
 import uuid
-from datetime import datetime, timedelta
-from time import timezone
+from datetime import datetime, timedelta, timezone
 
 import bcrypt
 import secrets
@@ -38,11 +37,32 @@ def generate_username(first_name: str, last_name: str, length=4) -> str:
     username = f"{first_name.lower()}.{last_name.lower()}{random_digits}"
     return username
 
-def create_activation_token(id: uuid.UUID) -> str:
+def create_activation_token(id: uuid.UUID, jti: str | None = None) -> str:
     payload = {
         "id": str(id),
         "type": "activation",
+        "jti": jti or uuid.uuid4().hex,
         "exp": datetime.now(timezone.utc) + timedelta(minutes=settings.ACTIVATION_TOKEN_EXPIRATION_MINUTES),
         "iat": datetime.now(timezone.utc),
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm="HS256")
+    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+
+
+def create_delivery_token(user_id: uuid.UUID, delivery_id: str) -> str:
+    """Signed handle for polling a login OTP email; lives as long as the OTP"""
+    payload = {
+        "id": str(user_id),
+        "type": "otp_delivery",
+        "delivery_id": delivery_id,
+        "exp": datetime.now(timezone.utc) + timedelta(minutes=settings.OTP_EXPIRATION_MINUTES),
+        "iat": datetime.now(timezone.utc),
+    }
+    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+
+
+def decode_delivery_token(token: str) -> str:
+    """The Celery task id inside a delivery token; raises jwt.InvalidTokenError if it is not one we issued"""
+    payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+    if payload.get("type") != "otp_delivery" or not payload.get("delivery_id"):
+        raise jwt.InvalidTokenError("Not an OTP delivery token")
+    return payload["delivery_id"]
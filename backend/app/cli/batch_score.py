@@ -0,0 +1,117 @@
+"""
+Batch-score transactions into risk_score, or benchmark the vectorized scorer.
+
+    python -m backend.app.cli.batch_score --start 2026-09-01 --end 2026-10-01 --workers 8
+    python -m backend.app.cli.batch_score --start 2026-09-01 --end 2026-10-01 --celery
+    python -m backend.app.cli.batch_score --synthetic 10000000
+
+Locally, windows of --chunk-hours are scored on a process pool with a resumable
+checkpoint; --celery dispatches the same windows to the workers instead.
+--synthetic times feature computation, scoring and COPY encoding on generated
+columns without touching the database.
+"""
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from backend.app.core.config import settings
+from backend.app.database.dsn import sync_dsn
+from backend.app.fixtures.runner import run_chunks
+from backend.app.fraud.batch import (
+    TransactionColumns,
+    batch_features,
+    encode_risk_scores,
+    score_features,
+    score_window_chunk,
+    window_bounds,
+)
+from backend.app.fraud.engine import fraud_engine
+
+
+def _timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def synthetic_benchmark(rows: int, senders: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    columns = TransactionColumns(
+        created_at=np.sort(rng.uniform(0, 7 * 86_400, rows)),
+        sender=rng.integers(1, senders + 1, rows),
+        receiver=rng.integers(0, senders * 2, rows),
+        amount=rng.lognormal(4, 0.6, rows),
+    )
+    ids = np.frombuffer(rng.bytes(16 * rows), dtype="V16")
+
+    started_at = time.perf_counter()
+    features = batch_features(columns, settings.FRAUD_WINDOW_SIZE)
+    scores, codes = score_features(features, fraud_engine.model)
+    scored_at = time.perf_counter()
+    payload = encode_risk_scores(ids, np.arange(rows, dtype=np.int64), scores, codes, fraud_engine.model.version)
+    encoded_at = time.perf_counter()
+
+    score_seconds = scored_at - started_at
+    total_seconds = encoded_at - started_at
+    return {
+        "rows": rows,
+        "senders": senders,
+        "score_seconds": round(score_seconds, 3),
+        "encode_seconds": round(encoded_at - scored_at, 3),
+        "copy_payload_megabytes": round(len(payload) / 1_000_000, 1),
+        "score_rows_per_minute": round(rows / score_seconds * 60),
+        "rows_per_minute": round(rows / total_seconds * 60),
+        "decisions": np.bincount(codes, minlength=3).tolist(),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    if args.synthetic:
+        print(json.dumps(synthetic_benchmark(args.synthetic, args.senders, args.seed), indent=2))
+        return
+
+    if not (args.start and args.end):
+        raise SystemExit("--start and --end are required unless --synthetic is given")
+    start, end = _timestamp(args.start), _timestamp(args.end)
+
+    if args.celery:
+        from backend.app.fraud.tasks import rescore_transactions
+
+        result = rescore_transactions.delay(start.isoformat(), end.isoformat(), args.chunk_hours)
+        print(json.dumps({"task_id": result.id, "windows": len(window_bounds(start, end, args.chunk_hours))}))
+        return
+
+    report = run_chunks(
+        score_window_chunk,
+        total=len(window_bounds(start, end, args.chunk_hours)),
+        chunk_size=1,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        dsn=sync_dsn(),
+        range_start=start.isoformat(),
+        range_end=end.isoformat(),
+        chunk_hours=args.chunk_hours,
+        window_size=settings.FRAUD_WINDOW_SIZE,
+        lookback_hours=settings.FRAUD_BATCH_LOOKBACK_HOURS,
+    )
+    if report["rows_per_second"]:
+        report["rows_per_minute"] = round(report["rows_per_second"] * 60)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--start", help="ISO timestamp, UTC unless given an offset")
+    parser.add_argument("--end", help="ISO timestamp, exclusive")
+    parser.add_argument("--chunk-hours", type=int, default=settings.FRAUD_BATCH_CHUNK_HOURS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--checkpoint", type=Path, help="Resume file for completed windows")
+    parser.add_argument("--celery", action="store_true", help="Dispatch to the Celery workers")
+    parser.add_argument("--synthetic", type=int, metavar="ROWS", help="Benchmark on generated rows")
+    parser.add_argument("--senders", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=1)
+    main(parser.parse_args())
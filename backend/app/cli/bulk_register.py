@@ -0,0 +1,53 @@
+"""
+Register users in bulk from an NDJSON or CSV file.
+
+    python -m backend.app.cli.bulk_register users.ndjson --report results.ndjson
+"""
+import argparse
+import asyncio
+import csv
+import json
+from pathlib import Path
+from typing import AsyncIterator
+
+from backend.app.api.services.bulk_registration import BulkRegistrationService
+from backend.app.core.config import settings
+from backend.app.database.session import async_session, close_db, load_models
+
+
+async def read_rows(path: Path) -> AsyncIterator[dict | str]:
+    with path.open(newline="", encoding="utf-8") as source:
+        if path.suffix.lower() == ".csv":
+            for row in csv.DictReader(source):
+                yield {key: value if value != "" else None for key, value in row.items()}
+        else:
+            for line in source:
+                if line.strip():
+                    yield line
+
+
+async def main(args: argparse.Namespace) -> None:
+    load_models()
+    service = BulkRegistrationService(chunk_size=args.chunk_size)
+
+    try:
+        async with async_session() as session:
+            report = await service.register_rows(read_rows(args.path), session)
+    finally:
+        service.shutdown()
+        await close_db()
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as output:
+            for row in report.rows:
+                output.write(json.dumps(row) + "\n")
+
+    print(json.dumps(report.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", type=Path, help="NDJSON or CSV file of users")
+    parser.add_argument("--chunk-size", type=int, default=settings.BULK_REGISTRATION_CHUNK_SIZE)
+    parser.add_argument("--report", help="Write per-row results to this NDJSON file")
+    asyncio.run(main(parser.parse_args()))
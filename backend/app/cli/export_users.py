@@ -0,0 +1,43 @@
+"""
+Export users as CSV or NDJSON with constant memory.
+
+    python -m backend.app.cli.export_users locked.csv --status locked
+    python -m backend.app.cli.export_users - --format ndjson | gzip > users.ndjson.gz
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from backend.app.api.services.export_service import ExportStats, export_service
+from backend.app.database.session import close_db, load_models
+from backend.app.schema.otp_question import AccountStatusSchema, RoleChoicesSchema
+
+
+async def main(args: argparse.Namespace) -> None:
+    load_models()
+    stats = ExportStats()
+    output = sys.stdout.buffer if args.path == "-" else open(args.path, "wb")
+    try:
+        async for chunk in export_service.export_users(
+            args.format,
+            AccountStatusSchema(args.status) if args.status else None,
+            RoleChoicesSchema(args.role) if args.role else None,
+            stats=stats,
+        ):
+            output.write(chunk)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+        await close_db()
+
+    print(json.dumps(stats.summary(), indent=2), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="Output file, or - for stdout")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--status", choices=[status.value for status in AccountStatusSchema])
+    parser.add_argument("--role", choices=[role.value for role in RoleChoicesSchema])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,173 @@
+"""
+Measure fraud scoring latency and throughput on synthetic traffic.
+
+    python -m backend.app.cli.fraud_benchmark --requests 200000 --accounts 20000
+    python -m backend.app.cli.fraud_benchmark --through-app --requests 20000
+
+By default the scoring engine is called directly. --through-app sends every
+request through the FastAPI application in process (middleware, validation,
+routing and serialization, no socket), which is what one worker adds on top of
+the engine. Exits non-zero when p99 exceeds --max-p99-ms.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from backend.app.core.config import settings
+from backend.app.fraud.engine import FraudScoringEngine
+from backend.app.fraud.features import AccountFeatureStore
+
+
+def synthetic_traffic(requests: int, accounts: int, fraud_rate: float, seed: int) -> list[dict]:
+    """
+    Mostly repeat payments to a handful of known payees with lognormal amounts,
+    spread over a simulated day; a fraud_rate share are bursts of large
+    transfers to new payees.
+    """
+    rng = random.Random(seed)
+    senders = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(accounts)]
+    payees = {sender: [uuid.UUID(int=rng.getrandbits(128)) for _ in range(4)] for sender in senders}
+    started_at = datetime.now(timezone.utc) - timedelta(days=1)
+    step = 86_400 / requests
+
+    traffic = []
+    for index in range(requests):
+        sender = rng.choice(senders)
+        if rng.random() < fraud_rate:
+            receiver, amount = uuid.UUID(int=rng.getrandbits(128)), rng.uniform(2_000, 10_000)
+        else:
+            receiver, amount = rng.choice(payees[sender]), rng.lognormvariate(4, 0.6)
+        traffic.append(
+            {
+                "sender_id": sender,
+                "receiver_id": receiver,
+                "amount": round(amount, 2),
+                "created_at": started_at + timedelta(seconds=index * step),
+            }
+        )
+    return traffic
+
+
+def percentiles(timings_ms: list[float]) -> dict:
+    timings_ms.sort()
+    cuts = statistics.quantiles(timings_ms, n=1000)
+    return {
+        "p50_ms": round(cuts[499], 4),
+        "p95_ms": round(cuts[949], 4),
+        "p99_ms": round(cuts[989], 4),
+        "p999_ms": round(cuts[998], 4),
+        "max_ms": round(timings_ms[-1], 4),
+    }
+
+
+def run_engine(traffic: list[dict]) -> tuple[list[float], Counter]:
+    engine = FraudScoringEngine(AccountFeatureStore(settings.FRAUD_WINDOW_SIZE, settings.FRAUD_MAX_ACCOUNTS))
+    timings, decisions = [], Counter()
+    perf_counter = time.perf_counter
+    for transaction in traffic:
+        start_time = perf_counter()
+        result = engine.score(
+            transaction["sender_id"],
+            transaction["amount"],
+            receiver_id=transaction["receiver_id"],
+            occurred_at=transaction["created_at"],
+        )
+        timings.append((perf_counter() - start_time) * 1000)
+        decisions[result.decision.value] += 1
+    return timings, decisions
+
+
+async def run_app(traffic: list[dict]) -> tuple[list[float], Counter]:
+    from main import app
+
+    # The route sits behind the back-office key; use a throwaway one if none is configured
+    settings.BACKOFFICE_API_KEY = settings.BACKOFFICE_API_KEY or uuid.uuid4().hex
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"x-api-key", settings.BACKOFFICE_API_KEY.encode()),
+    ]
+    bodies = [json.dumps(transaction, default=str).encode() for transaction in traffic]
+    timings, decisions = [], Counter()
+
+    for body in bodies:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/fraud/score",
+            "raw_path": b"/fraud/score",
+            "root_path": "",
+            "query_string": b"",
+            "headers": headers + [(b"content-length", str(len(body)).encode())],
+            "client": ("127.0.0.1", 0),
+            "server": ("benchmark", 80),
+        }
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        response = {"body": b"", "sent_at": None}
+
+        async def receive():
+            return messages.pop() if messages else {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["body"] += message.get("body", b"")
+                if not message.get("more_body"):
+                    # Background tasks run after this; the client already has its answer
+                    response["sent_at"] = time.perf_counter()
+
+        start_time = time.perf_counter()
+        await app(scope, receive, send)
+        timings.append((response["sent_at"] - start_time) * 1000)
+        if response["status"] != 200:
+            raise RuntimeError(f"/fraud/score returned {response['status']}: {response['body'][:200]!r}")
+        decisions[json.loads(response["body"])["decision"]] += 1
+    return timings, decisions
+
+
+def main(args: argparse.Namespace) -> int:
+    traffic = synthetic_traffic(args.requests, args.accounts, args.fraud_rate, args.seed)
+
+    started_at = time.perf_counter()
+    if args.through_app:
+        timings, decisions = asyncio.run(run_app(traffic))
+    else:
+        timings, decisions = run_engine(traffic)
+    elapsed = time.perf_counter() - started_at
+
+    report = {
+        "mode": "app" if args.through_app else "engine",
+        "requests": len(timings),
+        "accounts": args.accounts,
+        "elapsed_seconds": round(elapsed, 3),
+        "requests_per_second": round(len(timings) / elapsed, 1),
+        **percentiles(timings),
+        "decisions": dict(decisions),
+    }
+    print(json.dumps(report, indent=2))
+
+    if report["p99_ms"] > args.max_p99_ms:
+        print(f"p99 {report['p99_ms']} ms exceeds {args.max_p99_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--accounts", type=int, default=10_000)
+    parser.add_argument("--fraud-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-p99-ms", type=float, default=5.0)
+    parser.add_argument("--through-app", action="store_true")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,58 @@
+"""
+Generate synthetic transactions between fixture users with parallel COPY.
+
+    python -m backend.app.cli.generate_transactions 50000000 --users 1000000 --days 90
+
+Run generate_users with the same --seed and at least --users users first.
+Transactions are spread evenly over the --days before now, oldest first, so
+they land in the monthly partitions in time order.
+"""
+import argparse
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from backend.app.core.config import settings
+from backend.app.database.dsn import sync_dsn
+from backend.app.fixtures.runner import run_chunks
+from backend.app.fixtures.transactions import copy_transaction_chunk
+from backend.app.fixtures.users import DEFAULT_SEED
+
+
+def main(args: argparse.Namespace) -> None:
+    if settings.ENVIRONMENT == "production":
+        raise SystemExit("Refusing to generate fixture transactions in production")
+
+    # Fixed to the day so a resumed run regenerates identical timestamps
+    start_at = args.start_at or (
+        datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        - timedelta(days=args.days)
+    ).isoformat()
+
+    report = run_chunks(
+        copy_transaction_chunk,
+        total=args.count,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        dsn=sync_dsn(),
+        users=args.users,
+        start_at=start_at,
+        seconds_between=args.days * 86400 / args.count,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("count", type=int, help="Number of transactions to generate")
+    parser.add_argument("--users", type=int, required=True, help="Fixture users to draw parties from")
+    parser.add_argument("--days", type=int, default=90, help="Spread transactions over this many days")
+    parser.add_argument("--start-at", help="ISO timestamp of the first transaction")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=200_000)
+    parser.add_argument("--checkpoint", type=Path, help="Resume file for completed chunks")
+    main(parser.parse_args())
@@ -0,0 +1,45 @@
+"""
+Generate synthetic users at scale with parallel COPY.
+
+    python -m backend.app.cli.generate_users 10000000 --workers 8 --checkpoint users.ckpt
+
+Rows are deterministic per index (see backend.app.fixtures.users), so rerunning
+with the same checkpoint resumes where a killed run stopped.
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+
+from backend.app.core.config import settings
+from backend.app.database.dsn import sync_dsn
+from backend.app.fixtures.runner import run_chunks
+from backend.app.fixtures.users import DEFAULT_SEED, copy_user_chunk
+
+
+def main(args: argparse.Namespace) -> None:
+    if settings.ENVIRONMENT == "production":
+        raise SystemExit("Refusing to generate fixture users in production")
+
+    report = run_chunks(
+        copy_user_chunk,
+        total=args.count,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        start_index=args.start_index,
+        dsn=sync_dsn(),
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("count", type=int, help="Number of users to generate")
+    parser.add_argument("--start-index", type=int, default=0, help="First fixture index")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--checkpoint", type=Path, help="Resume file for completed chunks")
+    main(parser.parse_args())
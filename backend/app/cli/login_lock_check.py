@@ -0,0 +1,132 @@
+"""
+Check that concurrent failed logins neither lose increments nor miss the lockout.
+
+    python -m backend.app.cli.login_lock_check --attempts 10
+
+Creates a throwaway user, loads it in --attempts separate sessions and fires
+AuthService.increment_failed_login_attempts from all of them at once. The check
+fails (exit code 1) unless the final counter equals --attempts, every call saw
+a distinct count, and exactly the calls at or above LOGIN_ATTEMPTS saw the
+account locked. The user is deleted afterwards. Each session holds a pooled
+connection while it waits, so --attempts cannot exceed the primary pool.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import delete
+
+from backend.app.api.services.auth_service import auth_service
+from backend.app.core.config import settings
+from backend.app.database.session import async_session, close_db, load_models
+from backend.app.fixtures.users import FIXTURE_EMAIL_DOMAIN, ID_NO_OFFSET, user_values
+from backend.app.models import User
+from backend.app.schema.otp_question import AccountStatusSchema
+
+
+async def create_probe_user() -> uuid.UUID:
+    now = datetime.now(timezone.utc)
+    user_id = uuid.uuid4()
+    values = {
+        **user_values(0),
+        "id": user_id,
+        "username": f"lock{user_id.hex[:8]}",
+        "email": f"lock-check.{user_id.hex}@{FIXTURE_EMAIL_DOMAIN}",
+        # Below the fixture range, so generated users never collide with it
+        "id_no": random.randrange(ID_NO_OFFSET // 2, ID_NO_OFFSET),
+        "is_active": True,
+        "account_status": AccountStatusSchema.ACTIVE,
+        "failed_login_attempts": 0,
+        "last_failed_login": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    async with async_session() as session:
+        session.add(User(**values))
+        await session.commit()
+    return user_id
+
+
+async def fail_login(user_id: uuid.UUID, start: asyncio.Event) -> tuple[int, AccountStatusSchema]:
+    async with async_session() as session:
+        user = await session.get(User, user_id)
+        await start.wait()
+        await auth_service.increment_failed_login_attempts(user, session)
+        return user.failed_login_attempts, user.account_status
+
+
+async def main(args: argparse.Namespace) -> int:
+    if settings.ENVIRONMENT == "production":
+        print("Refusing to lock accounts in a production database", file=sys.stderr)
+        return 2
+    pool_capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    if args.attempts > pool_capacity:
+        print(f"--attempts cannot exceed the pool's {pool_capacity} connections", file=sys.stderr)
+        return 2
+
+    load_models()
+    try:
+        user_id = await create_probe_user()
+        try:
+            start = asyncio.Event()
+            calls = [
+                asyncio.create_task(fail_login(user_id, start)) for _ in range(args.attempts)
+            ]
+            # Let every session load the user before any of them writes
+            await asyncio.sleep(args.settle_seconds)
+            start.set()
+            observed = sorted(await asyncio.gather(*calls), key=lambda call: call[0])
+
+            async with async_session() as session:
+                final = await session.get(User, user_id)
+                final_attempts, final_status = final.failed_login_attempts, final.account_status
+        finally:
+            async with async_session() as session:
+                await session.execute(delete(User).where(User.id == user_id))
+                await session.commit()
+    finally:
+        await close_db()
+
+    failures = []
+    if final_attempts != args.attempts:
+        failures.append(f"final counter is {final_attempts}, expected {args.attempts}")
+    counts = [attempts for attempts, _ in observed]
+    if counts != list(range(1, args.attempts + 1)):
+        failures.append(f"calls saw counts {counts}, expected 1..{args.attempts}")
+    for attempts, status in observed:
+        expected = (
+            AccountStatusSchema.LOCKED
+            if attempts >= settings.LOGIN_ATTEMPTS
+            else AccountStatusSchema.ACTIVE
+        )
+        if status != expected:
+            failures.append(
+                f"attempt {attempts} left the account {status.value}, expected {expected.value}"
+            )
+    expected_final = (
+        AccountStatusSchema.LOCKED
+        if args.attempts >= settings.LOGIN_ATTEMPTS
+        else AccountStatusSchema.ACTIVE
+    )
+    if final_status != expected_final:
+        failures.append(f"final status is {final_status.value}, expected {expected_final.value}")
+
+    print(
+        f"{args.attempts} concurrent failures: counter {final_attempts}, "
+        f"status {final_status.value}, lock threshold {settings.LOGIN_ATTEMPTS}"
+    )
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--attempts", type=int, default=10, help="Concurrent failed logins")
+    parser.add_argument(
+        "--settle-seconds", type=float, default=0.5, help="Wait for all sessions to load the user"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
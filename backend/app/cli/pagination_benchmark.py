@@ -0,0 +1,116 @@
+"""
+Compare keyset and OFFSET pagination latency at increasing page depths.
+
+    python -m backend.app.cli.pagination_benchmark --pages 1 100 1000 10000 --limit 50
+
+For each depth the cursor is positioned with one untimed lookup, then the
+keyset page and the equivalent OFFSET page are timed over several runs. Exits
+non-zero when the deepest keyset page is more than --max-ratio times slower
+than page 1. Seed the table with generate_users first.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+from sqlalchemy import text
+from sqlalchemy.future import select
+
+from backend.app.api.services.listing_service import listing_service
+from backend.app.core.pagination import encode_cursor
+from backend.app.database.session import async_session, close_db, load_models
+from backend.app.models import User
+from backend.app.schema.otp_question import AccountStatusSchema
+
+
+async def _timed(make_call, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        await make_call()
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+async def benchmark_depth(page: int, limit: int, runs: int, account_status) -> dict | None:
+    filters = {
+        "account_status": account_status,
+        "role": None,
+        "created_after": None,
+        "created_before": None,
+    }
+    base = select(User)
+    if account_status is not None:
+        base = base.where(User.account_status == account_status)
+    ordered = base.order_by(User.created_at.desc(), User.id.desc())
+
+    async with async_session() as session:
+        cursor = None
+        if page > 1:
+            # Position only; not part of the measurement
+            last_row = (
+                await session.execute(ordered.offset((page - 1) * limit - 1).limit(1))
+            ).scalars().first()
+            if last_row is None:
+                return None
+            cursor = encode_cursor(last_row.created_at, last_row.id, filters)
+
+        async def keyset_page():
+            await listing_service.list_users(
+                session, account_status=account_status, cursor=cursor, limit=limit
+            )
+
+        async def offset_page():
+            await session.execute(ordered.offset((page - 1) * limit).limit(limit))
+
+        keyset_ms = await _timed(keyset_page, runs)
+        offset_ms = await _timed(offset_page, runs)
+        # Drop identity-map state between depths so every run loads rows the same way
+        session.expunge_all()
+
+    return {"page": page, "keyset_ms": keyset_ms, "offset_ms": offset_ms}
+
+
+async def main(args: argparse.Namespace) -> int:
+    load_models()
+    account_status = AccountStatusSchema(args.status) if args.status else None
+    try:
+        async with async_session() as session:
+            total = (await session.execute(text('SELECT count(*) FROM "user"'))).scalar_one()
+
+        results = []
+        for page in args.pages:
+            result = await benchmark_depth(page, args.limit, args.runs, account_status)
+            if result is None:
+                print(f"page {page} is past the end of {total} users; skipped", file=sys.stderr)
+                continue
+            results.append(result)
+            print(json.dumps(result), file=sys.stderr)
+    finally:
+        await close_db()
+
+    print(json.dumps({"users": total, "limit": args.limit, "results": results}, indent=2))
+    if len(results) < 2:
+        return 0
+
+    ratio = results[-1]["keyset_ms"] / max(results[0]["keyset_ms"], 0.001)
+    if ratio > args.max_ratio:
+        print(
+            f"FAIL keyset page {results[-1]['page']} is {ratio:.1f}x slower than page "
+            f"{results[0]['page']} (allowed {args.max_ratio}x)",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000, 10000])
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--status", choices=[status.value for status in AccountStatusSchema])
+    parser.add_argument("--max-ratio", type=float, default=2.0)
+    sys.exit(asyncio.run(main(parser.parse_args())))
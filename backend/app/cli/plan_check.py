@@ -0,0 +1,160 @@
+"""
+Check the query plans of the statements AuthService emits against a large user table.
+
+    python -m backend.app.cli.plan_check --seed 2000000 --max-ms 5
+    python -m backend.app.cli.plan_check --baseline plans.json --write-baseline
+
+Every statement is run under EXPLAIN (ANALYZE, BUFFERS). The check fails (exit
+code 1) when a plan sequentially scans "user", when the median execution time
+exceeds --max-ms, or when it is more than --tolerance slower than the baseline.
+Writes are explained inside a transaction that is rolled back.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from backend.app.api.services.auth_service import AuthService
+from backend.app.core.config import settings
+from backend.app.database.dsn import sync_dsn
+from backend.app.database.session import close_db, engine, load_models
+from backend.app.fixtures.runner import run_chunks
+from backend.app.fixtures.users import copy_user_chunk
+
+PROBE_USER_SQL = text(
+    'SELECT id, email, id_no FROM "user" ORDER BY created_at DESC OFFSET :offset LIMIT 1'
+)
+
+
+async def seed(count: int) -> None:
+    # Shared fixture users; chunks that already exist are skipped, so reseeding is cheap
+    await asyncio.to_thread(
+        run_chunks,
+        copy_user_chunk,
+        total=count,
+        chunk_size=100_000,
+        workers=os.cpu_count() or 1,
+        dsn=sync_dsn(),
+    )
+
+    async with engine.connect() as connection:
+        await connection.execute(text('ANALYZE "user"'))
+        await connection.commit()
+
+
+def auth_statements(user) -> dict:
+    """The statements AuthService issues, bound to an existing user"""
+    return {
+        "get_user_by_email": AuthService._lookup_statement("email", user.email),
+        "get_user_by_id_no": AuthService._lookup_statement("id_no", user.id_no),
+        "get_user_by_id": AuthService._lookup_statement("id", user.id),
+        "write_user_changes": AuthService._user_changes_statement(
+            user.id, {"failed_login_attempts": 0, "last_failed_login": None}
+        ),
+        "increment_failed_login_attempts": AuthService._failed_login_statement(user.id),
+    }
+
+
+def _plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def explain(connection, statement, runs: int) -> dict:
+    sql = str(
+        statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+    timings = []
+    plan = None
+    for _ in range(runs):
+        transaction = await connection.begin()
+        try:
+            result = await connection.execute(
+                text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+            )
+            raw = result.scalar_one()
+        finally:
+            await transaction.rollback()
+        explained = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+        timings.append(explained["Execution Time"])
+        plan = explained["Plan"]
+
+    nodes = list(_plan_nodes(plan))
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "seq_scans": [
+            node.get("Relation Name") for node in nodes if node["Node Type"] == "Seq Scan"
+        ],
+        "indexes": sorted({node["Index Name"] for node in nodes if "Index Name" in node}),
+        "shared_blocks": sum(
+            node.get("Shared Hit Blocks", 0) + node.get("Shared Read Blocks", 0) for node in nodes
+        ),
+    }
+
+
+async def main(args: argparse.Namespace) -> int:
+    load_models()
+    try:
+        if args.seed:
+            if settings.ENVIRONMENT == "production":
+                print("Refusing to seed a production database", file=sys.stderr)
+                return 2
+            await seed(args.seed)
+
+        async with engine.connect() as connection:
+            total = (await connection.execute(text('SELECT count(*) FROM "user"'))).scalar_one()
+            user = (await connection.execute(PROBE_USER_SQL, {"offset": total // 2})).first()
+            if user is None:
+                print("The user table is empty; run with --seed", file=sys.stderr)
+                return 2
+
+            results = {
+                name: await explain(connection, statement, args.runs)
+                for name, statement in auth_statements(user).items()
+            }
+    finally:
+        await close_db()
+
+    baseline = {}
+    if args.baseline and args.baseline.exists() and not args.write_baseline:
+        baseline = json.loads(args.baseline.read_text())
+
+    failures = []
+    for name, result in results.items():
+        if "user" in result["seq_scans"]:
+            failures.append(f"{name}: sequential scan on \"user\"")
+        if result["median_ms"] > args.max_ms:
+            failures.append(f"{name}: {result['median_ms']}ms exceeds the {args.max_ms}ms budget")
+        previous = baseline.get(name, {}).get("median_ms")
+        if previous and result["median_ms"] > previous * (1 + args.tolerance):
+            failures.append(
+                f"{name}: {result['median_ms']}ms regressed from a {previous}ms baseline"
+            )
+
+    print(json.dumps({"rows": total, "statements": results}, indent=2))
+    if args.baseline and args.write_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, help="Generate this many fixture users first")
+    parser.add_argument("--runs", type=int, default=5, help="EXPLAIN ANALYZE runs per statement")
+    parser.add_argument("--max-ms", type=float, default=5.0, help="Median execution time budget")
+    parser.add_argument("--baseline", type=Path, help="JSON file of previous results")
+    parser.add_argument("--write-baseline", action="store_true", help="Save results as the baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.5, help="Allowed slowdown against the baseline"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
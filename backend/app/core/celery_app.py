@@ -1,4 +1,5 @@
 from celery import Celery
+from celery.schedules import crontab
 from backend.app.core.config import settings
 
 celery_app = Celery(
@@ -35,8 +36,26 @@ celery_app.conf.update(
     worker_task_log_format="[%(asctime)s: %(levelname)s/%(processName)s][%(task_name)s(%(task_id)s)] %(message)s",
 )
 
+celery_app.conf.beat_schedule = {
+    # Daily, so a missed run still leaves months of headroom before rows hit the default partition
+    "ensure-transaction-partitions": {
+        "task": "ensure_transaction_partitions",
+        "schedule": crontab(hour=2, minute=15),
+    },
+    # Yesterday's transactions under the current model, after the day has fully landed
+    "rescore-transactions-nightly": {
+        "task": "rescore_transactions",
+        "schedule": crontab(hour=3, minute=0),
+    },
+    # API workers pick the new snapshot up within ENTITY_GRAPH_RELOAD_CHECK_SECONDS
+    "rebuild-entity-graph": {
+        "task": "rebuild_entity_graph",
+        "schedule": crontab(hour=4, minute=0),
+    },
+}
+
 celery_app.autodiscover_tasks(
-    packages=["backend.app.core.tasks"],
+    packages=["backend.app.core.emails", "backend.app.core.maintenance", "backend.app.fraud"],
     related_name="tasks",
     force=True,
 )
\ No newline at end of file
@@ -1,6 +1,14 @@
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Literal
 
+# Connection pool sizing per environment, used for any DB_POOL_* value not set explicitly
+DB_POOL_DEFAULTS = {
+    "local": {"DB_POOL_SIZE": 5, "DB_MAX_OVERFLOW": 10, "DB_POOL_TIMEOUT": 30},
+    "staging": {"DB_POOL_SIZE": 10, "DB_MAX_OVERFLOW": 10, "DB_POOL_TIMEOUT": 10},
+    "production": {"DB_POOL_SIZE": 20, "DB_MAX_OVERFLOW": 20, "DB_POOL_TIMEOUT": 5},
+}
+
 class Settings(BaseSettings):
     ENVIRONMENT: Literal["local","staging", "production"] = "local"
 
@@ -11,6 +19,19 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str = ""
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_POOL_TIMEOUT: float | None = None
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_WARMUP_CONNECTIONS: int | None = None  # defaults to DB_POOL_SIZE
+    DB_POOL_HOLD_WARNING_SECONDS: float = 5.0
+    DB_POOL_LONGEST_HOLDS_TRACKED: int = 10
+    # JSON list of read replica URLs, e.g. '["postgresql+asyncpg://...@postgres_replica:5432/db"]'
+    DATABASE_REPLICA_URLS: list[str] = []
+    DB_REPLICA_MAX_LAG_SECONDS: float = 2.0
+    DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
+    DB_SLOW_QUERY_MS: float = 200.0
+    DB_N_PLUS_ONE_THRESHOLD: int = 5
     MAIL_FROM: str = ""
     MAIL_FROM_NAME: str = ""
     SMTP_HOST: str = "mailpit"
@@ -31,9 +52,75 @@ class Settings(BaseSettings):
     LOCKOUT_DURATION_MINUTES: int = 2 if ENVIRONMENT == 'local' else 5
     ACTIVATION_TOKEN_EXPIRATION_MINUTES: int = 2 if ENVIRONMENT == 'local' else 5
     API_BASE_URL: str = ""
+    SITE_NAME: str = "Bank Fraud Detection"
     SUPPORT_EMAIL: str = ""
     JWT_SECRET: str = ""
     JWT_ALGORITHM: str = "HS256"
+    ACTIVATION_BLOOM_CAPACITY: int = 100_000
+    ACTIVATION_BLOOM_ERROR_RATE: float = 1e-6
+
+    PASSWORD_HASH_MAX_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_LIMIT: int = 64
+
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_LOCAL_MAX_SIZE: int = 10_000
+    USER_CACHE_LOCAL_TTL_SECONDS: float = 5.0
+    USER_CACHE_REDIS_TTL_SECONDS: int = 300
+
+    OTP_STORE_BACKEND: Literal["redis", "memory"] = "redis"
+    OTP_MAX_VERIFY_ATTEMPTS: int = 5
+
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: Literal["redis", "memory"] = "redis"
+    RATE_LIMIT_WINDOW_SECONDS: int = 60
+    RATE_LIMIT_AUTH_PER_IP: int = 30
+    RATE_LIMIT_AUTH_PER_EMAIL: int = 10
+    RATE_LIMIT_AUTH_PER_ID_NO: int = 10
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = True
+    # Proxies in front of the API that append to X-Forwarded-For (Traefik)
+    RATE_LIMIT_TRUSTED_PROXY_HOPS: int = 1
+
+    BULK_REGISTRATION_ENABLED: bool = False
+    BULK_REGISTRATION_CHUNK_SIZE: int = 1000
+    BULK_REGISTRATION_HASH_WORKERS: int = 0  # 0 = one per CPU core
+    BULK_EMAIL_BATCH_SIZE: int = 100
+
+    TRANSACTION_PARTITION_MONTHS_AHEAD: int = 3
+    TRANSACTION_INGEST_BATCH_SIZE: int = 10_000
+    TRANSACTION_RECENT_DAYS: int = 30
+
+    # In-process scoring state: about 24 bytes per window slot per tracked account
+    FRAUD_WINDOW_SIZE: int = 64
+    FRAUD_MAX_ACCOUNTS: int = 50_000
+    FRAUD_REVIEW_THRESHOLD: float = 0.5
+    FRAUD_DECLINE_THRESHOLD: float = 0.9
+    # Nightly/backfill rescoring: one Celery task per window, each reading this much history first
+    FRAUD_BATCH_CHUNK_HOURS: int = 6
+    FRAUD_BATCH_LOOKBACK_HOURS: int = 24
+    # Shared 1m/1h/24h per-account aggregates; "memory" is per process, for development and tests
+    FEATURE_STORE_BACKEND: Literal["redis", "memory"] = "redis"
+
+    # Memory-mapped model versions shared by every worker on the host; see backend.app.fraud.registry
+    MODEL_ARTIFACT_DIR: str = "backend/app/model_artifacts"
+    MODEL_ARTIFACT_CHECK_SECONDS: float = 5.0
+
+    ENTITY_GRAPH_SNAPSHOT_PATH: str = "backend/app/model_artifacts/entity_graph.npz"
+    # An attribute shared by more users than this is noise and links nobody
+    ENTITY_GRAPH_MAX_DEGREE: int = 50
+    ENTITY_GRAPH_ID_NO_BLOCK: int = 10
+    ENTITY_GRAPH_RELOAD_CHECK_SECONDS: float = 30.0
+
+    # Required in X-API-Key for the /users and /fraud endpoints; empty disables them
+    BACKOFFICE_API_KEY: str = ""
+
+    @model_validator(mode="after")
+    def apply_environment_pool_defaults(self) -> "Settings":
+        for name, value in DB_POOL_DEFAULTS[self.ENVIRONMENT].items():
+            if getattr(self, name) is None:
+                setattr(self, name, value)
+        if self.DB_POOL_WARMUP_CONNECTIONS is None:
+            self.DB_POOL_WARMUP_CONNECTIONS = self.DB_POOL_SIZE
+        return self
 
 
 
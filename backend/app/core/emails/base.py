@@ -1,12 +1,22 @@
+import asyncio
+
 from jinja2 import Environment, FileSystemLoader
 from pydantic import EmailStr
 
 from backend.app.core.emails.config import TEMPLATES_DIR
 from backend.app.core.logging import get_logger
-from backend.app.core.emails.tasks import send_email
+from backend.app.core.emails.tasks import send_email, send_email_batch
+from backend.app.database.connection_guard import warn_if_connection_held
 
 logger = get_logger()
 
+ENQUEUE_RETRY_POLICY = {
+    "max_retries": 2,
+    "interval_start": 0,
+    "interval_step": 0.2,
+    "interval_max": 0.5,
+}
+
 email_env = Environment(
     loader=FileSystemLoader(TEMPLATES_DIR),
     autoescape=True,
@@ -24,7 +34,7 @@ class EmailTemplate:
         email_to: EmailStr | list[EmailStr],
         context: dict,
         subject_override: str | None = None,
-    ) -> None:
+    ) -> str:
         try:
             recipients_list = [email_to] if isinstance(email_to, EmailStr) else email_to
 
@@ -39,16 +49,59 @@ class EmailTemplate:
             html_content = html_template.render(**context)
             plain_content = plain_template.render(**context)
 
-            task = send_email.delay(
-                recipients=recipients_list,
-                subject=subject_override or cls.subject,
-                html_content=html_content,
-                plain_content=plain_content,
+            warn_if_connection_held("email_enqueue")
+            # Publishing talks to the broker synchronously, so it runs in a thread with
+            # a short retry policy; delivery retries are owned by the Celery task.
+            task = await asyncio.to_thread(
+                send_email.apply_async,
+                kwargs={
+                    "recipients": recipients_list,
+                    "subject": subject_override or cls.subject,
+                    "html_content": html_content,
+                    "plain_content": plain_content,
+                },
+                retry=True,
+                retry_policy=ENQUEUE_RETRY_POLICY,
             )
             logger.info(f"Email task {task.id} queued for: {recipients_list}")
+            return task.id
 
         except Exception as e:
             logger.error(
                 f"Failed to queue email task for {recipients_list}: Error: {str(e)}"
             )
-            raise
\ No newline at end of file
+            raise
+
+    @classmethod
+    async def send_batch(
+        cls,
+        messages: list[tuple[EmailStr, dict]],
+    ) -> str:
+        """Queue one email per (recipient, context) pair as a single batch task"""
+        try:
+            html_template = email_env.get_template(cls.template_name)
+            plain_template = email_env.get_template(cls.template_name_plain)
+
+            rendered = [
+                {
+                    "recipients": [email_to],
+                    "subject": cls.subject,
+                    "html_content": html_template.render(**context),
+                    "plain_content": plain_template.render(**context),
+                }
+                for email_to, context in messages
+            ]
+
+            warn_if_connection_held("email_enqueue")
+            task = await asyncio.to_thread(
+                send_email_batch.apply_async,
+                kwargs={"messages": rendered},
+                retry=True,
+                retry_policy=ENQUEUE_RETRY_POLICY,
+            )
+            logger.info(f"Email batch task {task.id} queued for {len(rendered)} recipients")
+            return task.id
+
+        except Exception as e:
+            logger.error(f"Failed to queue email batch of {len(messages)}: Error: {str(e)}")
+            raise
@@ -0,0 +1,30 @@
+import asyncio
+
+from celery.result import AsyncResult
+
+from backend.app.core.celery_app import celery_app
+
+# Celery task states as reported to clients polling for delivery
+DELIVERY_STATUSES = {
+    "PENDING": "queued",
+    "RECEIVED": "queued",
+    "STARTED": "sending",
+    "RETRY": "retrying",
+    "SUCCESS": "delivered",
+    "FAILURE": "failed",
+    "REVOKED": "failed",
+}
+
+
+def _read_delivery_status(delivery_id: str) -> dict:
+    # The failure reason stays in the logs; it can carry SMTP hosts and addresses
+    result = AsyncResult(delivery_id, app=celery_app)
+    return {
+        "status": DELIVERY_STATUSES.get(result.state, "queued"),
+        "retries": result.retries or 0,
+    }
+
+
+async def get_email_delivery_status(delivery_id: str) -> dict:
+    """Look up the delivery state of a queued email task in the result backend"""
+    return await asyncio.to_thread(_read_delivery_status, delivery_id)
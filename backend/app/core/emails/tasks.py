@@ -37,5 +37,49 @@ def send_email(
         logger.info(f"Email sent to {recipients} with subject {subject}")
         return True
     except Exception as e:
-        logger.error(f"Email failed to send to {recipients} with subject {subject}: {e}")
-        return False
\ No newline at end of file
+        # Re-raise so autoretry_for schedules the backoff retries; the final
+        # failure is recorded in the result backend for delivery status lookups.
+        logger.error(
+            f"Email failed to send to {recipients} with subject {subject} "
+            f"(attempt {self.request.retries + 1}): {e}"
+        )
+        raise
+
+
+@celery_app.task(
+    name="send_email_batch",
+    bind=True,
+    soft_time_limit=5 * 60,
+)
+def send_email_batch(self, *, messages: list[dict]) -> dict:
+    """
+    Send many rendered emails from one task. Each message holds the send_email
+    keyword arguments; a message that fails is handed to send_email so it gets
+    that task's own retries instead of failing the whole batch.
+    """
+
+    async def _send_all() -> list[dict]:
+        failed = []
+        for message in messages:
+            try:
+                await fastmail.send_message(
+                    MessageSchema(
+                        subject=message["subject"],
+                        recipients=message["recipients"],
+                        body=message["html_content"],
+                        subtype=MessageType.html,
+                        alternative_body=message["plain_content"],
+                        multipart_subtype=MultipartSubtypeEnum.alternative,
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Batch email to {message['recipients']} failed, requeueing: {e}")
+                failed.append(message)
+        return failed
+
+    failed = asyncio.run(_send_all())
+    for message in failed:
+        send_email.apply_async(kwargs=message)
+
+    logger.info(f"Email batch sent: {len(messages) - len(failed)} sent, {len(failed)} requeued")
+    return {"sent": len(messages) - len(failed), "requeued": len(failed)}
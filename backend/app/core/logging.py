@@ -27,5 +27,16 @@ logger.add(
     diagnose=True
 )
 
+# Slow SQL statements, logged with logger.bind(slow_query=True)
+logger.add(
+    sink=os.path.join(LOG_DIR, "slow_queries.log"),
+    format=LOG_FORMAT,
+    level="WARNING",
+    filter=lambda record: record["extra"].get("slow_query", False),
+    rotation="10 MB",
+    retention="30 days",
+    compression="zip",
+)
+
 def get_logger():
     return logger
\ No newline at end of file
@@ -0,0 +1,34 @@
+import psycopg
+
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.database.dsn import sync_dsn
+
+logger = get_logger()
+
+
+@celery_app.task(
+    name="ensure_transaction_partitions",
+    autoretry_for=(psycopg.OperationalError,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def ensure_transaction_partitions() -> int:
+    """
+    Create any missing monthly transaction partitions up to TRANSACTION_PARTITION_MONTHS_AHEAD.
+    A month that cannot be created is skipped by the function with a WARNING, logged here.
+    """
+    with psycopg.connect(sync_dsn()) as connection:
+        connection.add_notice_handler(
+            lambda notice: logger.warning(f"Transaction partitions: {notice.message_primary}")
+        )
+        created = connection.execute(
+            "SELECT create_transaction_partitions(0, %s)",
+            (settings.TRANSACTION_PARTITION_MONTHS_AHEAD,),
+        ).fetchone()[0]
+        connection.commit()
+
+    if created:
+        logger.info(f"Created {created} transaction partitions")
+    return created
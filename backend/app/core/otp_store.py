@@ -0,0 +1,148 @@
+import hashlib
+import hmac
+import time
+import uuid
+from abc import ABC, abstractmethod
+from enum import Enum
+
+from redis.asyncio import Redis
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis import get_redis
+
+logger = get_logger()
+
+
+class OTPVerificationResult(str, Enum):
+    VALID = "valid"
+    INVALID = "invalid"
+    EXPIRED = "expired"
+    EXHAUSTED = "exhausted"
+
+
+def _digest(user_id: uuid.UUID, otp: str) -> str:
+    # Only a keyed digest is stored, so a Redis dump does not reveal live OTPs
+    message = f"{user_id}:{otp}".encode("utf-8")
+    return hmac.new(settings.JWT_SECRET.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+class OTPStore(ABC):
+    """Short-lived login OTP storage with atomic verify-and-consume"""
+
+    def __init__(self, max_attempts: int):
+        self.max_attempts = max_attempts
+
+    @abstractmethod
+    async def save(self, user_id: uuid.UUID, otp: str, ttl_seconds: int) -> None:
+        """Store a new OTP for the user, replacing any previous one and its attempts"""
+
+    @abstractmethod
+    async def verify_and_consume(self, user_id: uuid.UUID, otp: str) -> OTPVerificationResult:
+        """Check an OTP; a match deletes it so it can only be used once"""
+
+    @abstractmethod
+    async def discard(self, user_id: uuid.UUID) -> None:
+        """Remove the user's OTP, if any"""
+
+
+class RedisOTPStore(OTPStore):
+    # KEYS[1] = otp digest, KEYS[2] = failed attempt counter
+    # ARGV[1] = submitted digest, ARGV[2] = max attempts
+    VERIFY_SCRIPT = """
+    local stored = redis.call('GET', KEYS[1])
+    if not stored then
+        return 0
+    end
+    if stored == ARGV[1] then
+        redis.call('DEL', KEYS[1], KEYS[2])
+        return 1
+    end
+    local attempts = redis.call('INCR', KEYS[2])
+    if attempts == 1 then
+        redis.call('PEXPIRE', KEYS[2], math.max(redis.call('PTTL', KEYS[1]), 1))
+    end
+    if attempts >= tonumber(ARGV[2]) then
+        redis.call('DEL', KEYS[1], KEYS[2])
+        return 3
+    end
+    return 2
+    """
+
+    RESULTS = {
+        0: OTPVerificationResult.EXPIRED,
+        1: OTPVerificationResult.VALID,
+        2: OTPVerificationResult.INVALID,
+        3: OTPVerificationResult.EXHAUSTED,
+    }
+
+    def __init__(self, redis: Redis, max_attempts: int):
+        super().__init__(max_attempts)
+        self.redis = redis
+        self._verify = redis.register_script(self.VERIFY_SCRIPT)
+
+    @staticmethod
+    def _keys(user_id: uuid.UUID) -> list[str]:
+        # Shared hash tag keeps both keys in one slot for the Lua script
+        return [f"otp:{{{user_id}}}", f"otp:{{{user_id}}}:attempts"]
+
+    async def save(self, user_id: uuid.UUID, otp: str, ttl_seconds: int) -> None:
+        otp_key, attempts_key = self._keys(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(otp_key, _digest(user_id, otp), ex=ttl_seconds)
+            pipe.delete(attempts_key)
+            await pipe.execute()
+
+    async def verify_and_consume(self, user_id: uuid.UUID, otp: str) -> OTPVerificationResult:
+        result = await self._verify(
+            keys=self._keys(user_id),
+            args=[_digest(user_id, otp), self.max_attempts],
+        )
+        return self.RESULTS[int(result)]
+
+    async def discard(self, user_id: uuid.UUID) -> None:
+        await self.redis.delete(*self._keys(user_id))
+
+
+class InMemoryOTPStore(OTPStore):
+    """Process-local store for local development and tests; not shared between workers"""
+
+    def __init__(self, max_attempts: int):
+        super().__init__(max_attempts)
+        # user_id -> (digest, expires_at, failed attempts)
+        self._entries: dict[uuid.UUID, tuple[str, float, int]] = {}
+
+    async def save(self, user_id: uuid.UUID, otp: str, ttl_seconds: int) -> None:
+        self._entries[user_id] = (_digest(user_id, otp), time.monotonic() + ttl_seconds, 0)
+
+    async def verify_and_consume(self, user_id: uuid.UUID, otp: str) -> OTPVerificationResult:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[1] < time.monotonic():
+            self._entries.pop(user_id, None)
+            return OTPVerificationResult.EXPIRED
+
+        digest, expires_at, attempts = entry
+        if hmac.compare_digest(digest, _digest(user_id, otp)):
+            del self._entries[user_id]
+            return OTPVerificationResult.VALID
+
+        attempts += 1
+        if attempts >= self.max_attempts:
+            del self._entries[user_id]
+            return OTPVerificationResult.EXHAUSTED
+
+        self._entries[user_id] = (digest, expires_at, attempts)
+        return OTPVerificationResult.INVALID
+
+    async def discard(self, user_id: uuid.UUID) -> None:
+        self._entries.pop(user_id, None)
+
+
+def create_otp_store() -> OTPStore:
+    if settings.OTP_STORE_BACKEND == "memory":
+        logger.warning("Using in-memory OTP store; OTPs are not shared between workers")
+        return InMemoryOTPStore(max_attempts=settings.OTP_MAX_VERIFY_ATTEMPTS)
+    return RedisOTPStore(get_redis(), max_attempts=settings.OTP_MAX_VERIFY_ATTEMPTS)
+
+
+otp_store = create_otp_store()
@@ -0,0 +1,60 @@
+import base64
+import hashlib
+import hmac
+import json
+import uuid
+from datetime import datetime
+
+from backend.app.core.config import settings
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _signature(payload: bytes) -> bytes:
+    key = settings.JWT_SECRET.encode("utf-8")
+    return hmac.new(key, payload, hashlib.sha256).digest()[:16]
+
+
+def filters_digest(filters: dict) -> str:
+    """Short fingerprint of the listing filters a cursor was issued for"""
+    canonical = json.dumps(filters, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(canonical).hexdigest()[:16]
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID, filters: dict) -> str:
+    """
+    Opaque, signed position after (created_at, id) in a listing. Clients cannot
+    forge a position, and a cursor only works with the filters it came from.
+    """
+    payload = json.dumps(
+        {"c": created_at.isoformat(), "i": str(row_id), "f": filters_digest(filters)},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return f"{_b64encode(payload)}.{_b64encode(_signature(payload))}"
+
+
+def decode_cursor(token: str, filters: dict) -> tuple[datetime, uuid.UUID]:
+    try:
+        encoded_payload, encoded_signature = token.split(".")
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except ValueError:
+        raise InvalidCursorError("Malformed cursor")
+
+    if not hmac.compare_digest(signature, _signature(payload)):
+        raise InvalidCursorError("Cursor signature does not match")
+
+    data = json.loads(payload)
+    if data["f"] != filters_digest(filters):
+        raise InvalidCursorError("Cursor was issued for different filters")
+    return datetime.fromisoformat(data["c"]), uuid.UUID(data["i"])
@@ -0,0 +1,222 @@
+import json
+import time
+from collections import OrderedDict
+
+from fastapi import HTTPException, Request, status
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis import get_redis
+
+logger = get_logger()
+
+RATE_LIMIT_REJECTIONS = Counter(
+    "rate_limit_rejections_total",
+    "Requests rejected by the auth rate limiter, by the identifier that hit its limit",
+    ["dimension"],
+)
+
+
+class InMemorySlidingWindow:
+    """
+    Sliding-window counters approximated from the current and previous fixed
+    windows, kept per worker. The number of tracked identifiers is bounded so a
+    flood of random emails cannot grow memory without limit.
+    """
+
+    def __init__(self, window_seconds: int, max_keys: int = 100_000):
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        # key -> [window index, current count, previous count]
+        self._counters: OrderedDict[str, list[int]] = OrderedDict()
+
+    def _counter(self, key: str, window: int) -> list[int]:
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = [window, 0, 0]
+            self._counters[key] = counter
+            if len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+        else:
+            self._counters.move_to_end(key)
+
+        if counter[0] != window:
+            # Roll forward; anything older than the previous window no longer counts
+            counter[2] = counter[1] if counter[0] == window - 1 else 0
+            counter[1] = 0
+            counter[0] = window
+        return counter
+
+    async def hit(self, keys: list[str], limits: list[int], now: float) -> int:
+        window, offset = divmod(now, self.window_seconds)
+        window = int(window)
+        weight = 1 - offset / self.window_seconds
+
+        counters = [self._counter(key, window) for key in keys]
+        for index, (counter, limit) in enumerate(zip(counters, limits), start=1):
+            if counter[2] * weight + counter[1] >= limit:
+                return index
+
+        for counter in counters:
+            counter[1] += 1
+        return 0
+
+
+class RedisSlidingWindow:
+    """The same sliding-window counters in Redis, shared by every worker"""
+
+    # KEYS: current and previous window key per identifier, in pairs
+    # ARGV[1] = weight of the previous window, ARGV[2] = window seconds, ARGV[3..] = limits
+    HIT_SCRIPT = """
+    local weight = tonumber(ARGV[1])
+    local count = #KEYS / 2
+    for i = 1, count do
+        local current = tonumber(redis.call('GET', KEYS[2 * i - 1]) or '0')
+        local previous = tonumber(redis.call('GET', KEYS[2 * i]) or '0')
+        if previous * weight + current >= tonumber(ARGV[i + 2]) then
+            return i
+        end
+    end
+    for i = 1, count do
+        redis.call('INCR', KEYS[2 * i - 1])
+        redis.call('EXPIRE', KEYS[2 * i - 1], tonumber(ARGV[2]) * 2)
+    end
+    return 0
+    """
+
+    def __init__(self, redis: Redis, window_seconds: int):
+        self.window_seconds = window_seconds
+        self._hit = redis.register_script(self.HIT_SCRIPT)
+
+    async def hit(self, keys: list[str], limits: list[int], now: float) -> int:
+        window, offset = divmod(now, self.window_seconds)
+        window = int(window)
+        weight = 1 - offset / self.window_seconds
+
+        redis_keys = []
+        for key in keys:
+            redis_keys.extend([f"rl:{key}:{window}", f"rl:{key}:{window - 1}"])
+
+        result = await self._hit(
+            keys=redis_keys,
+            args=[weight, self.window_seconds, *limits],
+        )
+        return int(result)
+
+
+class RateLimiter:
+    """
+    Checks every identifier of a request (IP, email, id_no) in one atomic step.
+    A request is only counted when it passes all of its limits. If Redis is
+    unreachable the limiter falls back to the per-worker counters instead of
+    failing open.
+    """
+
+    def __init__(self, backend: str, window_seconds: int, limits: dict[str, int]):
+        self.window_seconds = window_seconds
+        self.limits = limits
+        self.local = InMemorySlidingWindow(window_seconds)
+        self.shared = (
+            RedisSlidingWindow(get_redis(), window_seconds) if backend == "redis" else None
+        )
+        self.rejections: dict[str, int] = {dimension: 0 for dimension in limits}
+
+    async def check(self, identifiers: dict[str, str]) -> str | None:
+        """Count the request and return the dimension that rejected it, if any"""
+        dimensions = [d for d in identifiers if d in self.limits]
+        keys = [f"{d}:{identifiers[d]}" for d in dimensions]
+        limits = [self.limits[d] for d in dimensions]
+        now = time.time()
+
+        if self.shared is not None:
+            try:
+                rejected = await self.shared.hit(keys, limits, now)
+            except Exception as e:
+                logger.warning(f"Shared rate limiter unavailable, using local counters: {e}")
+                rejected = await self.local.hit(keys, limits, now)
+        else:
+            rejected = await self.local.hit(keys, limits, now)
+
+        if not rejected:
+            return None
+
+        dimension = dimensions[rejected - 1]
+        self.rejections[dimension] += 1
+        RATE_LIMIT_REJECTIONS.labels(dimension=dimension).inc()
+        return dimension
+
+    def stats(self) -> dict:
+        return {"rejections": dict(self.rejections)}
+
+
+auth_rate_limiter = RateLimiter(
+    backend=settings.RATE_LIMIT_BACKEND,
+    window_seconds=settings.RATE_LIMIT_WINDOW_SECONDS,
+    limits={
+        "ip": settings.RATE_LIMIT_AUTH_PER_IP,
+        "email": settings.RATE_LIMIT_AUTH_PER_EMAIL,
+        "id_no": settings.RATE_LIMIT_AUTH_PER_ID_NO,
+    },
+)
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    The address the outermost trusted proxy saw. Each proxy appends its peer
+    to X-Forwarded-For, so anything left of the trusted hops was written by
+    the client and is ignored.
+    """
+    hops = settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR and hops > 0:
+        forwarded_for = [entry.strip() for entry in request.headers.get("x-forwarded-for", "").split(",")]
+        if len(forwarded_for) >= hops and forwarded_for[-hops]:
+            return forwarded_for[-hops]
+    return request.client.host if request.client else "unknown"
+
+
+async def _request_identifiers(request: Request) -> dict[str, str]:
+    identifiers = {"ip": get_client_ip(request)}
+
+    # FastAPI has already read and cached the body, so this does not consume it
+    body = await request.body()
+    if not body:
+        return identifiers
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return identifiers
+
+    if isinstance(payload, dict):
+        if payload.get("email"):
+            identifiers["email"] = str(payload["email"]).strip().lower()
+        if payload.get("id_no") is not None:
+            identifiers["id_no"] = str(payload["id_no"])
+    return identifiers
+
+
+async def auth_rate_limit(request: Request) -> None:
+    """
+    Router dependency for the /auth routes. Router dependencies are resolved
+    before the endpoint's own, so a rejected request never opens a database session.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+
+    identifiers = await _request_identifiers(request)
+    dimension = await auth_rate_limiter.check(identifiers)
+    if dimension is None:
+        return
+
+    logger.warning(f"Rate limit exceeded for {dimension} on {request.url.path}")
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail={
+            "status": "error",
+            "message": "Too many requests",
+            "action": "Please wait a moment and try again",
+        },
+        headers={"Retry-After": str(settings.RATE_LIMIT_WINDOW_SECONDS)},
+    )
@@ -0,0 +1,29 @@
+from redis.asyncio import Redis
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+redis_client = Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    decode_responses=True,
+    socket_timeout=1.0,
+    socket_connect_timeout=1.0,
+)
+
+
+def get_redis() -> Redis:
+    """Shared asyncio Redis client for caches, counters and short-lived state"""
+    return redis_client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis connection pool"""
+    try:
+        await redis_client.aclose()
+        logger.info("Redis connections closed successfully")
+    except Exception as e:
+        logger.error(f"Error closing Redis connections: {e}")
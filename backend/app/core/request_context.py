@@ -0,0 +1,25 @@
+from contextvars import ContextVar
+
+# ASGI scope of the request being handled. The router fills in the matched route
+# on this same dict, so code running deeper in the request (pool and cursor
+# events) can label its measurements with the route template.
+request_scope: ContextVar[dict | None] = ContextVar("request_scope", default=None)
+
+# Label for requests no route matched; the raw path (and method) are client
+# controlled, so using them would create unbounded metric label values
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def current_route() -> str:
+    """
+    Route template of the current request, e.g. "POST /auth/register",
+    UNMATCHED_ROUTE when no route matched, or "-" outside a request
+    """
+    scope = request_scope.get()
+    if scope is None:
+        return "-"
+
+    path = getattr(scope.get("route"), "path", None)
+    if not path:
+        return UNMATCHED_ROUTE
+    return f"{scope.get('method', '')} {path}".strip()
@@ -0,0 +1,25 @@
+import hmac
+
+from fastapi import HTTPException, Request, status
+
+from backend.app.core.config import settings
+
+
+async def require_backoffice_key(request: Request) -> None:
+    """
+    Router dependency for back-office endpoints: the X-API-Key header must match
+    BACKOFFICE_API_KEY. With no key configured the endpoints do not exist.
+    """
+    if not settings.BACKOFFICE_API_KEY:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    provided = request.headers.get("x-api-key", "")
+    if not hmac.compare_digest(provided.encode("utf-8"), settings.BACKOFFICE_API_KEY.encode("utf-8")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "status": "error",
+                "message": "Invalid API key",
+                "action": "Provide a valid X-API-Key header",
+            },
+        )
@@ -10,7 +10,7 @@ class AccountActivationEmail(EmailTemplate):
     subject = "Activate Your Account"
 
 
-async def send_activation_email(email: str, token: str) -> None:
+async def send_activation_email(email: str, token: str) -> str:
     activation_url = (
         f"{settings.API_BASE_URL}/auth/activate/{token}"
     )
@@ -20,4 +20,20 @@ async def send_activation_email(email: str, token: str) -> None:
         "expiry_time": settings.ACTIVATION_TOKEN_EXPIRATION_MINUTES,
         "support_email": settings.SUPPORT_EMAIL,
     }
-    await AccountActivationEmail.send_email(email_to=email, context=context)
\ No newline at end of file
+    return await AccountActivationEmail.send_email(email_to=email, context=context)
+
+
+async def send_activation_emails(recipients: list[tuple[str, str]]) -> str:
+    """Queue activation emails for (email, token) pairs as one batch task"""
+    messages = [
+        (
+            email,
+            {
+                "activation_url": f"{settings.API_BASE_URL}/auth/activate/{token}",
+                "expiry_time": settings.ACTIVATION_TOKEN_EXPIRATION_MINUTES,
+                "support_email": settings.SUPPORT_EMAIL,
+            },
+        )
+        for email, token in recipients
+    ]
+    return await AccountActivationEmail.send_batch(messages)
\ No newline at end of file
@@ -3,16 +3,16 @@ from backend.app.core.emails.base import EmailTemplate
 
 
 class LoginOTPEmail(EmailTemplate):
-    template_name = "login_otp.html"
-    template_name_plain = "login_otp.txt"
+    template_name = "otp_email.html"
+    template_name_plain = "otp_email.txt"
     subject = "Your Login OTP"
 
 
-async def send_login_otp_email(email: str, otp: str) -> None:
+async def send_login_otp_email(email: str, otp: str) -> str:
     context = {
         "otp": otp,
         "expiry_time": settings.OTP_EXPIRATION_MINUTES,
         "site_name": settings.SITE_NAME,
         "support_email": settings.SUPPORT_EMAIL,
     }
-    await LoginOTPEmail.send_email(email_to=email, context=context)
\ No newline at end of file
+    return await LoginOTPEmail.send_email(email_to=email, context=context)
\ No newline at end of file
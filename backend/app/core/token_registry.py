@@ -0,0 +1,171 @@
+import hashlib
+import math
+import time
+import uuid
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis import get_redis
+
+logger = get_logger()
+
+ACTIVATION_TOKEN_REJECTIONS = Counter(
+    "activation_token_rejections_total",
+    "Activation tokens rejected as replayed or revoked, by where they were caught",
+    ["source"],
+)
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over a bytearray, sized for a capacity and error rate"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class ExpiringBloomFilter:
+    """
+    Two bloom filter generations rotated every window, so entries are forgotten
+    after one to two windows. The window is the token lifetime: an entry only
+    has to outlive the token it blocks, since the JWT expiry rejects it after that.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, window_seconds: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.window_seconds = window_seconds
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotated_at = time.monotonic()
+
+    def _maybe_rotate(self) -> None:
+        if time.monotonic() - self._rotated_at >= self.window_seconds:
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = time.monotonic()
+
+    def add(self, item: str) -> None:
+        self._maybe_rotate()
+        self._current.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        self._maybe_rotate()
+        return item in self._current or item in self._previous
+
+
+class ActivationTokenRegistry:
+    """
+    Tracks activation token ids (jti) so each token can be used once.
+
+    Redis holds the authoritative consumed/revoked ids and each user's current
+    jti, all expiring with the token lifetime. An in-process bloom filter in
+    front remembers ids this worker has seen spent and rejects their replays
+    without a network call. A bloom false positive only makes a fresh token look
+    spent; the user can request a new one.
+    """
+
+    # KEYS[1] = user's current jti key
+    # ARGV[1] = new jti, ARGV[2] = ttl seconds, ARGV[3] = jti key prefix
+    ISSUE_SCRIPT = """
+    local previous = redis.call('GET', KEYS[1])
+    if previous and previous ~= ARGV[1] then
+        redis.call('SET', ARGV[3] .. previous, 'revoked', 'EX', ARGV[2])
+    end
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    return previous
+    """
+
+    JTI_KEY_PREFIX = "activation:jti:"
+
+    def __init__(self, redis: Redis, ttl_seconds: int, bloom_capacity: int, bloom_error_rate: float):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.spent = ExpiringBloomFilter(bloom_capacity, bloom_error_rate, ttl_seconds)
+        self._issue = redis.register_script(self.ISSUE_SCRIPT)
+
+    def _jti_key(self, jti: str) -> str:
+        return f"{self.JTI_KEY_PREFIX}{jti}"
+
+    @staticmethod
+    def _user_key(user_id: uuid.UUID) -> str:
+        return f"activation:user:{user_id}"
+
+    async def issue(self, user_id: uuid.UUID, jti: str) -> None:
+        """Make jti the user's only valid activation token, revoking the previous one"""
+        previous = await self._issue(
+            keys=[self._user_key(user_id)],
+            args=[jti, self.ttl_seconds, self.JTI_KEY_PREFIX],
+        )
+        if previous and previous != jti:
+            self.spent.add(previous)
+            logger.info(f"Revoked previous activation token for user {user_id}")
+
+    async def issue_many(self, tokens: list[tuple[uuid.UUID, str]]) -> None:
+        """issue() for many users in one pipelined round trip"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for user_id, jti in tokens:
+                await self._issue(
+                    keys=[self._user_key(user_id)],
+                    args=[jti, self.ttl_seconds, self.JTI_KEY_PREFIX],
+                    client=pipe,
+                )
+            previous_ids = await pipe.execute()
+
+        for (_, jti), previous in zip(tokens, previous_ids):
+            if previous and previous != jti:
+                self.spent.add(previous)
+
+    def is_known_spent(self, jti: str) -> bool:
+        """In-process check, no network call"""
+        if jti in self.spent:
+            ACTIVATION_TOKEN_REJECTIONS.labels(source="bloom").inc()
+            return True
+        return False
+
+    async def consume(self, jti: str) -> bool:
+        """Atomically mark jti as used; False if it was already consumed or revoked"""
+        consumed = await self.redis.set(
+            self._jti_key(jti), "consumed", nx=True, ex=self.ttl_seconds
+        )
+        if not consumed:
+            self.spent.add(jti)
+            ACTIVATION_TOKEN_REJECTIONS.labels(source="redis").inc()
+        return bool(consumed)
+
+    def remember_spent(self, jti: str) -> None:
+        """Record a successfully used jti locally so replays skip Redis"""
+        self.spent.add(jti)
+
+    async def release(self, jti: str) -> None:
+        """Undo consume() when activation failed for reasons unrelated to the token"""
+        await self.redis.delete(self._jti_key(jti))
+
+
+activation_token_registry = ActivationTokenRegistry(
+    redis=get_redis(),
+    ttl_seconds=settings.ACTIVATION_TOKEN_EXPIRATION_MINUTES * 60,
+    bloom_capacity=settings.ACTIVATION_BLOOM_CAPACITY,
+    bloom_error_rate=settings.ACTIVATION_BLOOM_ERROR_RATE,
+)
@@ -0,0 +1,206 @@
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Any
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis import get_redis
+
+logger = get_logger()
+
+USER_CACHE_REQUESTS = Counter(
+    "user_cache_requests_total",
+    "User cache lookups by tier and outcome",
+    ["tier", "result"],
+)
+
+LOOKUP_FIELDS = ("id", "email", "id_no")
+# Never leaves Postgres; login reads it from the primary instead
+UNCACHED_FIELDS = frozenset({"hashed_password"})
+
+
+class LRUTTLCache:
+    """Small in-process LRU cache whose entries also expire after a fixed TTL"""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class UserCache:
+    """
+    Two-tier read-through cache of user rows keyed by id, email and id_no.
+
+    The local tier is per worker with a short TTL, so a write made by another
+    worker is visible here after at most USER_CACHE_LOCAL_TTL_SECONDS. The Redis
+    tier is shared and invalidated explicitly on every write. UNCACHED_FIELDS
+    are stripped before storing.
+
+    An invalidation also leaves a write marker for write_guard_seconds, about
+    as long as an in-rotation replica can be behind. Rows read from a replica
+    are not cached while their user's marker exists, so a lagging replica can
+    never put back a row the invalidation just dropped.
+    Redis errors are logged and treated as misses so lookups fall back to Postgres.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        local_max_size: int,
+        local_ttl_seconds: float,
+        redis_ttl_seconds: int,
+        write_guard_seconds: int,
+        enabled: bool = True,
+    ):
+        self.redis = redis
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.write_guard_seconds = write_guard_seconds
+        self.enabled = enabled
+        self.local = LRUTTLCache(local_max_size, local_ttl_seconds)
+        self._stats = {
+            "local_hits": 0,
+            "local_misses": 0,
+            "redis_hits": 0,
+            "redis_misses": 0,
+            "redis_errors": 0,
+            "replica_fills_skipped": 0,
+        }
+
+    @staticmethod
+    def _key(field: str, value: Any) -> str:
+        return f"user:{field}:{value}"
+
+    @staticmethod
+    def _write_marker_key(user_id: Any) -> str:
+        return f"user:written:{user_id}"
+
+    def _record(self, tier: str, result: str) -> None:
+        self._stats[f"{tier}_{result}"] += 1
+        USER_CACHE_REQUESTS.labels(tier=tier, result=result).inc()
+
+    async def get(self, field: str, value: Any) -> dict | None:
+        if not self.enabled:
+            return None
+
+        key = self._key(field, value)
+        data = self.local.get(key)
+        if data is not None:
+            self._record("local", "hits")
+            return data
+        self._record("local", "misses")
+
+        try:
+            raw = await self.redis.get(key)
+        except Exception as e:
+            self._record("redis", "errors")
+            logger.warning(f"User cache read failed for {key}: {e}")
+            return None
+
+        if raw is None:
+            self._record("redis", "misses")
+            return None
+
+        self._record("redis", "hits")
+        data = json.loads(raw)
+        self.local.set(key, data)
+        return data
+
+    async def set(self, data: dict, from_replica: bool = False) -> None:
+        if not self.enabled:
+            return
+
+        data = {field: value for field, value in data.items() if field not in UNCACHED_FIELDS}
+        keys = [self._key(field, data[field]) for field in LOOKUP_FIELDS]
+
+        raw = json.dumps(data)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(key, raw, ex=self.redis_ttl_seconds)
+                if from_replica:
+                    pipe.exists(self._write_marker_key(data["id"]))
+                written_recently = (await pipe.execute())[-1] if from_replica else False
+
+            # Checked after writing: an invalidation before this point left its
+            # marker, and one after it deletes these keys itself
+            if written_recently:
+                self._stats["replica_fills_skipped"] += 1
+                await self.redis.delete(*keys)
+                return
+        except Exception as e:
+            self._record("redis", "errors")
+            logger.warning(f"User cache write failed for user {data.get('id')}: {e}")
+            if from_replica:
+                return
+
+        for key in keys:
+            self.local.set(key, data)
+
+    async def invalidate(self, data: dict) -> None:
+        """Drop a user from both tiers; data needs the id, email and id_no values"""
+        if not self.enabled:
+            return
+
+        keys = [self._key(field, data[field]) for field in LOOKUP_FIELDS]
+        for key in keys:
+            self.local.delete(key)
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.delete(*keys)
+                pipe.set(self._write_marker_key(data["id"]), 1, ex=self.write_guard_seconds)
+                await pipe.execute()
+        except Exception as e:
+            self._record("redis", "errors")
+            logger.warning(f"User cache invalidation failed for user {data.get('id')}: {e}")
+
+    def stats(self) -> dict:
+        return {**self._stats, "local_size": len(self.local)}
+
+
+user_cache = UserCache(
+    redis=get_redis(),
+    local_max_size=settings.USER_CACHE_LOCAL_MAX_SIZE,
+    local_ttl_seconds=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl_seconds=settings.USER_CACHE_REDIS_TTL_SECONDS,
+    # The worst lag a replica can reach while still in rotation: over the limit
+    # just after a lag check passed, and a full check interval before the next
+    write_guard_seconds=math.ceil(
+        settings.DB_REPLICA_MAX_LAG_SECONDS + settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS
+    ) + 1,
+    enabled=settings.USER_CACHE_ENABLED,
+)
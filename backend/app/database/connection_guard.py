@@ -0,0 +1,124 @@
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.logging import get_logger
+from backend.app.core.request_context import current_route
+
+logger = get_logger()
+
+# The request's session, set by get_session, so code with no session argument
+# (email queueing, password hashing) can tell whether a connection is being held.
+current_session: ContextVar[AsyncSession | None] = ContextVar("current_session", default=None)
+
+# session.info keys maintained by the listeners below
+HOLD_STARTED_KEY = "connection_hold_started_at"
+HOLD_TOTAL_KEY = "connection_hold_seconds"
+WROTE_KEY = "transaction_has_writes"
+
+SESSION_CONNECTION_HOLD = Histogram(
+    "db_session_connection_hold_seconds",
+    "Total time a request's session held database connections, by route",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+CONNECTION_HELD_ACROSS_IO = Counter(
+    "db_connection_held_across_io_total",
+    "Non-database awaits started while the request still held a connection",
+    ["route", "operation"],
+)
+CONNECTIONS_RELEASED = Counter(
+    "db_connection_released_before_io_total",
+    "Read-only transactions ended early so their connection went back to the pool",
+    ["operation"],
+)
+
+
+def track_connection_holds(session_class) -> None:
+    """Record per-session connection hold time and whether the transaction wrote"""
+
+    @event.listens_for(session_class, "after_begin")
+    def _connection_acquired(session, transaction, connection):
+        session.info.setdefault(HOLD_STARTED_KEY, time.perf_counter())
+
+    @event.listens_for(session_class, "do_orm_execute")
+    def _note_writes(orm_execute_state):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            orm_execute_state.session.info[WROTE_KEY] = True
+
+    @event.listens_for(session_class, "after_flush")
+    def _note_flush(session, flush_context):
+        session.info[WROTE_KEY] = True
+
+    @event.listens_for(session_class, "after_transaction_end")
+    def _connection_released(session, transaction):
+        if transaction.parent is not None:
+            return
+        started_at = session.info.pop(HOLD_STARTED_KEY, None)
+        session.info.pop(WROTE_KEY, None)
+        if started_at is not None:
+            held = time.perf_counter() - started_at
+            session.info[HOLD_TOTAL_KEY] = session.info.get(HOLD_TOTAL_KEY, 0.0) + held
+
+
+def holds_connection(session: AsyncSession) -> bool:
+    return session.in_transaction()
+
+
+def _has_writes(session: AsyncSession) -> bool:
+    return bool(
+        session.info.get(WROTE_KEY) or session.new or session.dirty or session.deleted
+    )
+
+
+def warn_if_connection_held(operation: str) -> None:
+    """Flag an external await made while the current request holds a connection"""
+    session = current_session.get()
+    if session is None or not holds_connection(session):
+        return
+
+    route = current_route()
+    CONNECTION_HELD_ACROSS_IO.labels(route=route, operation=operation).inc()
+    logger.warning(
+        f"{route} awaits {operation} while holding a database connection; "
+        f"wrap the call in external_io(session)"
+    )
+
+
+async def release_connection(session: AsyncSession, operation: str = "external_io") -> bool:
+    """
+    End a read-only transaction so its connection returns to the pool. Commit is
+    used rather than rollback because it keeps loaded objects usable (the session
+    does not expire on commit). A transaction that has written is left alone: it
+    belongs to the caller, who decides when it commits.
+    """
+    if not holds_connection(session):
+        return True
+    if _has_writes(session):
+        return False
+
+    await session.commit()
+    CONNECTIONS_RELEASED.labels(operation=operation).inc()
+    return True
+
+
+@asynccontextmanager
+async def external_io(session: AsyncSession, operation: str = "external_io"):
+    """
+    Wrap awaits on non-database work (Redis, the email broker, hashing) so the
+    session does not hold a pooled connection while they run. The next query
+    checks a connection out again.
+    """
+    if not await release_connection(session, operation):
+        logger.debug(f"Keeping the connection across {operation}: the transaction has writes")
+    yield
+
+
+def observe_session_hold(session: AsyncSession) -> None:
+    held = session.info.get(HOLD_TOTAL_KEY)
+    if held is not None:
+        SESSION_CONNECTION_HOLD.labels(route=current_route()).observe(held)
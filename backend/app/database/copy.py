@@ -0,0 +1,61 @@
+import csv
+import io
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, Iterable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Marker for NULL in COPY ... CSV, so empty strings stay empty strings
+COPY_NULL = r"\N"
+COPY_BLOCK_SIZE = 256 * 1024
+
+
+def copy_value(value) -> str:
+    """Render a Python value the way Postgres parses it from COPY CSV input"""
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, Enum):
+        # SQLAlchemy Enum columns store the member name, not its value
+        return value.name
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+async def _csv_blocks(rows: Iterable[Sequence]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([copy_value(value) for value in row])
+        if buffer.tell() >= COPY_BLOCK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def copy_rows(
+    session: AsyncSession,
+    table_name: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+) -> None:
+    """
+    Stream rows into a table with COPY ... FROM STDIN on the session's own
+    connection, so the copy is part of the session's current transaction.
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    await driver_connection.copy_to_table(
+        table_name,
+        source=_csv_blocks(rows),
+        columns=list(columns),
+        format="csv",
+        null=COPY_NULL,
+    )
@@ -0,0 +1,8 @@
+from backend.app.core.config import settings
+
+
+def sync_dsn(url: str | None = None) -> str:
+    """libpq DSN for psycopg from a SQLAlchemy URL such as postgresql+asyncpg://..."""
+    url = url or settings.DATABASE_URL
+    scheme, _, rest = url.partition("://")
+    return f"{scheme.split('+')[0]}://{rest}"
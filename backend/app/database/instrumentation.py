@@ -0,0 +1,142 @@
+import re
+import time
+from collections import Counter as ShapeCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.request_context import current_route
+
+logger = get_logger()
+
+QUERY_START_KEY = "query_start_times"
+
+REQUEST_QUERY_COUNT = Histogram(
+    "db_request_queries",
+    "SQL statements issued per request, by route",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+REQUEST_QUERY_TIME = Histogram(
+    "db_request_query_seconds",
+    "Time spent executing SQL per request, by route",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+SLOW_QUERIES = Counter("db_slow_queries_total", "Statements slower than DB_SLOW_QUERY_MS", ["route"])
+REPEATED_QUERIES = Counter(
+    "db_repeated_statement_total",
+    "Requests that repeated one statement shape past DB_N_PLUS_ONE_THRESHOLD",
+    ["route"],
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """Reduce a statement to its shape: literals and parameters become ?, IN lists collapse"""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _BIND_PARAM.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("IN (...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class RequestQueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    shapes: ShapeCounter = field(default_factory=ShapeCounter)
+    flagged_shapes: set = field(default_factory=set)
+
+
+# Stats of the request being handled; None outside a request (Celery, CLI)
+request_query_stats: ContextVar[RequestQueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+class SQLInstrumentation:
+    """
+    Cursor-level listeners timing every statement. Statements issued during a
+    request are attributed to it, statements slower than the threshold go to the
+    slow-query log, and a statement shape repeated past the N+1 threshold within
+    one request is reported once with the route.
+    """
+
+    def __init__(self, slow_query_ms: float, repeat_threshold: int):
+        self.slow_query_seconds = slow_query_ms / 1000
+        self.repeat_threshold = repeat_threshold
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine.sync_engine, "handle_error", self._on_error)
+
+    @staticmethod
+    def _before_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(QUERY_START_KEY, []).append(time.perf_counter())
+
+    @staticmethod
+    def _on_error(exception_context) -> None:
+        # after_cursor_execute does not run for a failed statement
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(QUERY_START_KEY):
+            conn.info[QUERY_START_KEY].pop()
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info[QUERY_START_KEY].pop()
+        stats = request_query_stats.get()
+        shape = None
+
+        if stats is not None:
+            shape = normalize_sql(statement)
+            stats.count += 1
+            stats.seconds += elapsed
+            stats.shapes[shape] += 1
+            if stats.shapes[shape] > self.repeat_threshold and shape not in stats.flagged_shapes:
+                stats.flagged_shapes.add(shape)
+                REPEATED_QUERIES.labels(route=current_route()).inc()
+                logger.warning(
+                    f"Possible N+1: {current_route()} ran the same statement "
+                    f"{stats.shapes[shape]} times: {shape[:300]}"
+                )
+
+        if elapsed >= self.slow_query_seconds:
+            route = current_route()
+            SLOW_QUERIES.labels(route=route).inc()
+            logger.bind(slow_query=True).warning(
+                f"Slow query {elapsed * 1000:.1f}ms on {route}: {shape or normalize_sql(statement)}"
+            )
+
+
+sql_instrumentation = SQLInstrumentation(
+    slow_query_ms=settings.DB_SLOW_QUERY_MS,
+    repeat_threshold=settings.DB_N_PLUS_ONE_THRESHOLD,
+)
+
+
+def start_request_stats() -> RequestQueryStats:
+    stats = RequestQueryStats()
+    request_query_stats.set(stats)
+    return stats
+
+
+def finish_request_stats(stats: RequestQueryStats, headers) -> None:
+    """Feed the per-route histograms; outside production also expose the numbers as headers"""
+    route = current_route()
+    REQUEST_QUERY_COUNT.labels(route=route).observe(stats.count)
+    REQUEST_QUERY_TIME.labels(route=route).observe(stats.seconds)
+
+    if settings.ENVIRONMENT != "production":
+        headers["X-DB-Query-Count"] = str(stats.count)
+        headers["X-DB-Time-Ms"] = f"{stats.seconds * 1000:.2f}"
@@ -0,0 +1,159 @@
+import heapq
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.request_context import current_route
+
+logger = get_logger()
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection (includes connecting on overflow)",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+POOL_HOLD_DURATION = Histogram(
+    "db_pool_hold_seconds",
+    "Time a connection stayed checked out, by route",
+    ["engine", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Connections currently checked out", ["engine"])
+POOL_OVERFLOW = Gauge("db_pool_overflow", "Connections open beyond pool_size", ["engine"])
+POOL_TIMEOUTS = Counter("db_pool_timeouts_total", "Checkouts that gave up after pool_timeout", ["engine"])
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times how long each checkout waits for a connection"""
+
+    telemetry: "PoolTelemetry | None" = None
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep reporting to the same telemetry
+        pool = super().recreate()
+        pool.telemetry = self.telemetry
+        return pool
+
+    def _do_get(self):
+        start_time = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            if self.telemetry is not None:
+                self.telemetry.record_timeout()
+            raise
+        finally:
+            if self.telemetry is not None:
+                self.telemetry.record_wait(time.perf_counter() - start_time)
+
+
+class PoolTelemetry:
+    """
+    Pool event listeners recording checkout wait, hold duration and overflow
+    usage, plus the longest holds seen and the routes that held them.
+    """
+
+    def __init__(self, name: str, hold_warning_seconds: float, longest_tracked: int):
+        self.name = name
+        self.hold_warning_seconds = hold_warning_seconds
+        self.longest_tracked = longest_tracked
+        self.engine: AsyncEngine | None = None
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.max_overflow_seen = 0
+        # min-heap of (hold seconds, route, finished at) keeping the longest holds
+        self._longest_holds: list[tuple[float, str, float]] = []
+
+    @property
+    def pool(self):
+        # Looked up each time because engine.dispose() replaces the pool
+        return self.engine.sync_engine.pool
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        if isinstance(self.pool, InstrumentedAsyncQueuePool):
+            self.pool.telemetry = self
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+
+    def record_wait(self, seconds: float) -> None:
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        POOL_CHECKOUT_WAIT.labels(engine=self.name).observe(seconds)
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+        POOL_TIMEOUTS.labels(engine=self.name).inc()
+        logger.error(f"Connection pool '{self.name}' exhausted; checkout for {current_route()} timed out")
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checkout_at"] = time.perf_counter()
+        connection_record.info["checkout_route"] = current_route()
+        self.checkouts += 1
+
+        pool = self.pool
+        overflow = max(pool.overflow(), 0)
+        self.max_overflow_seen = max(self.max_overflow_seen, overflow)
+        POOL_OVERFLOW.labels(engine=self.name).set(overflow)
+        POOL_CHECKED_OUT.labels(engine=self.name).set(pool.checkedout())
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        checkout_at = connection_record.info.pop("checkout_at", None)
+        route = connection_record.info.pop("checkout_route", "-")
+        if checkout_at is None:
+            return
+
+        held = time.perf_counter() - checkout_at
+        POOL_HOLD_DURATION.labels(engine=self.name, route=route).observe(held)
+        # The checked-in connection is still counted until this event returns
+        POOL_CHECKED_OUT.labels(engine=self.name).set(max(self.pool.checkedout() - 1, 0))
+
+        entry = (held, route, time.time())
+        if len(self._longest_holds) < self.longest_tracked:
+            heapq.heappush(self._longest_holds, entry)
+        elif held > self._longest_holds[0][0]:
+            heapq.heapreplace(self._longest_holds, entry)
+
+        if held >= self.hold_warning_seconds:
+            logger.warning(
+                f"Connection from pool '{self.name}' held for {held:.2f}s by {route}"
+            )
+
+    def longest_holds(self) -> list[dict]:
+        return [
+            {"seconds": round(held, 4), "route": route, "finished_at": finished_at}
+            for held, route, finished_at in sorted(self._longest_holds, reverse=True)
+        ]
+
+    def snapshot(self) -> dict:
+        pool = self.pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow_seen": self.max_overflow_seen,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait_seconds / self.checkouts * 1000, 3)
+            if self.checkouts
+            else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            "longest_holds": self.longest_holds(),
+        }
+
+
+def create_pool_telemetry(name: str) -> PoolTelemetry:
+    return PoolTelemetry(
+        name=name,
+        hold_warning_seconds=settings.DB_POOL_HOLD_WARNING_SECONDS,
+        longest_tracked=settings.DB_POOL_LONGEST_HOLDS_TRACKED,
+    )
@@ -0,0 +1,126 @@
+import asyncio
+import itertools
+import math
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+# Execution option marking a statement as safe to serve from a replica
+REPLICA_READ = {"read_replica": True}
+
+# session.info key set once the session has written; later reads stay on the primary
+PINNED_TO_PRIMARY_KEY = "pinned_to_primary"
+
+# session.info key: whether the last REPLICA_READ statement was served by a replica
+SERVED_BY_REPLICA_KEY = "served_by_replica"
+
+REPLICA_READS = Counter(
+    "db_replica_reads_total",
+    "Replica-eligible reads by the engine that served them",
+    ["target"],
+)
+REPLICA_LAG = Gauge("db_replica_lag_seconds", "Last measured replication lag", ["replica"])
+
+# Zero when the replica has replayed everything it received, so an idle primary
+# does not look like lag. A server that is not in recovery is treated as current.
+LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END AS lag
+    """
+)
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        # Unknown until the first check, so nothing is routed to an unchecked replica
+        self.lag_seconds = math.inf
+
+    async def measure_lag(self, timeout: float) -> float:
+        try:
+            async with asyncio.timeout(timeout):
+                async with self.engine.connect() as connection:
+                    result = await connection.execute(LAG_SQL)
+                    self.lag_seconds = float(result.scalar_one())
+        except Exception as e:
+            if math.isfinite(self.lag_seconds):
+                logger.warning(f"Replica '{self.name}' lag check failed, taking it out of rotation: {e}")
+            self.lag_seconds = math.inf
+
+        REPLICA_LAG.labels(replica=self.name).set(
+            self.lag_seconds if math.isfinite(self.lag_seconds) else -1
+        )
+        return self.lag_seconds
+
+
+class ReplicaSet:
+    """
+    Round-robin over the read replicas, skipping any whose last measured lag is
+    above max_lag_seconds. Lag is refreshed by a background task so choosing a
+    replica never costs a query. With no usable replica, reads go to the primary.
+    """
+
+    def __init__(self, replicas: list[Replica], max_lag_seconds: float, check_interval_seconds: float):
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._next = itertools.count()
+        self._monitor: asyncio.Task | None = None
+
+    def choose(self) -> AsyncEngine | None:
+        if self.replicas:
+            start = next(self._next)
+            for offset in range(len(self.replicas)):
+                replica = self.replicas[(start + offset) % len(self.replicas)]
+                if replica.lag_seconds <= self.max_lag_seconds:
+                    REPLICA_READS.labels(target=replica.name).inc()
+                    return replica.engine
+
+        REPLICA_READS.labels(target="primary").inc()
+        return None
+
+    async def refresh(self) -> None:
+        await asyncio.gather(
+            *(replica.measure_lag(timeout=self.check_interval_seconds) for replica in self.replicas)
+        )
+
+    async def _monitor_lag(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.check_interval_seconds)
+
+    def start(self) -> None:
+        if self.replicas and self._monitor is None:
+            self._monitor = asyncio.create_task(self._monitor_lag())
+
+    async def close(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+            self._monitor = None
+
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def status(self) -> list[dict]:
+        return [
+            {
+                "name": replica.name,
+                "lag_seconds": replica.lag_seconds if math.isfinite(replica.lag_seconds) else None,
+                "in_rotation": replica.lag_seconds <= self.max_lag_seconds,
+            }
+            for replica in self.replicas
+        ]
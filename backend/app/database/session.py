@@ -1,13 +1,23 @@
 import asyncio
 from typing import AsyncGenerator
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql import Executable
+from sqlmodel import Session
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.database.connection_guard import (
+    current_session,
+    observe_session_hold,
+    track_connection_holds,
+)
+from backend.app.database.instrumentation import sql_instrumentation
+from backend.app.database.pool_telemetry import InstrumentedAsyncQueuePool, create_pool_telemetry
+from backend.app.database.replicas import PINNED_TO_PRIMARY_KEY, SERVED_BY_REPLICA_KEY, Replica, ReplicaSet
+from backend.app.database.warmup import warm_up_engine
 
 logger = get_logger()
 
@@ -17,6 +27,9 @@ def load_models():
     try:
         # Import all your models here to ensure they are registered with SQLModel
         from backend.app.models.user import User
+        from backend.app.models.bank_account import BankAccount
+        from backend.app.models.transaction import Transaction
+        from backend.app.models.risk_score import RiskScore
 
         logger.info("All models imported successfully")
     except Exception as e:
@@ -24,23 +37,75 @@ def load_models():
         raise
 
 
-# Create async engine with connection pooling
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    poolclass=AsyncAdaptedQueuePool,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
-    echo=False,  # Set to True for SQL query logging in development
+def _create_engine(url: str):
+    # Connection pooling sized per environment in Settings
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        echo=False,  # Set to True for SQL query logging in development
+    )
+
+
+# Primary engine: all writes, and reads that are not marked for a replica
+engine = _create_engine(settings.DATABASE_URL)
+pool_telemetry = create_pool_telemetry("primary")
+pool_telemetry.instrument(engine)
+sql_instrumentation.instrument(engine)
+
+replica_set = ReplicaSet(
+    replicas=[
+        Replica(f"replica-{index}", _create_engine(url))
+        for index, url in enumerate(settings.DATABASE_REPLICA_URLS)
+    ],
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS,
 )
+replica_pool_telemetry = {}
+for replica in replica_set.replicas:
+    replica_pool_telemetry[replica.name] = create_pool_telemetry(replica.name)
+    replica_pool_telemetry[replica.name].instrument(replica.engine)
+    sql_instrumentation.instrument(replica.engine)
+
+
+class RoutingSession(Session):
+    """
+    Sends statements marked with REPLICA_READ to a replica. Once the session has
+    written anything (a flush or an INSERT/UPDATE/DELETE) it is pinned to the
+    primary, so a request always reads its own writes. SERVED_BY_REPLICA_KEY
+    records where the last replica-eligible statement actually ran.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        if clause is not None:
+            if getattr(clause, "is_dml", False):
+                self.info[PINNED_TO_PRIMARY_KEY] = True
+            elif clause.get_execution_options().get("read_replica"):
+                replica_engine = None if self.info.get(PINNED_TO_PRIMARY_KEY) else replica_set.choose()
+                self.info[SERVED_BY_REPLICA_KEY] = replica_engine is not None
+                if replica_engine is not None:
+                    return replica_engine.sync_engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_to_primary(session, flush_context):
+    session.info[PINNED_TO_PRIMARY_KEY] = True
+
+
+track_connection_holds(RoutingSession)
+
 
 # Create async session maker
 async_session = async_sessionmaker(
     engine,
     expire_on_commit=False,
-    class_=AsyncSession
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
 )
 
 
@@ -50,6 +115,8 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     Usage: session: AsyncSession = Depends(get_session)
     """
     session = async_session()
+    # Lets external awaits see whether this request still holds a connection
+    current_session.set(session)
     try:
         yield session
     except Exception as e:
@@ -68,6 +135,8 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
                 logger.debug("Database session closed successfully")
             except Exception as close_error:
                 logger.error(f"Error closing database session: {close_error}")
+            observe_session_hold(session)
+        current_session.set(None)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -120,6 +189,11 @@ async def init_db() -> None:
                 )
                 await asyncio.sleep(retry_delay * (attempt + 1))
 
+        if replica_set.replicas:
+            await replica_set.refresh()
+            replica_set.start()
+            logger.info(f"Read replicas: {replica_set.status()}")
+
         logger.info("Database initialization completed successfully")
 
     except Exception as e:
@@ -127,9 +201,22 @@ async def init_db() -> None:
         raise
 
 
+async def warm_up_pools(statements: list[Executable]) -> dict:
+    """Pre-open DB_POOL_WARMUP_CONNECTIONS on the primary and each replica in parallel"""
+    engines = {"primary": engine, **{replica.name: replica.engine for replica in replica_set.replicas}}
+    results = await asyncio.gather(
+        *(
+            warm_up_engine(target, settings.DB_POOL_WARMUP_CONNECTIONS, statements)
+            for target in engines.values()
+        )
+    )
+    return dict(zip(engines, results))
+
+
 async def close_db() -> None:
     """Close database connections and dispose engine"""
     try:
+        await replica_set.close()
         await engine.dispose()
         logger.info("Database connections closed successfully")
     except Exception as e:
@@ -153,15 +240,16 @@ async def database_health_check() -> dict:
         return {
             "status": "healthy",
             "response_time_ms": response_time,
-            "connection_pool": {
-                "size": engine.pool.size(),
-                "checked_in": engine.pool.checkedin(),
-                "checked_out": engine.pool.checkedout(),
-            }
+            "connection_pool": pool_telemetry.snapshot(),
+            "replicas": [
+                {**status, "connection_pool": replica_pool_telemetry[status["name"]].snapshot()}
+                for status in replica_set.status()
+            ],
         }
     except Exception as e:
         return {
             "status": "unhealthy",
             "error": str(e),
             "response_time_ms": None,
+            "connection_pool": pool_telemetry.snapshot(),
         }
\ No newline at end of file
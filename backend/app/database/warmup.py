@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import Executable
+
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+class Readiness:
+    """Whether this worker has finished warming up and should receive traffic"""
+
+    def __init__(self):
+        self.ready = False
+        self.details: dict = {}
+
+    def mark_ready(self, **details) -> None:
+        self.ready = True
+        self.details = details
+
+    def mark_not_ready(self, reason: str) -> None:
+        self.ready = False
+        self.details = {"reason": reason}
+
+
+readiness = Readiness()
+
+
+async def warm_up_engine(
+    engine: AsyncEngine,
+    connections: int,
+    statements: list[Executable],
+) -> dict:
+    """
+    Open `connections` pooled connections in parallel and run the hot statements
+    on each one. Every connection pays its TCP/TLS/auth handshake here rather than
+    on a user request, SQLAlchemy caches the compiled SQL on the first run, and
+    asyncpg prepares each statement in the connection's statement cache.
+
+    All connections are held until every one has opened, so the pool really
+    grows to `connections` instead of reusing the first.
+    """
+    connections = min(connections, engine.sync_engine.pool.size())
+    if connections <= 0:
+        return {"connections": 0, "seconds": 0.0}
+
+    all_open = asyncio.Barrier(connections)
+    start_time = time.perf_counter()
+
+    async def warm_connection() -> None:
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+                for statement in statements:
+                    await connection.execute(statement)
+                await connection.rollback()
+                await all_open.wait()
+        except Exception:
+            # Release the connections already waiting at the barrier
+            await all_open.abort()
+            raise
+
+    results = await asyncio.gather(
+        *(warm_connection() for _ in range(connections)), return_exceptions=True
+    )
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        # A failed connection breaks the barrier for the rest; report the root error
+        root = next(
+            (error for error in failures if not isinstance(error, asyncio.BrokenBarrierError)),
+            failures[0],
+        )
+        raise RuntimeError(f"Warm-up of {connections} connections failed: {root}") from root
+
+    elapsed = time.perf_counter() - start_time
+    logger.info(
+        f"Warmed {connections} connections with {len(statements)} statements in {elapsed:.2f}s"
+    )
+    return {"connections": connections, "seconds": round(elapsed, 3)}
@@ -0,0 +1 @@
+"""Deterministic synthetic data shared by the generator, benchmark and plan-check CLIs"""
@@ -0,0 +1,102 @@
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable
+
+
+class Checkpoint:
+    """
+    Completed chunk numbers of a generation run, rewritten atomically after each
+    chunk. The run parameters are stored with them, so resuming with different
+    ones is refused instead of producing overlapping rows.
+    """
+
+    def __init__(self, path: Path | None, params: dict):
+        self.path = path
+        self.params = params
+        self.done: set[int] = set()
+
+        if path is not None and path.exists():
+            saved = json.loads(path.read_text())
+            if saved["params"] != params:
+                raise ValueError(
+                    f"Checkpoint {path} was written for {saved['params']}, not {params}"
+                )
+            self.done = set(saved["done"])
+
+    def mark_done(self, chunk: int) -> None:
+        self.done.add(chunk)
+        if self.path is None:
+            return
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"params": self.params, "done": sorted(self.done)}))
+        os.replace(tmp_path, self.path)
+
+
+def run_chunks(
+    worker: Callable[..., int],
+    total: int,
+    chunk_size: int,
+    workers: int,
+    checkpoint_path: Path | None = None,
+    start_index: int = 0,
+    **worker_kwargs,
+) -> dict:
+    """
+    Split [start_index, start_index + total) into chunks and run
+    worker(start, stop, **worker_kwargs) for each one on a process pool.
+    Each worker streams its chunk with COPY and commits it on its own, so memory
+    stays flat and a killed run resumes from the checkpoint. Only `workers`
+    chunks are in flight at a time.
+    """
+    params = {
+        "worker": f"{worker.__module__}.{worker.__name__}",
+        "total": total,
+        "chunk_size": chunk_size,
+        "start_index": start_index,
+        # The DSN carries credentials and may differ between hosts; it is not a run parameter
+        **{key: value for key, value in worker_kwargs.items() if key != "dsn"},
+    }
+    checkpoint = Checkpoint(checkpoint_path, params)
+    chunk_count = -(-total // chunk_size)
+    pending_chunks = [chunk for chunk in range(chunk_count) if chunk not in checkpoint.done]
+    resumed_chunks = chunk_count - len(pending_chunks)
+
+    rows = 0
+    start_time = time.perf_counter()
+    # spawn keeps parent connections and loop state out of the workers
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        in_flight = {}
+        while pending_chunks or in_flight:
+            while pending_chunks and len(in_flight) < workers:
+                chunk = pending_chunks.pop(0)
+                start = start_index + chunk * chunk_size
+                stop = min(start + chunk_size, start_index + total)
+                in_flight[pool.submit(worker, start, stop, **worker_kwargs)] = chunk
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                chunk = in_flight.pop(future)
+                rows += future.result()
+                checkpoint.mark_done(chunk)
+                elapsed = time.perf_counter() - start_time
+                print(
+                    f"chunk {chunk + 1}/{chunk_count} done, "
+                    f"{rows} rows in {elapsed:.1f}s ({rows / elapsed:.0f} rows/s)",
+                    file=sys.stderr,
+                )
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        "rows": rows,
+        "chunks": chunk_count,
+        "resumed_chunks": resumed_chunks,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else None,
+    }
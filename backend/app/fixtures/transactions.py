@@ -0,0 +1,133 @@
+"""
+Synthetic Transaction rows between fixture users. Like the users, every value
+is derived from (seed, index), and the parties are fixture user indexes, so the
+rows reference users generated by backend.app.fixtures.users with the same seed.
+"""
+import hashlib
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+
+import psycopg
+from psycopg import sql
+
+from backend.app.fixtures.users import DEFAULT_SEED, user_id
+from backend.app.models import Transaction
+from backend.app.schema.bank_account import AccountCurrencySchema
+from backend.app.schema.transaction import (
+    TransactionChannelSchema,
+    TransactionStatusSchema,
+    TransactionTypeSchema,
+)
+
+TRANSACTION_COLUMNS = [column.name for column in Transaction.__table__.columns]
+
+TYPE_MIX = [
+    (150, TransactionTypeSchema.PAYMENT),
+    (220, TransactionTypeSchema.TRANSFER),
+    (240, TransactionTypeSchema.WITHDRAWAL),
+    (254, TransactionTypeSchema.DEPOSIT),
+    (256, TransactionTypeSchema.REVERSAL),
+]
+STATUS_MIX = [
+    (240, TransactionStatusSchema.COMPLETED),
+    (248, TransactionStatusSchema.PENDING),
+    (254, TransactionStatusSchema.FAILED),
+    (256, TransactionStatusSchema.REVERSED),
+]
+CHANNELS = list(TransactionChannelSchema)
+
+
+def _weighted(byte: int, mix: list):
+    for upper, value in mix:
+        if byte < upper:
+            return value
+    return mix[-1][1]
+
+
+def transaction_values(
+    index: int,
+    users: int,
+    start: datetime,
+    seconds_between: float,
+    seed: int = DEFAULT_SEED,
+) -> dict:
+    digest = hashlib.blake2b(f"txn:{seed}:{index}".encode(), digest_size=32).digest()
+    transaction_type = _weighted(digest[16], TYPE_MIX)
+    status = _weighted(digest[17], STATUS_MIX)
+    created_at = start + timedelta(seconds=index * seconds_between)
+
+    # Skewed towards low user indexes, so some users are far busier than others
+    sender = int.from_bytes(digest[18:22], "little") % users
+    sender = sender * sender // users
+    receiver = int.from_bytes(digest[22:26], "little") % users
+    # Log-uniform-ish amounts from 1.00 to about 10,000.00
+    amount = Decimal(100 * (1 + digest[26] % 100) * 10 ** (digest[27] % 3)) / Decimal(100)
+
+    has_sender = transaction_type != TransactionTypeSchema.DEPOSIT
+    has_receiver = transaction_type != TransactionTypeSchema.WITHDRAWAL
+
+    return {
+        "reference": f"FX{seed:02d}{index:012d}",
+        "amount": amount,
+        "currency": AccountCurrencySchema.USD,
+        "transaction_type": transaction_type,
+        "status": status,
+        "channel": CHANNELS[digest[28] % len(CHANNELS)],
+        "description": None,
+        "id": uuid.UUID(bytes=digest[:16], version=4),
+        "created_at": created_at,
+        "completed_at": created_at + timedelta(seconds=digest[29] % 30)
+        if status == TransactionStatusSchema.COMPLETED
+        else None,
+        "sender_id": user_id(sender, seed) if has_sender else None,
+        "receiver_id": user_id(receiver, seed) if has_receiver else None,
+        "processed_by": None,
+        "sender_account_id": None,
+        "receiver_account_id": None,
+    }
+
+
+def transaction_row(index: int, users: int, start: datetime, seconds_between: float, seed: int) -> tuple:
+    values = transaction_values(index, users, start, seconds_between, seed)
+    # SQLAlchemy Enum columns store the member name, not its value
+    return tuple(
+        value.name if isinstance(value, Enum) else value
+        for value in (values[column] for column in TRANSACTION_COLUMNS)
+    )
+
+
+def copy_transaction_chunk(
+    start: int,
+    stop: int,
+    dsn: str,
+    users: int,
+    start_at: str,
+    seconds_between: float,
+    seed: int = DEFAULT_SEED,
+) -> int:
+    """COPY transactions [start, stop) in one transaction. Runs in a worker process."""
+    start_time = datetime.fromisoformat(start_at)
+    first = transaction_values(start, users, start_time, seconds_between, seed)
+    copy_statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(Transaction.__tablename__),
+        sql.SQL(", ").join(sql.Identifier(column) for column in TRANSACTION_COLUMNS),
+    )
+    with psycopg.connect(dsn) as connection:
+        # Committed before the checkpoint recorded it; the partition key keeps this lookup cheap
+        exists = connection.execute(
+            'SELECT 1 FROM "transaction" WHERE id = %s AND created_at = %s',
+            (first["id"], first["created_at"]),
+        ).fetchone()
+        if exists:
+            return 0
+
+        with connection.cursor() as cursor:
+            with cursor.copy(copy_statement) as copy:
+                for index in range(start, stop):
+                    copy.write_row(
+                        transaction_row(index, users, start_time, seconds_between, seed)
+                    )
+        connection.commit()
+    return stop - start
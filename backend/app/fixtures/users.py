@@ -0,0 +1,163 @@
+"""
+Synthetic User rows. Every value is derived from (seed, index) alone, so any
+index range can be regenerated identically in any process: resumed runs
+recreate exactly the rows they skipped, and other fixtures can compute a
+user's id from its index without reading the table.
+"""
+import hashlib
+import uuid
+from datetime import datetime, timedelta, timezone
+from functools import cache
+
+import psycopg
+from psycopg import sql
+
+from backend.app.auth.utils import hash_password
+from backend.app.core.config import settings
+from backend.app.models import User
+from backend.app.schema.otp_question import (
+    AccountStatusSchema,
+    RoleChoicesSchema,
+    SecurityQuestionsSchema,
+)
+
+DEFAULT_SEED = 1
+# id_no values well above anything registered by hand
+ID_NO_OFFSET = 1_000_000_000
+# Every generated user logs in with this password
+FIXTURE_PASSWORD = "Fixture-Password-1"
+FIXTURE_EMAIL_DOMAIN = "fixtures.invalid"
+# Signup times rise with the index: 100M users span about five years
+SIGNUP_EPOCH = datetime(2021, 1, 1, tzinfo=timezone.utc)
+SECONDS_BETWEEN_SIGNUPS = 1.5
+
+USER_COLUMNS = [column.name for column in User.__table__.columns]
+# SQLAlchemy Enum columns store the member name, not its value
+ENUM_COLUMNS = {"security_question", "account_status", "role"}
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "Amina", "Wanjiru", "Kofi", "Chen", "Priya", "Mateo",
+    "Sofia", "Omar", "Fatima", "Hiroshi", "Olga", "Lucas", "Zanele", "Ines",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Otieno", "Mwangi", "Okafor", "Wang", "Patel", "Rodriguez", "Kim", "Nguyen",
+    "Ivanova", "Silva", "Dlamini", "Mensah", "Haddad", "Kowalski", "Tanaka", "Rossi",
+]
+ANSWERS = ["blue", "green", "nairobi", "lagos", "alex", "sam", "maria", "paris"]
+
+# (upper bound out of 256, value): weighted choices driven by one digest byte
+STATUS_MIX = [
+    (218, AccountStatusSchema.ACTIVE),    # ~85%
+    (238, AccountStatusSchema.PENDING),   # ~8%
+    (248, AccountStatusSchema.INACTIVE),  # ~4%
+    (256, AccountStatusSchema.LOCKED),    # ~3%
+]
+ROLE_MIX = [
+    (250, RoleChoicesSchema.CUSTOMER),
+    (252, RoleChoicesSchema.TELLER),
+    (254, RoleChoicesSchema.ACCOUNT_EXECUTIVE),
+    (255, RoleChoicesSchema.BRANCH_MANAGER),
+    (256, RoleChoicesSchema.ADMIN),
+]
+SECURITY_QUESTIONS = list(SecurityQuestionsSchema)
+
+
+def _weighted(byte: int, mix: list):
+    for upper, value in mix:
+        if byte < upper:
+            return value
+    return mix[-1][1]
+
+
+def _base36(number: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    encoded = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        encoded = digits[remainder] + encoded
+        if not number:
+            return encoded
+
+
+def _digest(seed: int, index: int) -> bytes:
+    return hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=32).digest()
+
+
+def user_id(index: int, seed: int = DEFAULT_SEED) -> uuid.UUID:
+    return uuid.UUID(bytes=_digest(seed, index)[:16], version=4)
+
+
+@cache
+def fixture_password_hash() -> str:
+    # One real bcrypt hash reused for every row; hashing per row would dominate the run
+    return hash_password(FIXTURE_PASSWORD)
+
+
+def user_values(index: int, seed: int = DEFAULT_SEED) -> dict:
+    digest = _digest(seed, index)
+    first_name = FIRST_NAMES[digest[16] % len(FIRST_NAMES)]
+    last_name = LAST_NAMES[digest[17] % len(LAST_NAMES)]
+    middle_name = FIRST_NAMES[digest[18] % len(FIRST_NAMES)] if digest[19] < 64 else None
+    status = _weighted(digest[20], STATUS_MIX)
+    created_at = SIGNUP_EPOCH + timedelta(seconds=index * SECONDS_BETWEEN_SIGNUPS)
+    locked = status == AccountStatusSchema.LOCKED
+
+    return {
+        "id": uuid.UUID(bytes=digest[:16], version=4),
+        # The index keeps username, email and id_no unique; base36 keeps usernames within 12 chars
+        "username": f"{first_name[:4].lower()}{_base36(index)}",
+        "email": f"{first_name.lower()}.{last_name.lower()}.{index}@{FIXTURE_EMAIL_DOMAIN}",
+        "first_name": first_name,
+        "middle_name": middle_name,
+        "last_name": last_name,
+        "id_no": ID_NO_OFFSET + index,
+        "is_active": status in (AccountStatusSchema.ACTIVE, AccountStatusSchema.LOCKED),
+        "is_superuser": False,
+        "security_question": SECURITY_QUESTIONS[digest[22] % len(SECURITY_QUESTIONS)],
+        "security_answer": ANSWERS[digest[23] % len(ANSWERS)],
+        "account_status": status,
+        "role": _weighted(digest[24], ROLE_MIX),
+        "hashed_password": fixture_password_hash(),
+        "failed_login_attempts": settings.LOGIN_ATTEMPTS if locked else digest[25] % 2,
+        "last_failed_login": created_at + timedelta(days=digest[26]) if locked else None,
+        "otp": "",
+        "otp_expiry_time": None,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+def user_row(index: int, seed: int = DEFAULT_SEED) -> tuple:
+    """user_values() in USER_COLUMNS order, with enums as the names Postgres stores"""
+    values = user_values(index, seed)
+    return tuple(
+        values[column].name if column in ENUM_COLUMNS else values[column]
+        for column in USER_COLUMNS
+    )
+
+
+def copy_user_chunk(start: int, stop: int, dsn: str, seed: int = DEFAULT_SEED) -> int:
+    """
+    COPY users [start, stop) in one transaction. Runs in a worker process.
+    A chunk whose first row already exists committed before the checkpoint
+    recorded it, so it is skipped rather than failing on the unique keys.
+    """
+    copy_statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(User.__tablename__),
+        sql.SQL(", ").join(sql.Identifier(column) for column in USER_COLUMNS),
+    )
+    with psycopg.connect(dsn) as connection:
+        exists = connection.execute(
+            'SELECT 1 FROM "user" WHERE id = %s', (user_id(start, seed),)
+        ).fetchone()
+        if exists:
+            return 0
+
+        with connection.cursor() as cursor:
+            with cursor.copy(copy_statement) as copy:
+                for index in range(start, stop):
+                    copy.write_row(user_row(index, seed))
+        connection.commit()
+    return stop - start
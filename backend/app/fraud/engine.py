@@ -0,0 +1,205 @@
+import math
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+from prometheus_client import Counter, Histogram
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.fraud.features import FEATURE_NAMES, AccountFeatureStore, counterparty_key
+from backend.app.fraud.registry import ModelArtifact, ModelRegistry, model_registry
+from backend.app.schema.fraud import FraudDecisionSchema
+
+logger = get_logger()
+
+# Name of the scoring model in the model registry
+FRAUD_MODEL_NAME = "fraud-scoring"
+# A feature is reported as a reason once it adds this much to the log-odds
+REASON_MIN_CONTRIBUTION = 0.5
+# Beyond this the sigmoid is 0 or 1 to double precision; clamping keeps
+# math.exp from overflowing on extreme weights or features
+MAX_LOG_ODDS = 500.0
+
+FRAUD_SCORE_SECONDS = Histogram(
+    "fraud_score_seconds",
+    "Time to compute one in-process fraud score",
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025),
+)
+FRAUD_DECISIONS = Counter("fraud_decisions_total", "Fraud scoring decisions", ["decision"])
+_DECISION_COUNTERS = {decision: FRAUD_DECISIONS.labels(decision=decision.value) for decision in FraudDecisionSchema}
+
+
+@dataclass(frozen=True)
+class ScoringModel:
+    """Logistic model over the FEATURE_NAMES vector: score = sigmoid(bias + weights . features)"""
+
+    version: str
+    weights: tuple[float, ...]
+    bias: float
+    review_threshold: float = settings.FRAUD_REVIEW_THRESHOLD
+    decline_threshold: float = settings.FRAUD_DECLINE_THRESHOLD
+
+    def __post_init__(self):
+        if len(self.weights) != len(FEATURE_NAMES):
+            raise ValueError(f"Model {self.version} has {len(self.weights)} weights, expected {len(FEATURE_NAMES)}")
+
+    @classmethod
+    def from_artifact(cls, artifact: ModelArtifact) -> "ScoringModel":
+        if artifact.meta.get("features") != list(FEATURE_NAMES):
+            raise ValueError(f"Model {artifact.version} was trained on {artifact.meta.get('features')}, not {FEATURE_NAMES}")
+        return cls(
+            version=artifact.version,
+            # Five floats: the pure-Python hot path is faster on a tuple than on the mapped array
+            weights=tuple(float(weight) for weight in artifact.arrays["weights"]),
+            bias=float(artifact.meta["bias"]),
+            review_threshold=float(artifact.meta.get("review_threshold", settings.FRAUD_REVIEW_THRESHOLD)),
+            decline_threshold=float(artifact.meta.get("decline_threshold", settings.FRAUD_DECLINE_THRESHOLD)),
+        )
+
+    def artifact_contents(self) -> tuple[dict, dict]:
+        """Arrays and metadata to publish this model with ModelRegistry.publish"""
+        arrays = {"weights": np.asarray(self.weights, dtype=np.float64)}
+        meta = {
+            "features": list(FEATURE_NAMES),
+            "bias": self.bias,
+            "review_threshold": self.review_threshold,
+            "decline_threshold": self.decline_threshold,
+        }
+        return arrays, meta
+
+    def evaluate(self, features: tuple[float, ...]) -> tuple[float, list[float]]:
+        contributions = [weight * value for weight, value in zip(self.weights, features)]
+        log_odds = max(-MAX_LOG_ODDS, min(MAX_LOG_ODDS, self.bias + sum(contributions)))
+        return 1.0 / (1.0 + math.exp(-log_odds)), contributions
+
+    def decide(self, score: float) -> FraudDecisionSchema:
+        if score >= self.decline_threshold:
+            return FraudDecisionSchema.DECLINE
+        if score >= self.review_threshold:
+            return FraudDecisionSchema.REVIEW
+        return FraudDecisionSchema.APPROVE
+
+
+# Hand-tuned starting point: a quiet account scores ~0.02; once an account has
+# MIN_HISTORY transactions, a large payment to a new payee lands in review, or is
+# declined when it follows other activity within the hour. Below MIN_HISTORY there
+# is no amount or new-payee signal, so a brand-new account's first payments score
+# ~0.03 and are approved however large: this model does not cover cold-start fraud.
+DEFAULT_MODEL = ScoringModel(
+    version="baseline-1",
+    weights=(1.2, 0.4, 0.45, 1.1, 0.6),
+    bias=-4.0,
+)
+
+
+@dataclass
+class FraudScore:
+    score: float
+    decision: FraudDecisionSchema
+    reasons: list[str]
+    features: dict[str, float]
+    model_version: str
+    latency_ms: float = field(default=0.0)
+
+
+class FraudScoringEngine:
+    """
+    Scores a transaction against its sender's recent history without leaving
+    the process: the engine makes no database, Redis or network call itself.
+    Callers pass the sender's shared 1h/24h counts from the online feature
+    store when they have them, so velocity agrees across every worker; amount
+    and counterparty features always come from the in-process window.
+    Scoring is synchronous and never awaits, so on the event loop the
+    read-features / record-transaction pair cannot interleave with another request.
+
+    With a registry, the model is the CURRENT version of FRAUD_MODEL_NAME,
+    picked up without a restart when a new one is activated; until a version
+    is published, or if the published one is unusable, default_model is used.
+    """
+
+    def __init__(
+        self,
+        store: AccountFeatureStore,
+        default_model: ScoringModel = DEFAULT_MODEL,
+        registry: ModelRegistry | None = None,
+    ):
+        self.store = store
+        self.default_model = default_model
+        self.registry = registry
+        self._artifact: ModelArtifact | None = None
+        self._model = default_model
+
+    @property
+    def model(self) -> ScoringModel:
+        artifact = self.registry.get(FRAUD_MODEL_NAME) if self.registry is not None else None
+        if artifact is not None and artifact is not self._artifact:
+            self._artifact = artifact
+            try:
+                self._model = ScoringModel.from_artifact(artifact)
+            except (KeyError, ValueError) as e:
+                logger.error(f"Ignoring {FRAUD_MODEL_NAME} model {artifact.version}, serving {self._model.version}: {e}")
+        return self._model
+
+    def score(
+        self,
+        sender_id: uuid.UUID,
+        amount: float,
+        receiver_id: uuid.UUID | None = None,
+        occurred_at: datetime | None = None,
+        record: bool = True,
+        shared_features: dict[str, float] | None = None,
+    ) -> FraudScore:
+        """
+        Declined transactions are recorded too: repeated attempts are exactly
+        the velocity signal the next score should see. shared_features is the
+        sender's online feature store entry (WINDOW_FEATURE_NAMES).
+        """
+        start_time = time.perf_counter()
+        model = self.model
+        timestamp = occurred_at.timestamp() if occurred_at is not None else time.time()
+        counterparty = counterparty_key(receiver_id)
+
+        window = self.store.window(sender_id)
+        velocity = (
+            (shared_features["count_1h"], shared_features["count_24h"]) if shared_features is not None else None
+        )
+        features = self.store.features(window, timestamp, amount, counterparty, velocity)
+        score, contributions = model.evaluate(features)
+        decision = model.decide(score)
+        if record:
+            window.append(timestamp, amount, counterparty)
+
+        reasons = [
+            name
+            for contribution, name in sorted(zip(contributions, FEATURE_NAMES), reverse=True)
+            if contribution >= REASON_MIN_CONTRIBUTION
+        ]
+        elapsed = time.perf_counter() - start_time
+        FRAUD_SCORE_SECONDS.observe(elapsed)
+        _DECISION_COUNTERS[decision].inc()
+
+        return FraudScore(
+            score=round(score, 4),
+            decision=decision,
+            reasons=reasons,
+            features=dict(zip(FEATURE_NAMES, features)),
+            model_version=model.version,
+            latency_ms=round(elapsed * 1000, 3),
+        )
+
+    def status(self) -> dict:
+        return {
+            "model_version": self.model.version,
+            "tracked_accounts": len(self.store),
+            "max_accounts": self.store.max_accounts,
+            "window_size": self.store.window_size,
+        }
+
+
+fraud_engine = FraudScoringEngine(
+    AccountFeatureStore(settings.FRAUD_WINDOW_SIZE, settings.FRAUD_MAX_ACCOUNTS),
+    registry=model_registry,
+)
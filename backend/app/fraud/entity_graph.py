@@ -0,0 +1,495 @@
+"""
+In-memory graph linking users that share identifying attributes: normalized
+email, company email domain, name, id_no block, registration IP and device.
+
+Users and attributes are interned to integer indexes and everything else is
+flat array('i') storage: union-find parent/size arrays give each user's
+connected component in near-constant time, and user <-> attribute edges are
+two singly linked lists threaded through the same edge arrays.
+
+Only strong identifiers (normalized email, device) merge components. Weak
+ones (email domain, name, id_no block, IP) are kept as edges, so
+linked_users() still reports them, but union-find never follows them:
+merged transitively they would chain unrelated people into one giant
+component. An attribute shared by more than max_degree users (a busy office
+IP, a large employer's domain) is treated as noise: it stops linking and is
+excluded outright after the next rebuild, which counts degrees before linking.
+
+Each worker holds its own copy. The worker that handles a registration adds
+it immediately and journals it; every worker reloads the snapshot written by
+the periodic rebuild in a background thread. A snapshot carries the wall-clock
+watermark at which the rebuild started reading Postgres, and journaled
+registrations from after it are replayed onto the new graph, so users who
+signed up while the rebuild ran are not lost. IP and device links exist only
+in the graph of the worker that saw the registration, since neither is stored
+in Postgres; they survive reloads until the registration is older than a
+snapshot's watermark.
+"""
+import asyncio
+import multiprocessing
+import os
+import re
+import time
+import uuid
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import psycopg
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+# Domains shared by millions of unrelated people never link anyone
+FREE_EMAIL_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "googlemail.com",
+        "yahoo.com",
+        "outlook.com",
+        "hotmail.com",
+        "live.com",
+        "icloud.com",
+        "aol.com",
+        "proton.me",
+        "protonmail.com",
+    }
+)
+# The only attributes that merge components; "email:" does not match "email_domain:"
+STRONG_ATTRIBUTE_PREFIXES = ("email:", "device:")
+# Providers that deliver local+tag to local; elsewhere the tag may be a different mailbox
+PLUS_ADDRESSING_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "googlemail.com",
+        "outlook.com",
+        "hotmail.com",
+        "live.com",
+        "icloud.com",
+        "proton.me",
+        "protonmail.com",
+        "fastmail.com",
+    }
+)
+# Only Gmail ignores dots in the local part
+DOTLESS_DOMAINS = frozenset({"gmail.com", "googlemail.com"})
+_NON_LETTERS = re.compile(r"[^a-z]+")
+NO_EDGE = -1
+# Registrations each worker remembers for replay onto the next snapshot
+JOURNAL_MAX_ENTRIES = 100_000
+# Tolerated clock difference between the rebuilding host and API workers;
+# replaying a little too much is harmless, add_user is idempotent
+JOURNAL_SKEW_SECONDS = 300.0
+
+
+def user_attributes(
+    email: str | None,
+    first_name: str | None,
+    last_name: str | None,
+    id_no: int | None,
+) -> list[str]:
+    """Link keys from stored User fields, normalized so near-duplicates collide"""
+    attributes = []
+    if email:
+        local, _, domain = email.strip().lower().partition("@")
+        # Fold only what the provider itself ignores: email: merges clusters, and
+        # j.smith@ and jsmith@ at a company are usually two different people
+        if domain in PLUS_ADDRESSING_DOMAINS:
+            local = local.split("+", 1)[0]
+        if domain in DOTLESS_DOMAINS:
+            local = local.replace(".", "")
+            domain = "gmail.com"
+        attributes.append(f"email:{local}@{domain}")
+        if domain and domain not in FREE_EMAIL_DOMAINS:
+            attributes.append(f"email_domain:{domain}")
+    names = sorted(filter(None, (_NON_LETTERS.sub("", (name or "").lower()) for name in (first_name, last_name))))
+    if len(names) == 2:
+        # Sorted, so swapped first and last names collide
+        attributes.append(f"name:{names[0]}|{names[1]}")
+    if id_no is not None:
+        # Fabricated ids tend to come in runs of consecutive numbers
+        attributes.append(f"id_block:{int(id_no) // settings.ENTITY_GRAPH_ID_NO_BLOCK}")
+    return attributes
+
+
+def request_attributes(ip: str | None = None, device_id: str | None = None) -> list[str]:
+    """Link keys from the registration request; these are not stored in Postgres"""
+    attributes = []
+    if ip and ip != "unknown":
+        attributes.append(f"ip:{ip}")
+    if device_id:
+        attributes.append(f"device:{device_id.strip()[:128]}")
+    return attributes
+
+
+@dataclass
+class ClusterInfo:
+    user_id: uuid.UUID
+    cluster_id: uuid.UUID
+    size: int
+
+
+class EntityGraph:
+    def __init__(self, max_degree: int):
+        self.max_degree = max_degree
+        # Epoch seconds the rebuild started reading users; 0 for a graph built incrementally
+        self.watermark = 0.0
+        self.user_index: dict[uuid.UUID, int] = {}
+        self.user_ids: list[uuid.UUID] = []
+        self.attribute_index: dict[str, int] = {}
+        self.attribute_keys: list[str] = []
+        # Attributes known to exceed max_degree; counted but never linked
+        self.blocked: set[int] = set()
+
+        # Union-find over user indexes
+        self.parent = array("i")
+        self.size = array("i")
+        self.user_head = array("i")
+        # Per attribute: the first user linked through it (strong attributes
+        # only), and how many users have it
+        self.anchor = array("i")
+        self.degree = array("i")
+        self.attribute_head = array("i")
+        # Edge e joins edge_user[e] and edge_attribute[e]
+        self.edge_user = array("i")
+        self.edge_attribute = array("i")
+        self.next_user_edge = array("i")
+        self.next_attribute_edge = array("i")
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    def _intern_user(self, user_id: uuid.UUID) -> int:
+        index = self.user_index.get(user_id)
+        if index is None:
+            index = self.user_index[user_id] = len(self.user_ids)
+            self.user_ids.append(user_id)
+            self.parent.append(index)
+            self.size.append(1)
+            self.user_head.append(NO_EDGE)
+        return index
+
+    def _intern_attribute(self, key: str) -> int:
+        index = self.attribute_index.get(key)
+        if index is None:
+            index = self.attribute_index[key] = len(self.attribute_keys)
+            self.attribute_keys.append(key)
+            self.anchor.append(NO_EDGE)
+            self.degree.append(0)
+            self.attribute_head.append(NO_EDGE)
+        return index
+
+    def find(self, user: int) -> int:
+        parent = self.parent
+        while parent[user] != user:
+            # Path halving keeps trees flat without a second pass
+            parent[user] = parent[parent[user]]
+            user = parent[user]
+        return user
+
+    def union(self, first: int, second: int) -> int:
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return first
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+        return first
+
+    def _has_edge(self, user: int, attribute: int) -> bool:
+        edge = self.user_head[user]
+        while edge != NO_EDGE:
+            if self.edge_attribute[edge] == attribute:
+                return True
+            edge = self.next_user_edge[edge]
+        return False
+
+    def add_user(self, user_id: uuid.UUID, attributes: Iterable[str]) -> int:
+        """
+        Add a user, or new attributes of a known one, and merge its component
+        through strong attributes; returns the user index
+        """
+        user = self._intern_user(user_id)
+        for key in attributes:
+            attribute = self._intern_attribute(key)
+            if self._has_edge(user, attribute):
+                continue
+            self.degree[attribute] += 1
+            if attribute in self.blocked or self.degree[attribute] > self.max_degree:
+                continue
+
+            edge = len(self.edge_user)
+            self.edge_user.append(user)
+            self.edge_attribute.append(attribute)
+            self.next_user_edge.append(self.user_head[user])
+            self.next_attribute_edge.append(self.attribute_head[attribute])
+            self.user_head[user] = edge
+            self.attribute_head[attribute] = edge
+
+            if not key.startswith(STRONG_ATTRIBUTE_PREFIXES):
+                continue
+            if self.anchor[attribute] == NO_EDGE:
+                self.anchor[attribute] = user
+            else:
+                self.union(user, self.anchor[attribute])
+        return user
+
+    def cluster(self, user_id: uuid.UUID) -> ClusterInfo | None:
+        user = self.user_index.get(user_id)
+        if user is None:
+            return None
+        root = self.find(user)
+        return ClusterInfo(user_id, self.user_ids[root], self.size[root])
+
+    def linked_users(self, user_id: uuid.UUID, limit: int = 50) -> dict[uuid.UUID, list[str]]:
+        """Users sharing a linking attribute with this one, and which attributes they share"""
+        user = self.user_index.get(user_id)
+        if user is None:
+            return {}
+        linked: dict[uuid.UUID, list[str]] = {}
+        edge = self.user_head[user]
+        while edge != NO_EDGE:
+            attribute = self.edge_attribute[edge]
+            if self.degree[attribute] <= self.max_degree and attribute not in self.blocked:
+                other_edge = self.attribute_head[attribute]
+                while other_edge != NO_EDGE:
+                    other = self.edge_user[other_edge]
+                    if other != user:
+                        linked.setdefault(self.user_ids[other], []).append(self.attribute_keys[attribute])
+                        if len(linked) >= limit:
+                            return linked
+                    other_edge = self.next_attribute_edge[other_edge]
+            edge = self.next_user_edge[edge]
+        return linked
+
+    def stats(self) -> dict:
+        roots = Counter(self.find(user) for user in range(len(self.user_ids)))
+        multi = [size for size in roots.values() if size > 1]
+        return {
+            "users": len(self.user_ids),
+            "attributes": len(self.attribute_keys),
+            "edges": len(self.edge_user),
+            "hub_attributes": sum(
+                1
+                for attribute, degree in enumerate(self.degree)
+                if degree > self.max_degree or attribute in self.blocked
+            ),
+            "components": len(roots),
+            "linked_components": len(multi),
+            "largest_component": max(multi, default=1),
+        }
+
+    _INT_ARRAYS = (
+        "parent", "size", "user_head", "anchor", "degree", "attribute_head",
+        "edge_user", "edge_attribute", "next_user_edge", "next_attribute_edge",
+    )
+
+    def save(self, path: Path) -> None:
+        """Write every array to one .npz, replacing the previous snapshot atomically"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}")
+        with open(tmp_path, "wb") as snapshot:
+            np.savez(
+                snapshot,
+                max_degree=np.int64(self.max_degree),
+                watermark=np.float64(self.watermark),
+                user_ids=np.frombuffer(b"".join(user_id.bytes for user_id in self.user_ids), dtype="V16"),
+                # Keys never contain a newline: they are normalized, and headers cannot carry one
+                attribute_keys=np.frombuffer("\n".join(self.attribute_keys).encode("utf-8"), dtype=np.uint8),
+                blocked=np.fromiter(self.blocked, dtype=np.int32, count=len(self.blocked)),
+                **{name: np.frombuffer(getattr(self, name), dtype=np.int32) for name in self._INT_ARRAYS},
+            )
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "EntityGraph":
+        with np.load(path) as snapshot:
+            graph = cls(int(snapshot["max_degree"]))
+            if "watermark" in snapshot.files:
+                graph.watermark = float(snapshot["watermark"])
+            for name in cls._INT_ARRAYS:
+                getattr(graph, name).frombytes(snapshot[name].astype(np.int32).tobytes())
+            raw_ids = snapshot["user_ids"].tobytes()
+            graph.user_ids = [uuid.UUID(bytes=raw_ids[offset : offset + 16]) for offset in range(0, len(raw_ids), 16)]
+            keys = snapshot["attribute_keys"].tobytes().decode("utf-8")
+            graph.attribute_keys = keys.split("\n") if keys else []
+            graph.blocked = set(snapshot["blocked"].tolist())
+        graph.user_index = {user_id: index for index, user_id in enumerate(graph.user_ids)}
+        graph.attribute_index = {key: index for index, key in enumerate(graph.attribute_keys)}
+        return graph
+
+
+USER_SLICE_SQL = 'SELECT id, email, first_name, last_name, id_no FROM "user" WHERE id >= %s'
+
+
+def _read_user_slice(dsn: str, lower: int, upper: int | None) -> tuple[bytes, list[list[str]]]:
+    """
+    Users whose id falls in [lower, upper) as packed 16-byte ids and their
+    attribute keys. Runs in a worker; the primary key index serves the range.
+    """
+    query, params = USER_SLICE_SQL, [uuid.UUID(int=lower)]
+    if upper is not None:
+        query, params = f"{query} AND id < %s", [*params, uuid.UUID(int=upper)]
+
+    ids, attributes = [], []
+    with psycopg.connect(dsn) as connection:
+        with connection.cursor(name="entity_graph_slice") as cursor:
+            cursor.itersize = 10_000
+            cursor.execute(query, params)
+            for user_id, email, first_name, last_name, id_no in cursor:
+                ids.append(user_id.bytes)
+                attributes.append(user_attributes(email, first_name, last_name, id_no))
+    return b"".join(ids), attributes
+
+
+def rebuild_from_postgres(dsn: str, workers: int, max_degree: int, processes: bool = True) -> tuple[EntityGraph, dict]:
+    """
+    Read users in parallel slices of the UUID space and link them. Degrees are
+    counted over every user first, so hub attributes are blocked before they
+    can merge anything. processes=False uses threads, for callers such as
+    Celery prefork children that may not fork.
+    """
+    started_at = time.perf_counter()
+    # Users created after this may be missing from the slices; workers replay them
+    watermark = time.time()
+    slices = workers * 4
+    bounds = [(index << 128) // slices for index in range(slices)] + [None]
+    if processes:
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    with executor:
+        results = list(executor.map(_read_user_slice, [dsn] * slices, bounds[:-1], bounds[1:]))
+    read_seconds = time.perf_counter() - started_at
+
+    degrees = Counter(key for _, attributes in results for keys in attributes for key in keys)
+    graph = EntityGraph(max_degree)
+    graph.watermark = watermark
+    graph.blocked = {
+        graph._intern_attribute(key) for key, degree in degrees.items() if degree > max_degree
+    }
+    for raw_ids, attributes in results:
+        for offset, keys in zip(range(0, len(raw_ids), 16), attributes):
+            graph.add_user(uuid.UUID(bytes=raw_ids[offset : offset + 16]), keys)
+
+    report = {
+        **graph.stats(),
+        "read_seconds": round(read_seconds, 3),
+        "link_seconds": round(time.perf_counter() - started_at - read_seconds, 3),
+    }
+    return graph, report
+
+
+class EntityGraphService:
+    """
+    The worker's current graph. A background task re-checks the snapshot's
+    mtime every check_interval_seconds and loads a changed snapshot in a
+    thread, so the event loop never waits on it; the swap is one reference
+    assignment, so a lookup never sees a half-loaded graph. Users added since
+    the snapshot's watermark are replayed onto it from the worker's journal
+    before the swap; older journal entries are already in the snapshot and
+    are dropped.
+    """
+
+    def __init__(self, snapshot_path: str | Path, max_degree: int, check_interval_seconds: float):
+        self.snapshot_path = Path(snapshot_path)
+        self.check_interval_seconds = check_interval_seconds
+        self.graph = EntityGraph(max_degree)
+        self._snapshot_mtime: int | None = None
+        self._journal: deque[tuple[float, uuid.UUID, list[str]]] = deque(maxlen=JOURNAL_MAX_ENTRIES)
+        self._loading = False
+        self._watcher: asyncio.Task | None = None
+
+    async def refresh(self) -> bool:
+        """Swap in the snapshot if it changed since the last load"""
+        try:
+            mtime = self.snapshot_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._snapshot_mtime or self._loading:
+            return False
+
+        start_time = time.perf_counter()
+        self._loading = True
+        try:
+            graph = await asyncio.to_thread(EntityGraph.load, self.snapshot_path)
+        finally:
+            self._loading = False
+        # No await between the replay and the swap, so nothing is missed
+        cutoff = graph.watermark - JOURNAL_SKEW_SECONDS
+        while self._journal and self._journal[0][0] < cutoff:
+            self._journal.popleft()
+        for _, user_id, attributes in self._journal:
+            graph.add_user(user_id, attributes)
+        self.graph, self._snapshot_mtime = graph, mtime
+        logger.info(
+            f"Loaded entity graph snapshot with {len(graph)} users in "
+            f"{(time.perf_counter() - start_time) * 1000:.1f} ms, "
+            f"replayed {len(self._journal)} recent registrations"
+        )
+        return True
+
+    async def _watch_snapshot(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Could not load entity graph snapshot {self.snapshot_path}: {e}")
+
+    def start(self) -> None:
+        if self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch_snapshot())
+
+    async def close(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+
+    def add_user(self, user_id: uuid.UUID, attributes: Iterable[str]) -> ClusterInfo:
+        attributes = list(attributes)
+        self._journal.append((time.time(), user_id, attributes))
+        graph = self.graph
+        graph.add_user(user_id, attributes)
+        return graph.cluster(user_id)
+
+    def cluster(self, user_id: uuid.UUID) -> ClusterInfo | None:
+        return self.graph.cluster(user_id)
+
+    def linked_users(self, user_id: uuid.UUID, limit: int = 50) -> dict[uuid.UUID, list[str]]:
+        return self.graph.linked_users(user_id, limit)
+
+    def save_snapshot(self) -> None:
+        self.graph.save(self.snapshot_path)
+
+    def summary(self) -> dict:
+        graph = self.graph
+        return {
+            "users": len(graph.user_ids),
+            "attributes": len(graph.attribute_keys),
+            "edges": len(graph.edge_user),
+            "max_degree": graph.max_degree,
+            "snapshot": str(self.snapshot_path),
+            "snapshot_loaded": self._snapshot_mtime is not None,
+            "pid": os.getpid(),
+        }
+
+
+entity_graph = EntityGraphService(
+    settings.ENTITY_GRAPH_SNAPSHOT_PATH,
+    settings.ENTITY_GRAPH_MAX_DEGREE,
+    settings.ENTITY_GRAPH_RELOAD_CHECK_SECONDS,
+)
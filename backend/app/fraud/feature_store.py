@@ -0,0 +1,214 @@
+"""
+Shared sliding-window aggregates per account (transaction count and amount sum
+over 1 minute, 1 hour and 24 hours), consistent across every API and Celery
+worker because they live in Redis.
+
+Each window is split into fixed buckets. Recording an event increments the
+current bucket of every window in one atomic script; reading sums the window's
+buckets, weighting the oldest one by how much of it still overlaps the window,
+the same approximation the rate limiter uses. Buckets expire on their own, so
+nothing has to be cleaned up.
+"""
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Iterable
+
+from prometheus_client import Histogram
+from redis.asyncio import Redis
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis import get_redis
+
+logger = get_logger()
+
+# name -> (window seconds, bucket seconds)
+WINDOWS = {
+    "1m": (60, 5),
+    "1h": (3600, 60),
+    "24h": (86_400, 3600),
+}
+WINDOW_FEATURE_NAMES = tuple(f"{kind}_{name}" for name in WINDOWS for kind in ("count", "sum"))
+
+FEATURE_STORE_SECONDS = Histogram(
+    "online_feature_store_seconds",
+    "Online feature store round trips",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+# (account_id, amount, epoch seconds)
+Event = tuple[uuid.UUID, float, float]
+
+
+def _buckets(window: str, now: float) -> tuple[range, float]:
+    """Bucket indexes covering the window, oldest first, and the oldest bucket's weight"""
+    window_seconds, bucket_seconds = WINDOWS[window]
+    current, offset = divmod(now, bucket_seconds)
+    current = int(current)
+    return range(current - window_seconds // bucket_seconds, current + 1), 1 - offset / bucket_seconds
+
+
+def _aggregate(counts: list[float], sums: list[float], weight: float) -> tuple[float, float]:
+    return (
+        round(counts[0] * weight + sum(counts[1:]), 2),
+        round(sums[0] * weight + sum(sums[1:]), 2),
+    )
+
+
+class OnlineFeatureStore(ABC):
+    """Incremental windowed aggregates, recorded per event and read per account"""
+
+    @abstractmethod
+    async def record_many(self, events: Iterable[Event]) -> None:
+        """Add each (account_id, amount, epoch seconds) event to its account's windows"""
+
+    @abstractmethod
+    async def features_many(
+        self, account_ids: list[uuid.UUID], now: float | None = None
+    ) -> dict[uuid.UUID, dict[str, float]]:
+        """WINDOW_FEATURE_NAMES for each account as of `now`, in one round trip"""
+
+    async def record(self, account_id: uuid.UUID, amount: float, at: float | None = None) -> None:
+        await self.record_many([(account_id, amount, time.time() if at is None else at)])
+
+    async def features(self, account_id: uuid.UUID, now: float | None = None) -> dict[str, float]:
+        return (await self.features_many([account_id], now))[account_id]
+
+
+class RedisOnlineFeatureStore(OnlineFeatureStore):
+    # KEYS: count and sum key of the current bucket of each window, in pairs
+    # ARGV[1] = amount, ARGV[2..] = ttl seconds per window
+    RECORD_SCRIPT = """
+    for i = 1, #KEYS / 2 do
+        local ttl = tonumber(ARGV[i + 1])
+        redis.call('INCR', KEYS[2 * i - 1])
+        redis.call('EXPIRE', KEYS[2 * i - 1], ttl)
+        redis.call('INCRBYFLOAT', KEYS[2 * i], ARGV[1])
+        redis.call('EXPIRE', KEYS[2 * i], ttl)
+    end
+    return 0
+    """
+
+    # A bucket must outlive the window it can still be part of, plus the partial oldest bucket
+    TTLS = [window_seconds + 2 * bucket_seconds for window_seconds, bucket_seconds in WINDOWS.values()]
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self._record = redis.register_script(self.RECORD_SCRIPT)
+
+    @staticmethod
+    def _key(account_id: uuid.UUID, window: str, bucket: int, kind: str) -> str:
+        # Shared hash tag keeps one account's buckets in one slot for the script and MGET
+        return f"ff:{{{account_id}}}:{window}:{bucket}:{kind}"
+
+    async def record_many(self, events: Iterable[Event]) -> None:
+        start_time = time.perf_counter()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for account_id, amount, at in events:
+                keys = []
+                for window in WINDOWS:
+                    bucket = int(at // WINDOWS[window][1])
+                    keys.extend(
+                        [self._key(account_id, window, bucket, "c"), self._key(account_id, window, bucket, "s")]
+                    )
+                await self._record(keys=keys, args=[amount, *self.TTLS], client=pipe)
+            await pipe.execute()
+        FEATURE_STORE_SECONDS.labels(operation="record").observe(time.perf_counter() - start_time)
+
+    async def features_many(
+        self, account_ids: list[uuid.UUID], now: float | None = None
+    ) -> dict[uuid.UUID, dict[str, float]]:
+        start_time = time.perf_counter()
+        now = time.time() if now is None else now
+        spans = {window: _buckets(window, now) for window in WINDOWS}
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for account_id in account_ids:
+                pipe.mget(
+                    [
+                        self._key(account_id, window, bucket, kind)
+                        for window, (buckets, _) in spans.items()
+                        for bucket in buckets
+                        for kind in ("c", "s")
+                    ]
+                )
+            replies = await pipe.execute()
+
+        results = {}
+        for account_id, values in zip(account_ids, replies):
+            values = [float(value) if value is not None else 0.0 for value in values]
+            features, offset = {}, 0
+            for window, (buckets, weight) in spans.items():
+                span = values[offset : offset + 2 * len(buckets)]
+                offset += 2 * len(buckets)
+                count, total = _aggregate(span[0::2], span[1::2], weight)
+                features[f"count_{window}"], features[f"sum_{window}"] = count, total
+            results[account_id] = features
+        FEATURE_STORE_SECONDS.labels(operation="read").observe(time.perf_counter() - start_time)
+        return results
+
+
+class InMemoryOnlineFeatureStore(OnlineFeatureStore):
+    """
+    Process-local store with the same bucketing, for local development and
+    tests; not shared between workers. Bounded to max_accounts, least recently
+    recorded first out.
+    """
+
+    def __init__(self, max_accounts: int = 100_000):
+        self.max_accounts = max_accounts
+        # account_id -> window -> bucket -> [count, sum]
+        self._accounts: OrderedDict[uuid.UUID, dict[str, dict[int, list[float]]]] = OrderedDict()
+
+    async def record_many(self, events: Iterable[Event]) -> None:
+        for account_id, amount, at in events:
+            windows = self._accounts.get(account_id)
+            if windows is None:
+                windows = self._accounts[account_id] = {window: {} for window in WINDOWS}
+                if len(self._accounts) > self.max_accounts:
+                    self._accounts.popitem(last=False)
+            else:
+                self._accounts.move_to_end(account_id)
+
+            for window, (window_seconds, bucket_seconds) in WINDOWS.items():
+                buckets = windows[window]
+                bucket = int(at // bucket_seconds)
+                counter = buckets.setdefault(bucket, [0, 0.0])
+                counter[0] += 1
+                counter[1] += amount
+                # Drop buckets that can no longer fall inside the window
+                oldest = bucket - window_seconds // bucket_seconds - 1
+                for stale in [index for index in buckets if index < oldest]:
+                    del buckets[stale]
+
+    async def features_many(
+        self, account_ids: list[uuid.UUID], now: float | None = None
+    ) -> dict[uuid.UUID, dict[str, float]]:
+        now = time.time() if now is None else now
+        results = {}
+        for account_id in account_ids:
+            windows = self._accounts.get(account_id, {})
+            features = {}
+            for window in WINDOWS:
+                buckets, weight = _buckets(window, now)
+                stored = windows.get(window, {})
+                counters = [stored.get(bucket, (0, 0.0)) for bucket in buckets]
+                count, total = _aggregate(
+                    [counter[0] for counter in counters], [counter[1] for counter in counters], weight
+                )
+                features[f"count_{window}"], features[f"sum_{window}"] = count, total
+            results[account_id] = features
+        return results
+
+
+def create_online_feature_store(redis: Redis | None = None) -> OnlineFeatureStore:
+    if settings.FEATURE_STORE_BACKEND == "memory":
+        logger.warning("Using in-memory online feature store; aggregates are not shared between workers")
+        return InMemoryOnlineFeatureStore()
+    return RedisOnlineFeatureStore(redis or get_redis())
+
+
+online_feature_store = create_online_feature_store()
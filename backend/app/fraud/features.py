@@ -0,0 +1,147 @@
+import math
+import uuid
+from array import array
+from collections import OrderedDict
+
+HOUR_SECONDS = 3600.0
+DAY_SECONDS = 86_400.0
+# Below this many prior transactions the amount z-score is not meaningful
+MIN_HISTORY = 3
+Z_SCORE_CLIP = 10.0
+
+# Order matters: model weights are stored positionally against this tuple.
+# Velocities are log1p(count) so a linear model does not explode on busy accounts.
+FEATURE_NAMES = (
+    "velocity_1h",
+    "velocity_24h",
+    "amount_zscore",
+    "new_counterparty",
+    "short_history",
+)
+
+
+def counterparty_key(counterparty_id: uuid.UUID | None) -> int:
+    """Top 63 bits of the UUID, so it fits a signed 64-bit array slot; 0 means none"""
+    return counterparty_id.int >> 65 if counterparty_id is not None else 0
+
+
+class AccountWindow:
+    """
+    The last `size` transactions of one account in three parallel fixed-size
+    arrays used as a ring buffer: about 24 bytes per slot, no per-transaction
+    Python objects. Running amount sums make the mean and variance O(1); they
+    are recomputed exactly each time the ring wraps so float drift cannot build up.
+    """
+
+    __slots__ = ("size", "timestamps", "amounts", "counterparties", "head", "count", "amount_sum", "amount_sq_sum")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.timestamps = array("d", bytes(8 * size))
+        self.amounts = array("d", bytes(8 * size))
+        self.counterparties = array("q", bytes(8 * size))
+        self.head = 0
+        self.count = 0
+        self.amount_sum = 0.0
+        self.amount_sq_sum = 0.0
+
+    def append(self, timestamp: float, amount: float, counterparty: int) -> None:
+        head = self.head
+        if self.count == self.size:
+            evicted = self.amounts[head]
+            self.amount_sum -= evicted
+            self.amount_sq_sum -= evicted * evicted
+        else:
+            self.count += 1
+
+        self.timestamps[head] = timestamp
+        self.amounts[head] = amount
+        self.counterparties[head] = counterparty
+        self.amount_sum += amount
+        self.amount_sq_sum += amount * amount
+
+        self.head = (head + 1) % self.size
+        if self.head == 0:
+            self.amount_sum = math.fsum(self.amounts)
+            self.amount_sq_sum = math.fsum(value * value for value in self.amounts)
+
+    def velocity(self, now: float) -> tuple[int, int]:
+        """
+        Transactions in the hour and day up to `now`. Timestamps are client-supplied
+        and may arrive out of order, so every slot is checked rather than stopping
+        at the first old one; later-dated entries are not counted, as in batch_features.
+        """
+        hour_cutoff = now - HOUR_SECONDS
+        day_cutoff = now - DAY_SECONDS
+        last_hour = last_day = 0
+        for timestamp in self.timestamps[: self.count]:
+            if day_cutoff <= timestamp <= now:
+                last_day += 1
+                if timestamp >= hour_cutoff:
+                    last_hour += 1
+        return last_hour, last_day
+
+    def amount_zscore(self, amount: float) -> float:
+        if self.count < MIN_HISTORY:
+            return 0.0
+        mean = self.amount_sum / self.count
+        variance = max(self.amount_sq_sum / self.count - mean * mean, 0.0)
+        # A flat history (every amount equal) would divide by zero; floor at 1% of the mean
+        std = max(math.sqrt(variance), abs(mean) * 0.01, 0.01)
+        return max(-Z_SCORE_CLIP, min(Z_SCORE_CLIP, (amount - mean) / std))
+
+    def knows(self, counterparty: int) -> bool:
+        # Unfilled slots hold 0, which is never a real counterparty key
+        return counterparty in self.counterparties
+
+
+class AccountFeatureStore:
+    """
+    Per-account rolling windows for the scoring engine, held in process and
+    bounded to `max_accounts` with least-recently-scored eviction. Not shared
+    between workers; each worker learns from the traffic it sees.
+    """
+
+    def __init__(self, window_size: int, max_accounts: int):
+        self.window_size = window_size
+        self.max_accounts = max_accounts
+        self._windows: OrderedDict[uuid.UUID, AccountWindow] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def window(self, account_id: uuid.UUID) -> AccountWindow:
+        window = self._windows.get(account_id)
+        if window is not None:
+            self._windows.move_to_end(account_id)
+            return window
+
+        window = self._windows[account_id] = AccountWindow(self.window_size)
+        if len(self._windows) > self.max_accounts:
+            self._windows.popitem(last=False)
+        return window
+
+    def features(
+        self,
+        window: AccountWindow,
+        timestamp: float,
+        amount: float,
+        counterparty: int,
+        velocity: tuple[float, float] | None = None,
+    ) -> tuple[float, ...]:
+        """
+        Feature vector in FEATURE_NAMES order, computed before this transaction
+        is recorded. velocity is (last hour, last day) counts from a shared
+        source; without it they come from this worker's window.
+        """
+        last_hour, last_day = velocity if velocity is not None else window.velocity(timestamp)
+        return (
+            math.log1p(last_hour),
+            math.log1p(last_day),
+            window.amount_zscore(amount),
+            1.0 if counterparty and window.count and not window.knows(counterparty) else 0.0,
+            1.0 if window.count < MIN_HISTORY else 0.0,
+        )
+
+    def clear(self) -> None:
+        self._windows.clear()
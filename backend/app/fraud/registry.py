@@ -0,0 +1,226 @@
+"""
+Versioned model artifacts on disk, memory-mapped instead of read.
+
+Layout, per model name:
+
+    {root}/{name}/CURRENT            version to serve, replaced atomically
+    {root}/{name}/{version}/*.npy    one array per file
+    {root}/{name}/{version}/meta.json
+
+Arrays are opened with np.load(mmap_mode="r"): nothing is read until a page is
+touched, and pages live in the kernel page cache, so every API worker and
+Celery child on the host maps the same physical memory and a recycled child
+"loads" a model in microseconds. Writers never modify a published version;
+they publish a new directory and move CURRENT, and readers switch on their
+next lookup while requests already holding the old artifact finish with it.
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from prometheus_client import Counter, Gauge
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+POINTER_FILE = "CURRENT"
+META_FILE = "meta.json"
+
+MODEL_LOAD_SECONDS = Gauge("model_artifact_load_seconds", "Time to map a model version", ["model", "version"])
+MODEL_RESIDENT_BYTES = Gauge(
+    "model_artifact_resident_bytes",
+    "Resident bytes of a mapped model version in this process",
+    ["model", "version"],
+)
+MODEL_SWAPS = Counter("model_artifact_swaps_total", "Model versions switched to at runtime", ["model"])
+
+
+@dataclass
+class ModelArtifact:
+    name: str
+    version: str
+    path: Path
+    arrays: dict[str, np.ndarray]
+    meta: dict
+    load_seconds: float
+    loaded_at: float = field(default_factory=time.time)
+
+    def memory(self) -> dict:
+        """
+        Resident and proportional set size of this version's mappings, from
+        /proc/self/smaps. Pss splits shared pages between the processes mapping
+        them, so it is the figure that shows the sharing.
+        """
+        usage = {"rss_bytes": 0, "pss_bytes": 0, "shared_bytes": 0, "mapped_bytes": 0}
+        prefix = f"{self.path.resolve()}{os.sep}"
+        try:
+            with open("/proc/self/smaps") as smaps:
+                in_artifact = False
+                for line in smaps:
+                    # Mapping header lines start with an address range like 7f..-7f..
+                    if "-" in line.split(" ", 1)[0]:
+                        parts = line.split(maxsplit=5)
+                        in_artifact = len(parts) == 6 and parts[5].strip().startswith(prefix)
+                    elif in_artifact:
+                        key, _, value = line.partition(":")
+                        if key == "Rss":
+                            usage["rss_bytes"] += int(value.split()[0]) * 1024
+                        elif key == "Pss":
+                            usage["pss_bytes"] += int(value.split()[0]) * 1024
+                        elif key in ("Shared_Clean", "Shared_Dirty"):
+                            usage["shared_bytes"] += int(value.split()[0]) * 1024
+                        elif key == "Size":
+                            usage["mapped_bytes"] += int(value.split()[0]) * 1024
+        except OSError:
+            # Not Linux, or /proc is unavailable
+            return {key: None for key in usage}
+        return usage
+
+
+class ModelRegistry:
+    """
+    Lazily maps the CURRENT version of each model on first use and re-checks
+    the pointer file at most every check_interval_seconds, so the hot path
+    costs a clock read and, occasionally, reading a few bytes.
+    """
+
+    def __init__(self, root: str | Path, check_interval_seconds: float):
+        self.root = Path(root)
+        self.check_interval_seconds = check_interval_seconds
+        self._current: dict[str, ModelArtifact | None] = {}
+        self._checked_at: dict[str, float] = {}
+        # Celery threads and the threadpool may look up the same model at once
+        self._lock = threading.Lock()
+
+    def _pointer(self, name: str) -> Path:
+        return self.root / name / POINTER_FILE
+
+    def get(self, name: str) -> ModelArtifact | None:
+        """The artifact to serve for `name`, or None when no version has been published"""
+        now = time.monotonic()
+        if now - self._checked_at.get(name, float("-inf")) < self.check_interval_seconds:
+            return self._current.get(name)
+
+        with self._lock:
+            self._checked_at[name] = now
+            current = self._current.get(name)
+            try:
+                version = self._pointer(name).read_text().strip()
+            except FileNotFoundError:
+                return current
+            if current is not None and current.version == version:
+                return current
+
+            try:
+                artifact = self.load(name, version)
+            except Exception as e:
+                # Keep serving what we have; the next check retries
+                logger.error(f"Could not load {name} model {version}, keeping {current and current.version}: {e}")
+                return current
+            self._current[name] = artifact
+            if current is not None:
+                MODEL_SWAPS.labels(model=name).inc()
+                logger.info(f"Swapped {name} model {current.version} -> {version}")
+            return artifact
+
+    def load(self, name: str, version: str) -> ModelArtifact:
+        start_time = time.perf_counter()
+        path = self.root / name / version
+        meta = json.loads((path / META_FILE).read_text())
+        arrays = {
+            array_path.stem: np.load(array_path, mmap_mode="r")
+            for array_path in sorted(path.glob("*.npy"))
+        }
+        load_seconds = time.perf_counter() - start_time
+        MODEL_LOAD_SECONDS.labels(model=name, version=version).set(load_seconds)
+        logger.info(f"Mapped {name} model {version} in {load_seconds * 1000:.2f} ms")
+        return ModelArtifact(name, version, path, arrays, meta, load_seconds)
+
+    def publish(
+        self,
+        name: str,
+        version: str,
+        arrays: dict[str, np.ndarray],
+        meta: dict,
+        activate: bool = True,
+    ) -> Path:
+        """
+        Write a new immutable version. It is staged in a temporary directory and
+        renamed into place, so a reader never sees a half-written version.
+        """
+        model_dir = self.root / name
+        model_dir.mkdir(parents=True, exist_ok=True)
+        path = model_dir / version
+        if path.exists():
+            raise FileExistsError(f"{name} model {version} is already published")
+
+        staging = Path(tempfile.mkdtemp(prefix=f".{version}.", dir=model_dir))
+        try:
+            for array_name, array in arrays.items():
+                np.save(staging / f"{array_name}.npy", np.ascontiguousarray(array))
+            (staging / META_FILE).write_text(
+                json.dumps({**meta, "version": version, "published_at": time.time()}, indent=2)
+            )
+            # mkdtemp creates 0700; workers may run as a different user
+            staging.chmod(0o755)
+            os.rename(staging, path)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        if activate:
+            self.activate(name, version)
+        return path
+
+    def activate(self, name: str, version: str) -> None:
+        """Point CURRENT at a published version; workers pick it up on their next check"""
+        if not (self.root / name / version / META_FILE).exists():
+            raise FileNotFoundError(f"{name} model {version} is not published")
+        pointer = self._pointer(name)
+        tmp_pointer = pointer.with_name(f".{POINTER_FILE}.{os.getpid()}")
+        with open(tmp_pointer, "w") as tmp_file:
+            tmp_file.write(version)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_pointer, pointer)
+
+    def versions(self, name: str) -> list[str]:
+        model_dir = self.root / name
+        if not model_dir.exists():
+            return []
+        return sorted(
+            path.name
+            for path in model_dir.iterdir()
+            if path.is_dir() and not path.name.startswith(".") and (path / META_FILE).exists()
+        )
+
+    def status(self, name: str) -> dict:
+        artifact = self.get(name)
+        loaded = {}
+        if artifact is not None:
+            memory = artifact.memory()
+            if memory["rss_bytes"] is not None:
+                MODEL_RESIDENT_BYTES.labels(model=name, version=artifact.version).set(memory["rss_bytes"])
+            loaded = {
+                "version": artifact.version,
+                "load_ms": round(artifact.load_seconds * 1000, 3),
+                "loaded_at": artifact.loaded_at,
+                **memory,
+            }
+        return {
+            "model": name,
+            "published_versions": self.versions(name),
+            "loaded": loaded or None,
+            "pid": os.getpid(),
+        }
+
+
+model_registry = ModelRegistry(settings.MODEL_ARTIFACT_DIR, settings.MODEL_ARTIFACT_CHECK_SECONDS)
@@ -0,0 +1,127 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import psycopg
+from celery import chord
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.database.dsn import sync_dsn
+from backend.app.fraud.batch import score_window, window_bounds
+from backend.app.fraud.engine import fraud_engine
+from backend.app.fraud.entity_graph import entity_graph, rebuild_from_postgres
+from backend.app.fraud.feature_store import create_online_feature_store
+
+logger = get_logger()
+
+
+@celery_app.task(
+    name="score_transaction_window",
+    autoretry_for=(psycopg.OperationalError,),
+    retry_backoff=True,
+    max_retries=3,
+    # A window reads, scores and writes well over a million rows; the 5 minute default is too tight
+    soft_time_limit=30 * 60,
+    time_limit=35 * 60,
+)
+def score_transaction_window(start: str, end: str) -> dict:
+    """Batch-score transactions created in [start, end) into risk_score"""
+    report = score_window(
+        sync_dsn(),
+        datetime.fromisoformat(start),
+        datetime.fromisoformat(end),
+        fraud_engine.model,
+        settings.FRAUD_WINDOW_SIZE,
+        timedelta(hours=settings.FRAUD_BATCH_LOOKBACK_HOURS),
+    )
+    logger.info(f"Scored transaction window {start} - {end}: {report}")
+    return report
+
+
+@celery_app.task(name="summarize_rescore")
+def summarize_rescore(reports: list[dict], dispatched_at: float) -> dict:
+    rows = sum(report["rows"] for report in reports)
+    elapsed = time.time() - dispatched_at
+    worker_seconds = sum(report["elapsed_seconds"] for report in reports)
+    summary = {
+        "windows": len(reports),
+        "rows": rows,
+        "elapsed_seconds": round(elapsed, 3),
+        # Wall clock across the fan-out, and what a single worker sustains
+        "rows_per_minute": round(rows / elapsed * 60) if elapsed else None,
+        "rows_per_worker_minute": round(rows / worker_seconds * 60) if worker_seconds else None,
+    }
+    logger.info(f"Transaction rescoring finished: {summary}")
+    return summary
+
+
+@celery_app.task(name="rescore_transactions")
+def rescore_transactions(
+    start: str | None = None, end: str | None = None, chunk_hours: int | None = None
+) -> str:
+    """
+    Fan [start, end) out as one score_transaction_window task per chunk,
+    defaulting to yesterday (UTC). Returns the id of the chord that summarizes
+    the run once every window is written.
+    """
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    start_at = datetime.fromisoformat(start) if start else today - timedelta(days=1)
+    end_at = datetime.fromisoformat(end) if end else today
+    windows = window_bounds(start_at, end_at, chunk_hours or settings.FRAUD_BATCH_CHUNK_HOURS)
+
+    result = chord(
+        score_transaction_window.s(window_start.isoformat(), window_end.isoformat())
+        for window_start, window_end in windows
+    )(summarize_rescore.s(time.time()))
+    logger.info(f"Dispatched {len(windows)} scoring windows for {start_at} - {end_at}")
+    return result.id
+
+
+async def _record_features(events: list[tuple[uuid.UUID, float, float]]) -> None:
+    # The shared client's connections belong to the API's event loop; each task run gets its own
+    redis = Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB, decode_responses=True)
+    try:
+        await create_online_feature_store(redis).record_many(events)
+    finally:
+        await redis.aclose()
+
+
+@celery_app.task(
+    name="record_transaction_features",
+    autoretry_for=(RedisConnectionError, RedisTimeoutError),
+    retry_backoff=True,
+    max_retries=3,
+)
+def record_transaction_features(events: list[list]) -> int:
+    """
+    Add [account_id, amount, ISO timestamp] events to the shared online
+    aggregates, for producers outside the API such as bulk ingestion.
+    """
+    parsed = [
+        (uuid.UUID(account_id), float(amount), datetime.fromisoformat(at).timestamp())
+        for account_id, amount, at in events
+    ]
+    asyncio.run(_record_features(parsed))
+    return len(parsed)
+
+
+@celery_app.task(
+    name="rebuild_entity_graph",
+    autoretry_for=(psycopg.OperationalError,),
+    retry_backoff=True,
+    max_retries=3,
+    soft_time_limit=30 * 60,
+    time_limit=35 * 60,
+)
+def rebuild_entity_graph(workers: int = 4) -> dict:
+    """Relink every user from Postgres and write the snapshot the API workers reload"""
+    # Prefork children are daemonic and may not start processes; slices are read on threads
+    graph, report = rebuild_from_postgres(sync_dsn(), workers, entity_graph.graph.max_degree, processes=False)
+    graph.save(entity_graph.snapshot_path)
+    logger.info(f"Rebuilt entity graph: {report}")
+    return report
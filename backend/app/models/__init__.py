@@ -1,5 +1,8 @@
 from .user import User
+from .bank_account import BankAccount
+from .transaction import Transaction
+from .risk_score import RiskScore
 
 
 
-__all__ = ["User"]
\ No newline at end of file
+__all__ = ["User", "BankAccount", "Transaction", "RiskScore"]
\ No newline at end of file
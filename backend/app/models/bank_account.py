@@ -0,0 +1,53 @@
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ForeignKey, func, text
+from sqlalchemy.dialects import postgresql as pg
+from sqlmodel import Column, Field, Relationship
+
+from backend.app.schema.bank_account import BaseBankAccountSchema
+
+if TYPE_CHECKING:
+    from backend.app.models.user import User
+
+
+class BankAccount(BaseBankAccountSchema, table=True):
+    __tablename__ = "bank_account"
+
+    id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            primary_key=True,
+        ),
+        default_factory=uuid.uuid4,
+    )
+    user_id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            ForeignKey("user.id", ondelete="CASCADE"),
+            nullable=False,
+            index=True,
+        )
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            onupdate=func.current_timestamp(),
+        ),
+    )
+
+    user: "User" = Relationship(
+        back_populates="bank_accounts",
+        sa_relationship_kwargs={"lazy": "raise"},
+    )
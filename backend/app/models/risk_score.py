@@ -0,0 +1,39 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import Index, REAL, String, text
+from sqlalchemy.dialects import postgresql as pg
+from sqlmodel import Column, Field, SQLModel
+
+from backend.app.schema.fraud import FraudDecisionSchema
+
+
+class RiskScore(SQLModel, table=True):
+    """
+    Batch fraud score of one transaction under one model version, written by
+    the rescoring tasks with COPY. There is deliberately no foreign key to
+    "transaction": checking one per row would dominate a bulk write, and
+    transaction_created_at is kept so lookups can still prune partitions.
+    """
+
+    __tablename__ = "risk_score"
+    __table_args__ = (
+        # Rescoring replaces one model's scores for a time window at a time
+        Index("ix_risk_score_model_version_created_at", "model_version", "transaction_created_at"),
+    )
+
+    transaction_id: uuid.UUID = Field(sa_column=Column(pg.UUID(as_uuid=True), primary_key=True))
+    model_version: str = Field(sa_column=Column(String(32), primary_key=True))
+    transaction_created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False)
+    )
+    score: float = Field(sa_column=Column(REAL, nullable=False))
+    decision: FraudDecisionSchema
+    scored_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
@@ -0,0 +1,75 @@
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import ForeignKey, Index, text
+from sqlalchemy.dialects import postgresql as pg
+from sqlmodel import Column, Field, Relationship
+
+from backend.app.schema.transaction import BaseTransactionSchema
+
+if TYPE_CHECKING:
+    from backend.app.models.user import User
+
+
+def _user_fk(nullable: bool = True) -> Column:
+    return Column(pg.UUID(as_uuid=True), ForeignKey("user.id"), nullable=nullable)
+
+
+def _account_fk() -> Column:
+    return Column(pg.UUID(as_uuid=True), ForeignKey("bank_account.id"), nullable=True)
+
+
+class Transaction(BaseTransactionSchema, table=True):
+    """
+    Range-partitioned by created_at, one partition per month (see the
+    create_transaction_partitions() function in the migration). Postgres
+    requires the partition key in the primary key, hence (id, created_at).
+    Queries that bound created_at only read the matching partitions.
+    """
+
+    __tablename__ = "transaction"
+    __table_args__ = (
+        # Sender/receiver history, newest first; readers load full rows, so
+        # the indexes carry only the keys (see f7c2e9b05a13)
+        Index("ix_transaction_sender_created_at", "sender_id", text("created_at DESC")),
+        Index("ix_transaction_receiver_created_at", "receiver_id", text("created_at DESC")),
+        # Rows arrive in time order, so a BRIN index on created_at stays tiny
+        Index("ix_transaction_created_at_brin", "created_at", postgresql_using="brin"),
+        Index("ix_transaction_reference", "reference"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    id: uuid.UUID = Field(
+        sa_column=Column(pg.UUID(as_uuid=True), primary_key=True),
+        default_factory=uuid.uuid4,
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            primary_key=True,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    completed_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(pg.TIMESTAMP(timezone=True))
+    )
+    sender_id: Optional[uuid.UUID] = Field(default=None, sa_column=_user_fk())
+    receiver_id: Optional[uuid.UUID] = Field(default=None, sa_column=_user_fk())
+    processed_by: Optional[uuid.UUID] = Field(default=None, sa_column=_user_fk())
+    sender_account_id: Optional[uuid.UUID] = Field(default=None, sa_column=_account_fk())
+    receiver_account_id: Optional[uuid.UUID] = Field(default=None, sa_column=_account_fk())
+
+    sender: Optional["User"] = Relationship(
+        back_populates="sent_transactions",
+        sa_relationship_kwargs={"foreign_keys": "Transaction.sender_id", "lazy": "raise"},
+    )
+    receiver: Optional["User"] = Relationship(
+        back_populates="received_transactions",
+        sa_relationship_kwargs={"foreign_keys": "Transaction.receiver_id", "lazy": "raise"},
+    )
+    processor: Optional["User"] = Relationship(
+        back_populates="processed_transactions",
+        sa_relationship_kwargs={"foreign_keys": "Transaction.processed_by", "lazy": "raise"},
+    )
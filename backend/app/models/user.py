@@ -1,16 +1,34 @@
 
 import uuid
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
-from sqlalchemy import func, text
+from sqlalchemy import Index, func, text
 from sqlalchemy.dialects import postgresql as pg
 from sqlmodel import Column, Field, Relationship
 
 from backend.app.schema.otp_question import RoleChoicesSchema
 from backend.app.schema.user import BaseUserSchema
 
+if TYPE_CHECKING:
+    from backend.app.models.bank_account import BankAccount
+    from backend.app.models.transaction import Transaction
+
 
 class User(BaseUserSchema, table=True):
+    # Mirrors the 4b7e2c9a1f03 migration so autogenerate does not drop them
+    __table_args__ = (
+        Index("ix_user_account_status_created_at_id", "account_status", "created_at", "id"),
+        Index("ix_user_created_at_id", "created_at", "id"),
+        Index("ix_user_role_created_at_id", "role", "created_at", "id"),
+        Index(
+            "ix_user_inactive_created_at",
+            "created_at",
+            "id",
+            postgresql_where=text("is_active = false"),
+        ),
+    )
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
@@ -52,23 +70,28 @@ class User(BaseUserSchema, table=True):
     #     },
     # )
     # next_of_kins: list["NextOfKin"] = Relationship(back_populates="user")
-    #
-    # bank_accounts: list["BankAccount"] = Relationship(back_populates="user")
-    #
-    # sent_transactions: list["Transaction"] = Relationship(
-    #     back_populates="sender",
-    #     sa_relationship_kwargs={"foreign_keys": "Transaction.sender_id"},
-    # )
-    #
-    # received_transactions: list["Transaction"] = Relationship(
-    #     back_populates="receiver",
-    #     sa_relationship_kwargs={"foreign_keys": "Transaction.receiver_id"},
-    # )
-    #
-    # processed_transactions: list["Transaction"] = Relationship(
-    #     back_populates="processor",
-    #     sa_relationship_kwargs={"foreign_keys": "Transaction.processed_by"},
-    # )
+
+    # lazy="raise": a user can have millions of transactions, so they are only
+    # ever loaded by explicit, time-bounded queries (see TransactionService).
+    bank_accounts: list["BankAccount"] = Relationship(
+        back_populates="user",
+        sa_relationship_kwargs={"lazy": "raise"},
+    )
+
+    sent_transactions: list["Transaction"] = Relationship(
+        back_populates="sender",
+        sa_relationship_kwargs={"foreign_keys": "Transaction.sender_id", "lazy": "raise"},
+    )
+
+    received_transactions: list["Transaction"] = Relationship(
+        back_populates="receiver",
+        sa_relationship_kwargs={"foreign_keys": "Transaction.receiver_id", "lazy": "raise"},
+    )
+
+    processed_transactions: list["Transaction"] = Relationship(
+        back_populates="processor",
+        sa_relationship_kwargs={"foreign_keys": "Transaction.processed_by", "lazy": "raise"},
+    )
 
     @property
     def full_name(self) -> str:
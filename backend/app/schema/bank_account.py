@@ -0,0 +1,47 @@
+import uuid
+from decimal import Decimal
+from enum import Enum
+
+from sqlalchemy import Column, Numeric, String
+from sqlmodel import Field, SQLModel
+
+
+class AccountTypeSchema(str, Enum):
+    SAVINGS = "savings"
+    CURRENT = "current"
+    FIXED_DEPOSIT = "fixed_deposit"
+
+
+class AccountCurrencySchema(str, Enum):
+    USD = "us_dollar"
+    EUR = "euro"
+    GBP = "british_pound"
+    KES = "kenya_shilling"
+
+
+class AccountStatusChoicesSchema(str, Enum):
+    ACTIVE = "active"
+    FROZEN = "frozen"
+    CLOSED = "closed"
+
+
+class BaseBankAccountSchema(SQLModel):
+    account_number: str = Field(sa_column=Column(String(20), unique=True, nullable=False))
+    account_type: AccountTypeSchema = Field(default=AccountTypeSchema.SAVINGS)
+    currency: AccountCurrencySchema = Field(default=AccountCurrencySchema.USD)
+    account_status: AccountStatusChoicesSchema = Field(default=AccountStatusChoicesSchema.ACTIVE)
+    balance: Decimal = Field(
+        default=Decimal("0.00"), sa_column=Column(Numeric(18, 2), nullable=False)
+    )
+    is_primary: bool = Field(default=False)
+
+
+class BankAccountCreateSchema(SQLModel):
+    account_type: AccountTypeSchema = AccountTypeSchema.SAVINGS
+    currency: AccountCurrencySchema = AccountCurrencySchema.USD
+    is_primary: bool = False
+
+
+class BankAccountReadSchema(BaseBankAccountSchema):
+    id: uuid.UUID
+    user_id: uuid.UUID
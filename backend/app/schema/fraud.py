@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+from backend.app.schema.transaction import TransactionChannelSchema, TransactionTypeSchema
+
+
+class FraudDecisionSchema(str, Enum):
+    APPROVE = "approve"
+    REVIEW = "review"
+    DECLINE = "decline"
+
+
+class FraudScoreRequestSchema(SQLModel):
+    """A transaction about to be executed; features are kept per sender_id"""
+
+    sender_id: uuid.UUID
+    receiver_id: Optional[uuid.UUID] = None
+    amount: Decimal = Field(gt=0, max_digits=18, decimal_places=2)
+    transaction_type: TransactionTypeSchema = TransactionTypeSchema.TRANSFER
+    channel: TransactionChannelSchema = TransactionChannelSchema.WEB
+    created_at: Optional[datetime] = None
+    # False scores without adding the transaction to the sender's history
+    record: bool = True
+
+
+class FraudScoreResponseSchema(SQLModel):
+    score: float
+    decision: FraudDecisionSchema
+    reasons: list[str]
+    features: dict[str, float]
+    model_version: str
+    latency_ms: float
+
+
+class EntityClusterSchema(SQLModel):
+    user_id: uuid.UUID
+    # The component's representative user; equal ids mean linked accounts
+    cluster_id: uuid.UUID
+    cluster_size: int
+
+
+class LinkedUserSchema(SQLModel):
+    user_id: uuid.UUID
+    shared: list[str]
+
+
+class EntityGraphUserSchema(EntityClusterSchema):
+    linked_users: list[LinkedUserSchema]
+
+
+class TransactionLinkSchema(SQLModel):
+    sender: Optional[EntityClusterSchema] = None
+    receiver: Optional[EntityClusterSchema] = None
+    same_cluster: bool
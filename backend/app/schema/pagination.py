@@ -0,0 +1,16 @@
+from typing import Optional
+
+from sqlmodel import SQLModel
+
+from backend.app.schema.transaction import TransactionReadSchema
+from backend.app.schema.user import UserListItemSchema
+
+
+class UserPageSchema(SQLModel):
+    items: list[UserListItemSchema]
+    next_cursor: Optional[str] = None
+
+
+class TransactionPageSchema(SQLModel):
+    items: list[TransactionReadSchema]
+    next_cursor: Optional[str] = None
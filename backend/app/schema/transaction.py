@@ -0,0 +1,64 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import Column, Numeric, String
+from sqlmodel import Field, SQLModel
+
+from backend.app.schema.bank_account import AccountCurrencySchema
+
+
+class TransactionTypeSchema(str, Enum):
+    DEPOSIT = "deposit"
+    WITHDRAWAL = "withdrawal"
+    TRANSFER = "transfer"
+    PAYMENT = "payment"
+    REVERSAL = "reversal"
+
+
+class TransactionStatusSchema(str, Enum):
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    REVERSED = "reversed"
+
+
+class TransactionChannelSchema(str, Enum):
+    BRANCH = "branch"
+    MOBILE = "mobile"
+    WEB = "web"
+    ATM = "atm"
+    CARD = "card"
+
+
+class BaseTransactionSchema(SQLModel):
+    reference: str = Field(sa_column=Column(String(32), nullable=False))
+    amount: Decimal = Field(sa_column=Column(Numeric(18, 2), nullable=False))
+    currency: AccountCurrencySchema = Field(default=AccountCurrencySchema.USD)
+    transaction_type: TransactionTypeSchema
+    status: TransactionStatusSchema = Field(default=TransactionStatusSchema.PENDING)
+    channel: TransactionChannelSchema = Field(default=TransactionChannelSchema.WEB)
+    description: Optional[str] = Field(default=None, sa_column=Column(String(255)))
+
+
+class TransactionCreateSchema(BaseTransactionSchema):
+    """One ingested transaction; id and created_at are filled in when absent"""
+
+    id: Optional[uuid.UUID] = None
+    created_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    sender_id: Optional[uuid.UUID] = None
+    receiver_id: Optional[uuid.UUID] = None
+    processed_by: Optional[uuid.UUID] = None
+    sender_account_id: Optional[uuid.UUID] = None
+    receiver_account_id: Optional[uuid.UUID] = None
+
+
+class TransactionReadSchema(BaseTransactionSchema):
+    id: uuid.UUID
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    sender_id: Optional[uuid.UUID] = None
+    receiver_id: Optional[uuid.UUID] = None
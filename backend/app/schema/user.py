@@ -52,6 +52,21 @@ class UserReadSchema(BaseUserSchema):
     id: uuid.UUID
     full_name: str
 
+class UserListItemSchema(SQLModel):
+    """A user in back-office listings; like the export, it leaves out the security question and answer"""
+    id: uuid.UUID
+    username: Optional[str] = None
+    email: EmailStr
+    first_name: str
+    middle_name: Optional[str] = None
+    last_name: str
+    full_name: str
+    id_no: int
+    is_active: bool
+    is_superuser: bool
+    account_status: AccountStatusSchema
+    role: RoleChoicesSchema
+
 class EmailRequestSchema(SQLModel):
     email: EmailStr
 
@@ -0,0 +1,11 @@
+#!/bin/bash
+
+set -o errexit
+
+set -o nounset
+
+set -o pipefail
+
+# Runs once when the primary's data volume is initialised: allow the local
+# replica to stream WAL using the application credentials.
+echo "host replication ${POSTGRES_USER} all scram-sha-256" >> "${PGDATA}/pg_hba.conf"
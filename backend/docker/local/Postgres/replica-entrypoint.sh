@@ -0,0 +1,24 @@
+#!/bin/bash
+
+set -o errexit
+
+set -o nounset
+
+set -o pipefail
+
+# Local streaming replica: clone the primary on first start, then run as a hot standby.
+if [ ! -s "${PGDATA}/PG_VERSION" ]; then
+  until pg_isready --host=postgres --port=5432 --username="${POSTGRES_USER}"; do
+    >&2 echo "Waiting for the primary to accept connections..."
+    sleep 2
+  done
+
+  mkdir -p "${PGDATA}"
+  chown postgres:postgres "${PGDATA}"
+  export PGPASSWORD="${POSTGRES_PASSWORD}"
+  gosu postgres pg_basebackup --host=postgres --port=5432 --username="${POSTGRES_USER}" \
+    --pgdata="${PGDATA}" --wal-method=stream --write-recovery-conf --progress
+  chmod 0700 "${PGDATA}"
+fi
+
+exec gosu postgres postgres -c hot_standby=on
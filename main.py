@@ -1,10 +1,18 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from contextlib import asynccontextmanager
 
 
 from backend.app.api.main import api_router
+from backend.app.api.services.auth_service import auth_service
+from backend.app.api.services.bulk_registration import bulk_registration_service
+from backend.app.auth.hashing import password_hasher
 from backend.app.core.logging import get_logger
-from backend.app.database.session import engine, init_db
+from backend.app.core.redis import close_redis
+from backend.app.core.request_context import request_scope
+from backend.app.database.instrumentation import finish_request_stats, start_request_stats
+from backend.app.database.session import engine, init_db, replica_set, warm_up_pools
+from backend.app.database.warmup import readiness
+from backend.app.fraud.entity_graph import entity_graph
 
 logger = get_logger()
 
@@ -19,6 +27,22 @@ async def lifespan(app: FastAPI):
         logger.info("Initializing database...")
         await init_db()
 
+        # Readiness stays false until this finishes, so the load balancer
+        # only routes to workers whose pools are already open.
+        try:
+            warm_up = await warm_up_pools(auth_service.warmup_statements())
+        except Exception as e:
+            logger.error(f"Connection pool warm-up failed, serving cold: {e}")
+            warm_up = {"error": str(e)}
+        # Workers start from the last rebuilt entity graph instead of an empty one
+        try:
+            await entity_graph.refresh()
+        except Exception as e:
+            logger.error(f"Entity graph snapshot not loaded, starting empty: {e}")
+        entity_graph.start()
+
+        readiness.mark_ready(warm_up=warm_up)
+
         logger.info("Application started successfully")
 
     except Exception as e:
@@ -29,12 +53,20 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down application...")
+    readiness.mark_not_ready("shutting down")
+    password_hasher.shutdown()
+    bulk_registration_service.shutdown()
+    await entity_graph.close()
+
     try:
+        await replica_set.close()
         await engine.dispose()
         logger.info("Database engine disposed successfully")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
 
+    await close_redis()
+
     logger.info(" Application shutdown completed")
 
 
@@ -46,6 +78,19 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+@app.middleware("http")
+async def bind_request_scope(request: Request, call_next):
+    # The router records the matched route on this scope, which pool and SQL telemetry read
+    token = request_scope.set(request.scope)
+    query_stats = start_request_stats()
+    try:
+        response = await call_next(request)
+        finish_request_stats(query_stats, response.headers)
+        return response
+    finally:
+        request_scope.reset(token)
+
+
 # Include API routes
 app.include_router(api_router)
 
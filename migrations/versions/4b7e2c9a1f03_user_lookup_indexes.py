@@ -0,0 +1,55 @@
+"""User lookup indexes
+
+Revision ID: 4b7e2c9a1f03
+Revises: dfe8ce1686bc
+Create Date: 2026-10-17 10:12:41.218904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2c9a1f03'
+down_revision: Union[str, Sequence[str], None] = 'dfe8ce1686bc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The id_no type change lives in e6b3c1a8d905: it locks and rewrites the table.
+    # Built concurrently so a large user table stays writable during the migration
+    with op.get_context().autocommit_block():
+        # Status-filtered listings ordered by signup time, keyset-paginated on (created_at, id)
+        op.create_index(
+            'ix_user_account_status_created_at_id',
+            'user',
+            ['account_status', 'created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_user_created_at_id',
+            'user',
+            ['created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+        # Accounts still awaiting activation are a small slice of the table
+        op.create_index(
+            'ix_user_inactive_created_at',
+            'user',
+            ['created_at', 'id'],
+            postgresql_where=sa.text('is_active = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_inactive_created_at', table_name='user', postgresql_concurrently=True)
+        op.drop_index('ix_user_created_at_id', table_name='user', postgresql_concurrently=True)
+        op.drop_index(
+            'ix_user_account_status_created_at_id', table_name='user', postgresql_concurrently=True
+        )
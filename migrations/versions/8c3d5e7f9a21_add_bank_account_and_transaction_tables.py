@@ -0,0 +1,116 @@
+"""Add bank_account and range-partitioned transaction tables
+
+Revision ID: 8c3d5e7f9a21
+Revises: 4b7e2c9a1f03
+Create Date: 2026-10-17 14:03:55.702113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3d5e7f9a21'
+down_revision: Union[str, Sequence[str], None] = '4b7e2c9a1f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions named transaction_yYYYYmMM. Called by the
+# ensure_transaction_partitions beat task so upcoming months always exist.
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_transaction_partitions(months_back integer, months_ahead integer)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start date;
+    partition_name text;
+    created integer := 0;
+BEGIN
+    FOR offset_months IN -months_back..months_ahead LOOP
+        month_start := (date_trunc('month', now()) + make_interval(months => offset_months))::date;
+        partition_name := format('transaction_y%sm%s', to_char(month_start, 'YYYY'), to_char(month_start, 'MM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF "transaction" FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, (month_start + interval '1 month')::date
+            );
+            created := created + 1;
+        END IF;
+    END LOOP;
+    RETURN created;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('bank_account',
+    sa.Column('account_number', sa.String(length=20), nullable=False),
+    sa.Column('account_type', sa.Enum('SAVINGS', 'CURRENT', 'FIXED_DEPOSIT', name='accounttypeschema'), nullable=False),
+    sa.Column('currency', sa.Enum('USD', 'EUR', 'GBP', 'KES', name='accountcurrencyschema'), nullable=False),
+    sa.Column('account_status', sa.Enum('ACTIVE', 'FROZEN', 'CLOSED', name='accountstatuschoicesschema'), nullable=False),
+    sa.Column('balance', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('is_primary', sa.Boolean(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('account_number')
+    )
+    op.create_index(op.f('ix_bank_account_user_id'), 'bank_account', ['user_id'], unique=False)
+
+    op.create_table('transaction',
+    sa.Column('reference', sa.String(length=32), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('currency', postgresql.ENUM(name='accountcurrencyschema', create_type=False), nullable=False),
+    sa.Column('transaction_type', sa.Enum('DEPOSIT', 'WITHDRAWAL', 'TRANSFER', 'PAYMENT', 'REVERSAL', name='transactiontypeschema'), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'COMPLETED', 'FAILED', 'REVERSED', name='transactionstatusschema'), nullable=False),
+    sa.Column('channel', sa.Enum('BRANCH', 'MOBILE', 'WEB', 'ATM', 'CARD', name='transactionchannelschema'), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('completed_at', postgresql.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('sender_id', sa.UUID(), nullable=True),
+    sa.Column('receiver_id', sa.UUID(), nullable=True),
+    sa.Column('processed_by', sa.UUID(), nullable=True),
+    sa.Column('sender_account_id', sa.UUID(), nullable=True),
+    sa.Column('receiver_account_id', sa.UUID(), nullable=True),
+    sa.ForeignKeyConstraint(['sender_id'], ['user.id']),
+    sa.ForeignKeyConstraint(['receiver_id'], ['user.id']),
+    sa.ForeignKeyConstraint(['processed_by'], ['user.id']),
+    sa.ForeignKeyConstraint(['sender_account_id'], ['bank_account.id']),
+    sa.ForeignKeyConstraint(['receiver_account_id'], ['bank_account.id']),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)',
+    )
+    # Indexes on the partitioned parent are created on every partition, including future ones
+    op.create_index('ix_transaction_sender_created_at', 'transaction', ['sender_id', sa.text('created_at DESC')], unique=False, postgresql_include=['amount', 'transaction_type', 'status', 'receiver_id'])
+    op.create_index('ix_transaction_receiver_created_at', 'transaction', ['receiver_id', sa.text('created_at DESC')], unique=False, postgresql_include=['amount', 'transaction_type', 'status', 'sender_id'])
+    op.create_index('ix_transaction_created_at_brin', 'transaction', ['created_at'], unique=False, postgresql_using='brin')
+    op.create_index('ix_transaction_reference', 'transaction', ['reference'], unique=False)
+
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    # A year of history for backfills plus the next three months
+    op.execute("SELECT create_transaction_partitions(12, 3)")
+    # Catches rows outside every monthly partition instead of rejecting the insert
+    op.execute('CREATE TABLE transaction_default PARTITION OF "transaction" DEFAULT')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transaction')
+    op.execute("DROP FUNCTION IF EXISTS create_transaction_partitions(integer, integer)")
+    op.drop_index(op.f('ix_bank_account_user_id'), table_name='bank_account')
+    op.drop_table('bank_account')
+    sa.Enum(name='transactionchannelschema').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='transactionstatusschema').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='transactiontypeschema').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='accountstatuschoicesschema').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='accountcurrencyschema').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='accounttypeschema').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,34 @@
+"""User role listing index
+
+Revision ID: b91f0d6e2c47
+Revises: 8c3d5e7f9a21
+Create Date: 2026-10-17 16:40:08.113570
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91f0d6e2c47'
+down_revision: Union[str, Sequence[str], None] = '8c3d5e7f9a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pages of /users?role=... seek straight to (role, created_at, id)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_role_created_at_id',
+            'user',
+            ['role', 'created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_role_created_at_id', table_name='user', postgresql_concurrently=True)
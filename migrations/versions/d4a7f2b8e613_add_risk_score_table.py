@@ -0,0 +1,39 @@
+"""Add risk_score table for batch fraud scores
+
+Revision ID: d4a7f2b8e613
+Revises: b91f0d6e2c47
+Create Date: 2026-10-17 18:21:47.390215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7f2b8e613'
+down_revision: Union[str, Sequence[str], None] = 'b91f0d6e2c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('risk_score',
+    sa.Column('transaction_id', sa.UUID(), nullable=False),
+    sa.Column('model_version', sa.String(length=32), nullable=False),
+    sa.Column('transaction_created_at', postgresql.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('score', sa.REAL(), nullable=False),
+    sa.Column('decision', sa.Enum('APPROVE', 'REVIEW', 'DECLINE', name='frauddecisionschema'), nullable=False),
+    sa.Column('scored_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.PrimaryKeyConstraint('transaction_id', 'model_version'),
+    )
+    op.create_index('ix_risk_score_model_version_created_at', 'risk_score', ['model_version', 'transaction_created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_risk_score_model_version_created_at', table_name='risk_score')
+    op.drop_table('risk_score')
+    sa.Enum(name='frauddecisionschema').drop(op.get_bind(), checkfirst=True)
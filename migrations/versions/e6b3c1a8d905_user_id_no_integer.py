@@ -0,0 +1,87 @@
+"""Convert user.id_no to integer
+
+Revision ID: e6b3c1a8d905
+Revises: d4a7f2b8e613
+Create Date: 2026-10-17 21:04:12.583107
+
+The model declares id_no as an integer; as VARCHAR every get_user_by_id_no
+compared varchar to integer and could not use the unique index.
+
+Locking: ALTER COLUMN ... TYPE takes an ACCESS EXCLUSIVE lock on "user" and
+rewrites the table and all of its indexes, so every read and write of users
+(including logins) waits until it finishes. Run it in a maintenance window;
+it takes roughly as long as a full copy of the table. lock_timeout makes it
+give up instead of queueing behind a long transaction while new requests
+pile up behind it.
+
+Rows whose id_no is not an integer would abort the rewrite halfway, so they
+are counted first and the migration refuses to run until they are fixed.
+Databases already converted by an earlier revision of 4b7e2c9a1f03 are left
+untouched.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b3c1a8d905'
+down_revision: Union[str, Sequence[str], None] = 'd4a7f2b8e613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOCK_TIMEOUT = '5s'
+
+ID_NO_TYPE_SQL = sa.text(
+    """
+    SELECT data_type FROM information_schema.columns
+    WHERE table_schema = current_schema() AND table_name = 'user' AND column_name = 'id_no'
+    """
+)
+# Blank, non-numeric or outside the integer range; the regex guards the cast
+NON_INTEGER_ID_NO_SQL = sa.text(
+    """
+    SELECT count(*) FROM "user"
+    WHERE id_no IS NOT NULL AND CASE
+        WHEN btrim(id_no) ~ '^-?[0-9]{1,10}$'
+            THEN btrim(id_no)::bigint NOT BETWEEN -2147483648 AND 2147483647
+        ELSE true
+    END
+    """
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+    if connection.execute(ID_NO_TYPE_SQL).scalar_one() == 'integer':
+        return
+
+    invalid = connection.execute(NON_INTEGER_ID_NO_SQL).scalar_one()
+    if invalid:
+        raise RuntimeError(
+            f'{invalid} user rows have an id_no that is not an integer; fix them '
+            f'(SELECT id, id_no FROM "user" WHERE id_no !~ \'^-?[0-9]+$\') and re-run'
+        )
+
+    op.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+    op.alter_column(
+        'user',
+        'id_no',
+        existing_type=sa.String(length=50),
+        type_=sa.Integer(),
+        postgresql_using='btrim(id_no)::integer',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Same ACCESS EXCLUSIVE lock and table rewrite as the upgrade
+    op.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+    op.alter_column(
+        'user',
+        'id_no',
+        existing_type=sa.Integer(),
+        type_=sa.String(length=50),
+        postgresql_using='id_no::varchar',
+    )
@@ -0,0 +1,89 @@
+"""Create each transaction partition in its own subtransaction
+
+Revision ID: f2a9c7d41b58
+Revises: e6b3c1a8d905
+Create Date: 2026-10-18 09:37:20.114862
+
+CREATE TABLE ... PARTITION OF fails for a month that already has rows in
+transaction_default. The original function ran the whole loop as one
+statement, so that single month aborted every partition after it and
+ensure_transaction_partitions failed every night. Each month now gets its
+own BEGIN ... EXCEPTION block: a failure is raised as a WARNING naming the
+month and the loop carries on.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9c7d41b58'
+down_revision: Union[str, Sequence[str], None] = 'e6b3c1a8d905'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_transaction_partitions(months_back integer, months_ahead integer)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start date;
+    partition_name text;
+    created integer := 0;
+BEGIN
+    FOR offset_months IN -months_back..months_ahead LOOP
+        month_start := (date_trunc('month', now()) + make_interval(months => offset_months))::date;
+        partition_name := format('transaction_y%sm%s', to_char(month_start, 'YYYY'), to_char(month_start, 'MM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF "transaction" FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, (month_start + interval '1 month')::date
+                );
+                created := created + 1;
+            EXCEPTION WHEN others THEN
+                RAISE WARNING 'could not create partition %: % (%)', partition_name, SQLERRM, SQLSTATE;
+            END;
+        END IF;
+    END LOOP;
+    RETURN created;
+END;
+$$;
+"""
+
+# As created by 8c3d5e7f9a21
+PREVIOUS_CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_transaction_partitions(months_back integer, months_ahead integer)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start date;
+    partition_name text;
+    created integer := 0;
+BEGIN
+    FOR offset_months IN -months_back..months_ahead LOOP
+        month_start := (date_trunc('month', now()) + make_interval(months => offset_months))::date;
+        partition_name := format('transaction_y%sm%s', to_char(month_start, 'YYYY'), to_char(month_start, 'MM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF "transaction" FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, (month_start + interval '1 month')::date
+            );
+            created := created + 1;
+        END IF;
+    END LOOP;
+    RETURN created;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(PREVIOUS_CREATE_PARTITIONS_FUNCTION)
@@ -0,0 +1,71 @@
+"""Drop the INCLUDE columns from the transaction sender/receiver indexes
+
+Revision ID: f7c2e9b05a13
+Revises: f2a9c7d41b58
+Create Date: 2026-10-18 10:52:08.347519
+
+Every reader of these indexes loads full rows, so the included columns never
+gave an index-only scan and only made the indexes larger. CREATE INDEX
+CONCURRENTLY does not work on a partitioned table, so each index is rebuilt
+the documented way: an invalid parent index ON ONLY "transaction", one
+concurrent build per partition, each attached to the parent, which becomes
+valid once every partition is attached. The old index stays in use until the
+new one is complete; dropping it at the end takes a brief ACCESS EXCLUSIVE lock.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c2e9b05a13'
+down_revision: Union[str, Sequence[str], None] = 'f2a9c7d41b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS_SQL = sa.text(
+    """
+    SELECT child.relname FROM pg_inherits
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = 'transaction'
+    ORDER BY child.relname
+    """
+)
+
+# index name -> (key column, columns it used to INCLUDE)
+PARTY_INDEXES = {
+    'ix_transaction_sender_created_at': ('sender_id', ['amount', 'transaction_type', 'status', 'receiver_id']),
+    'ix_transaction_receiver_created_at': ('receiver_id', ['amount', 'transaction_type', 'status', 'sender_id']),
+}
+
+
+def _rebuild(name: str, column: str, include: list[str]) -> None:
+    include_sql = f" INCLUDE ({', '.join(include)})" if include else ""
+    partitions = [row[0] for row in op.get_bind().execute(PARTITIONS_SQL)]
+
+    op.execute(f'ALTER INDEX {name} RENAME TO {name}_old')
+    op.execute(f'CREATE INDEX {name} ON ONLY "transaction" ({column}, created_at DESC){include_sql}')
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            # e.g. transaction_y2026m10_sender_id_idx; well under the 63 character limit
+            partition_index = f'{partition}_{column}_idx'
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {partition_index}')
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY {partition_index} '
+                f'ON {partition} ({column}, created_at DESC){include_sql}'
+            )
+            op.execute(f'ALTER INDEX {name} ATTACH PARTITION {partition_index}')
+    op.execute(f'DROP INDEX {name}_old')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, (column, _) in PARTY_INDEXES.items():
+        _rebuild(name, column, [])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, (column, include) in PARTY_INDEXES.items():
+        _rebuild(name, column, include)